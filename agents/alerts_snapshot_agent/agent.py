@@ -1,143 +1,117 @@
-import os
-from dotenv import load_dotenv
+"""Alerts snapshot pipeline: retriever -> formatter.
 
-# Load environment variables from .env file
-load_dotenv()
+Both agents sit on the interactive chat path. The retriever stays on the
+default service tier, since Flex requests can be queued and would delay the
+user's first answer. The formatter produces the response the user is waiting
+on and runs on the Priority tier to keep its time-to-first-token low.
 
-from typing import List, Dict, Any, Optional
+Agent instructions are passed as static_instruction so the request prefix stays
+identical across invocations and Gemini's implicit prefix caching can reuse it.
+The instructions are too short (~500 tokens with tool declarations) to reach the
+1024-token minimum for an explicit context cache, so there is no App wrapper.
+"""
+import textwrap
+from typing import List
 from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
-from .tools.tools import get_nws_alerts, geocode_address, generate_map, get_zone_coordinates
-from .tools.logging_utils import log_agent_entry, log_agent_exit
+from google.genai import types
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from .tools.tools import get_nws_alerts, get_nws_alerts_multi, run_in_tool_executor
+from .tools.logging_utils import get_logger, log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE
 
+logger = get_logger(__name__)
+
+# These stay BaseModels: LlmAgent.output_schema only accepts BaseModel subclasses and
+# ADK validates the formatter output with a single model_validate_json call.
 class AlertDetail(BaseModel):
     """Individual weather alert details"""
+    model_config = ConfigDict(frozen=True)
+
     event: str = Field(description="Alert event type (e.g., Tornado Warning)")
     severity: str = Field(description="Alert severity level")
     headline: str = Field(description="Alert headline")
     description: str = Field(description="Full detailed alert description")
-    description_short: str = Field(description="Shortened description for card display (max 150 chars)")
     affected_zones: List[str] = Field(description="List of affected zones")
     start_time: str = Field(description="Alert start time")
     end_time: str = Field(description="Alert end time")
 
+    # Derived in Python rather than generated by the model: computed fields are left out
+    # of the response schema but still included when ADK dumps the validated output.
+    @computed_field
+    @property
+    def description_short(self) -> str:
+        """Shortened description for card display (max 150 chars)"""
+        return textwrap.shorten(self.description, width=150, placeholder="…")
+
 class AlertsSummary(BaseModel):
     """Final structured output for weather alerts analysis"""
+    model_config = ConfigDict(frozen=True)
+
     alerts: List[AlertDetail] = Field(description="List of active weather alerts")
     total_count: int = Field(description="Total number of alerts")
     severe_count: int = Field(description="Number of severe/extreme alerts")
     locations: List[str] = Field(description="List of affected locations")
     insights: str = Field(description="Summary and safety recommendations")
 
+# JSON schema for the formatter response, generated once at import. Left as the model
+# class, google-genai would rebuild and post-process the schema on every request.
+ALERTS_SUMMARY_JSON_SCHEMA = AlertsSummary.model_json_schema()
+
+def use_precomputed_schema(callback_context, llm_request):
+    """Sends the precomputed AlertsSummary schema instead of the model class."""
+    if llm_request.config.response_schema is AlertsSummary:
+        llm_request.config.response_schema = None
+        llm_request.config.response_json_schema = ALERTS_SUMMARY_JSON_SCHEMA
+
+# Formatter output budget. The response repeats each alert's text plus a short insights
+# section, so the cap follows the retrieved alerts (~3 chars per token) and only cuts off
+# runaway generations on large nationwide results.
+FORMATTER_BASE_OUTPUT_TOKENS = 500
+FORMATTER_OUTPUT_TOKENS_PER_ALERT = 150
+FORMATTER_MAX_OUTPUT_TOKENS = 32768
+
+def limit_formatter_output(callback_context, llm_request):
+    """Sets max_output_tokens for the formatter from the alerts saved by the retrieval tool."""
+    alerts = (callback_context.state.get("alerts") or {}).get("alerts", [])
+    alert_chars = sum(len(alert.get("headline") or "") + len(alert.get("description") or "") for alert in alerts)
+    budget = FORMATTER_BASE_OUTPUT_TOKENS + len(alerts) * FORMATTER_OUTPUT_TOKENS_PER_ALERT + alert_chars // 3
+    llm_request.config.max_output_tokens = min(budget, FORMATTER_MAX_OUTPUT_TOKENS)
+    logger.info("Formatter output budget: %d tokens for %d alerts", llm_request.config.max_output_tokens, len(alerts))
+
+
+RETRIEVER_INSTRUCTION = """
+    You are a weather alerts data retrieval specialist.
+    
+    Call ONE tool for the requested location and return its result for the next agent:
+    - Nationwide / all states → get_nws_alerts() with no parameters
+    - One state (name or code) → get_nws_alerts(state="California")
+    - Coordinates → get_nws_alerts(latitude=25.7617, longitude=-80.1918)
+    - Several states → get_nws_alerts_multi(states=["CA", "Texas", "FL"])
+    
+    Never pass severity. The tools convert state names to postal codes.
+    """
 
 # Phase 1: Retriever Agent - Fetches alert data
 retriever_agent = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="alerts_retriever",
     description="Retrieves active weather alerts for specified locations",
-    instruction="""
-    You are a weather alerts data retrieval specialist.
-    
-    **Your Task:**
-    Retrieve active weather alerts for the requested location using the get_nws_alerts tool.
-    
-    **Tool Usage Guidelines:**
-    
-    1. **For NATIONAL/ALL alerts** (e.g., "United States", "nationwide", "all states"):
-       - Call: get_nws_alerts() with NO parameters
-       - This retrieves ALL active alerts across the entire United States
-    
-    2. **For SPECIFIC STATE** (e.g., "California", "FL", "Texas"):
-       - Convert state name to 2-letter code if needed
-       - Call: get_nws_alerts(state="CA")
-       - Use standard postal codes: California→CA, Texas→TX, Florida→FL, etc.
-    
-    3. **For SPECIFIC COORDINATES** (if lat/lng provided):
-       - Call: get_nws_alerts(latitude=37.7749, longitude=-122.4194)
-    
-    4. **For MULTIPLE STATES** (e.g., "CA,TX,FL"):
-       - Make separate calls for each state
-       - Combine results before passing to formatter
-    
-    **Important:**
-    - DO NOT pass state parameter for national queries
-    - DO NOT filter by severity - get ALL alerts
-    - The tool automatically handles the NWS API endpoints
-    
-    **Examples:**
-    - "Get alerts for United States" → get_nws_alerts()
-    - "Get alerts for California" → get_nws_alerts(state="CA")  
-    - "Get alerts for Miami coordinates" → get_nws_alerts(latitude=25.7617, longitude=-80.1918)
-    
-    Store the collected alert data in your response for the next agent.
-    """,
-    tools=[get_nws_alerts],
+    static_instruction=types.Content(role="user", parts=[types.Part(text=RETRIEVER_INSTRUCTION)]),
+    tools=[run_in_tool_executor(get_nws_alerts), get_nws_alerts_multi],
     output_key="alerts_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
 
-# Phase 2: Deduplication Agent - Removes similar/duplicate alerts
-deduplication_agent = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="alerts_deduplicator",
-    description="Intelligently removes duplicate and similar alerts",
-    instruction="""
-    You are an expert at identifying and removing duplicate or highly similar weather alerts.
-    
-    **Your Task:**
-    Analyze state["alerts_data"] and remove duplicates/similar alerts, keeping only the most informative unique alerts.
-    
-    **Deduplication Strategy:**
-    
-    1. **Exact Duplicates** - Remove if ALL match:
-       - Same event type
-       - Same severity
-       - Same headline
-       - Same start time
-       
-    2. **Similar Alerts** - Remove if these match:
-       - Same event type (e.g., "Flood Warning")
-       - Same severity level
-       - Same general area (e.g., both for "St Johns River")
-       - Start times within 5 minutes of each other
-       - Keep the alert with MORE detailed description
-       
-    3. **Geographic Overlap** - For alerts in the same river/area:
-       - "St Johns River near Astor" vs "St Johns River near Above Lake Harney"
-       - These are SIMILAR - keep only ONE with the most comprehensive information
-       - Combine affected zones if needed
-    
-    **Rules:**
-    - When choosing between similar alerts, prefer:
-      1. The one with more detailed description
-      2. The one with more affected zones
-      3. The earlier issued alert (if descriptions are similar)
-    - Log how many duplicates you removed
-    - Return the deduplicated alerts in the same format as input
-    
-    **Output:**
-    Return the cleaned alert data with duplicates removed. Pass this to the next agent.
-    """,
-    output_key="deduplicated_alerts",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-)
-
-# Phase 3: Formatter Agent - Structures and analyzes alerts
-alerts_formatter = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="alerts_formatter",
-    description="Formats alert data into structured summary",
-    instruction="""
+FORMATTER_INSTRUCTION = """
     You are a weather alert presentation specialist.
     
     **Your Task:**
-    Format the alert data from state["deduplicated_alerts"] into a structured, user-friendly summary.
+    Format the alert data from state["alerts_data"] into a structured, user-friendly summary.
     
     **Process:**
-    1. Extract alerts from state["deduplicated_alerts"] (already deduplicated)
+    1. Extract alerts from state["alerts_data"] (already deduplicated by the retrieval tool)
     2. Count total alerts and severe alerts
     3. Identify affected locations
     4. For each alert, extract:
@@ -145,7 +119,6 @@ alerts_formatter = LlmAgent(
        - Severity level
        - Headline
        - Description - Full detailed alert description (preserve all important information)
-       - Description_short - Concise summary for card display (max 150 characters, focus on key hazards and impacts)
        - Affected zones - **CRITICAL**: Preserve the EXACT zone URLs from the raw data (e.g., "https://api.weather.gov/zones/county/ORC011")
          DO NOT convert these to county names. The frontend needs the full URLs for map generation.
        - Start and end times
@@ -155,19 +128,30 @@ alerts_formatter = LlmAgent(
     - You must return a structured JSON response that matches the AlertsSummary schema exactly
     
     **CRITICAL**: Return structured JSON matching AlertsSummary schema exactly.
-    """,
+    """
+
+# Phase 2: Formatter Agent - Structures and analyzes alerts
+# Output is not streamed per alert: ADK validates output_schema only on the final
+# response and AgentTool forwards only that final result to the orchestrator.
+alerts_formatter = LlmAgent(
+    model=GEMINI_FLASH_LITE,
+    name="alerts_formatter",
+    description="Formats alert data into structured summary",
+    static_instruction=types.Content(role="user", parts=[types.Part(text=FORMATTER_INSTRUCTION)]),
     output_schema=AlertsSummary,
-    before_model_callback=log_agent_entry,
+    generate_content_config=types.GenerateContentConfig(service_tier=types.ServiceTier.PRIORITY),
+    before_model_callback=[log_agent_entry, use_precomputed_schema, limit_formatter_output],
     after_model_callback=log_agent_exit,
 )
 
-# Sequential Pipeline: Retriever → Deduplicator → Formatter
+# Sequential Pipeline: Retriever → Formatter
+# The formatter needs the retrieved alerts, and deduplication runs inside the retrieval
+# tool, so there is no intermediate step to overlap the formatter with.
 alerts_snapshot_workflow = SequentialAgent(
     name="alerts_snapshot_pipeline",
     description="Retrieves weather alerts, removes duplicates, and generates a structured analysis with safety insights.",
     sub_agents=[
         retriever_agent,
-        deduplication_agent,
         alerts_formatter,
     ],
 )
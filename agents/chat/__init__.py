@@ -1,3 +1,3 @@
 """The chat agent package."""
 
-from .agent import root_agent
+from .agent import root_agent, app
@@ -1,274 +1,136 @@
 from google.adk.agents import LlmAgent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
+from google.adk.models import LlmResponse
 from google.adk.tools.agent_tool import AgentTool
-from .tools.logging_utils import log_agent_entry, log_agent_exit
+from google.genai import types
+from .tools.logging_utils import get_logger, log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE
 
-# Import remote A2A agent wrappers (deployed agents)
-from .remote_weather_agents import (
-    alerts_agent_remote,
-    forecast_agent_remote,
-    risk_analysis_agent_remote,
-    emergency_resources_agent_remote,
-    hurricane_agent_remote,
-)
-
-# Import the local workflow agents (fallback/development)
-from .sub_agents.alerts_snapshot_agent.agent import alerts_snapshot_workflow
-from .sub_agents.forecast_agent.agent import forecast_workflow
-from .sub_agents.risk_analysis_agent.agent import risk_analysis_workflow
-from .sub_agents.emergency_resources_agent.agent import emergency_resources_workflow
-from .sub_agents.hurricane_simulation_agent.agent import hurricane_analysis_workflow
+# Agents used in both modes; the remote/local workflow agents are imported below
+# for the selected mode only, so each pipeline is built once per process
 from .sub_agents.google_search_agent.agent import GoogleSearchAgent
 from .sub_agents.weather_map_agent.agent import weather_map_agent
 
-import logging
 import os
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+import re
+
+logger = get_logger(__name__)
+
+# Keyword routing: clear-intent queries skip the LLM routing call entirely (don't
+# default to an LLM for a keyword lookup). Each pattern maps to one agent, filled in
+# per mode below; zero or multiple hits fall back to the LLM routing instructions.
+ROUTING_PATTERNS = {
+    "alerts": re.compile(r"\b(alerts?|warnings?|watch(es)?)\b", re.IGNORECASE),
+    "forecast": re.compile(r"\b(forecast|weather|temperature|conditions|rain|snow|7-day)\b", re.IGNORECASE),
+    "risk": re.compile(r"\b(risks?|danger|safety|threats?|vulnerable)\b", re.IGNORECASE),
+    "emergency_resources": re.compile(r"\b(shelters?|hospitals?|evacuation routes?)\b", re.IGNORECASE),
+    "hurricane": re.compile(r"\b(hurricanes?|satellite|evacuation priority)\b", re.IGNORECASE),
+    "map": re.compile(r"\b(maps?|visuali[sz]e|plot)\b", re.IGNORECASE),
+}
+# Follow-ups and multi-step requests depend on conversation context, so the LLM routes them
+ROUTING_SKIP_PATTERN = re.compile(
+    r"\b(these|those|this|that|them|it|each|previous|above|and|then|also)\b", re.IGNORECASE
 )
-logger = logging.getLogger(__name__)
-
-# Callback functions for agent lifecycle logging
-def log_agent_entry(callback_context, llm_request):
-    """Logs when an agent is about to be executed."""
-    logger.info("="*80)
-    logger.info(f"🔄 AGENT ENTRY / TRANSFER: {callback_context.agent_name}")
-    logger.info("="*80)
+KEYWORD_ROUTES = {}
+
+def route_by_keywords(callback_context, llm_request):
+    """Answers the routing step with a direct tool call when exactly one agent matches."""
+    if not llm_request.contents:
+        return None
+    last_content = llm_request.contents[-1]
+    # Only route fresh text messages, never tool responses or image uploads
+    if last_content.role != "user" or not last_content.parts or any(not part.text for part in last_content.parts):
+        return None
+    
+    query = " ".join(part.text for part in last_content.parts).strip()
+    if not query or ROUTING_SKIP_PATTERN.search(query):
+        return None
+    
+    matches = [agent_name for category, agent_name in KEYWORD_ROUTES.items() if ROUTING_PATTERNS[category].search(query)]
+    if len(matches) != 1:
+        return None
+    
+    logger.info("🧭 Keyword route: %s (LLM routing skipped)", matches[0])
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[types.Part(function_call=types.FunctionCall(name=matches[0], args={"request": query}))],
+        )
+    )
 
-def log_agent_exit(callback_context, llm_response):
-    """Logs when an agent has finished execution."""
-    logger.info("="*80)
-    logger.info(f"✅ AGENT EXIT: {callback_context.agent_name}")
-    # Optionally log the type of response (e.g., function call)
-    if llm_response.content and llm_response.content.parts:
-        for part in llm_response.content.parts:
-            if part.function_call:
-                logger.info(f"   ↪️ Suggested Action: Call tool '{part.function_call.name}'")
-    logger.info("="*80)
+def load_orchestrator_instruction(**placeholders):
+    """Reads the orchestrator instruction template shared by both modes and fills in this mode's agent names."""
+    with open(os.path.join(os.path.dirname(__file__), "orchestrator_instruction.txt")) as f:
+        return f.read().format(**placeholders)
 
 # Determine which agents to use based on environment variable
 USE_REMOTE_AGENTS = os.getenv("USE_REMOTE_AGENTS", "true").lower() == "true"
 
 if USE_REMOTE_AGENTS:
     logger.info("🌐 Using REMOTE A2A agents for weather queries")
-    # Chat Orchestrator - Routes to remote A2A agents
-    chat_orchestrator = LlmAgent(
-        model="gemini-2.5-flash-lite",
-        name="chat_orchestrator",
-        instruction="""
-        You are an intelligent weather assistant orchestrator using A2A protocol.
-        
-        **YOUR ROLE:**
-        Route user queries to the appropriate remote weather agent based on the topic.
-        
-        **CONTEXT AWARENESS:**
-        - **CRITICAL:** You MUST maintain context from previous messages in the conversation.
-        - When the user refers to "these alerts", "this event", "each one", or similar references, they are referring to data from previous responses.
-        - Store and reference information from previous agent calls in the conversation history.
-        - For follow-up queries, use the context from earlier in the conversation rather than making redundant API calls.
-        
-        **ROUTING LOGIC:**
-        Analyze the user's query and delegate to the appropriate agent:
-        
-        - **Alerts/Warnings/Watches** → weather_alerts_snapshot_agent
-          Keywords: alert, warning, watch, severe, emergency alert, active alerts
-          Example: "What alerts are active in California?"
-        
-        - **Forecasts/Weather/Temperature** → weather_forecast_agent
-          Keywords: forecast, weather, temperature, conditions, rain, snow, 7-day
-          Example: "What's the weather forecast for San Francisco?"
-        
-        - **Risk/Danger/Safety Analysis** → weather_risk_analysis_agent
-          Keywords: risk, danger, safety, threat, vulnerable, impact, population at risk
-          Example: "Analyze the risk of the tornado warning in Oklahoma"
-        
-        - **Shelters/Hospitals/Evacuation Routes** → weather_emergency_resources_agent
-          Keywords: shelter, hospital, evacuation route, emergency facility, find resources
-          Example: "Find shelters near Miami"
-        
-        - **Hurricane Analysis/Image Processing** → weather_hurricane_simulation_agent
-          Keywords: hurricane, image, analyze, satellite, storm, evacuation priority, hurricane category
-          Example: "Analyze this hurricane satellite image" or "What's the evacuation priority for this storm?"
-
-        - **General Knowledge/Web Search** → google_search_agent
-          Keywords: who is, what is, when did, explain, search for
-          Example: "Who is the current CEO of Google?" or "What is the capital of Mongolia?"
-
-        - **Map Generation/Visualization** → weather_map_agent
-          Keywords: map, draw, visualize, plot, show on map
-          Example: "Draw a map of the affected zones" or "Show me these alerts on a map"
-        
-        **MULTI-STEP TASK EXECUTION:**
-        - For complex queries, you must break down the task and call tools in a logical sequence. Synthesize the results into one final answer.
-
-        **Example 1: Alerts + Risk Analysis**
-        - **Query:** "Analyze the risks for active alerts in Florida."
-        - **Step 1:** Call `weather_alerts_snapshot_agent` for "Florida" to get active alerts.
-        - **Step 2:** Take the resulting alert information and pass it to `weather_risk_analysis_agent`.
-        - **Step 3:** Synthesize the alert details and the risk analysis into a comprehensive summary.
-
-        **Example 2: Alerts + Map**
-        - **Query:** "Show me the alerts in Texas on a map."
-        - **Step 1:** Call `weather_alerts_snapshot_agent` for "Texas" to get alert details and affected zones.
-        - **Step 2:** Extract the `affected_zones` from the result and pass them to `weather_map_agent`.
-        - **Step 3:** Combine the text-based alert summary and the generated map into the final response.
-
-        **Example 3: General Knowledge + Alerts**
-        - **Query:** "What is a 'derecho' and are there any active warnings for them?"
-        - **Step 1:** Call `google_search_agent` to get the definition of "derecho".
-        - **Step 2:** Call `weather_alerts_snapshot_agent` with a query like "active derecho warnings" to find relevant alerts.
-        - **Step 3:** Present the definition first, followed by any active warnings found.
-
-        **Example 4: Follow-up Risk Analysis (CONTEXT-AWARE)**
-        - **Query 1:** "Show me all active alerts"
-        - **Response:** [List of 17 alerts with details]
-        - **Query 2:** "Provide a comprehensive risk analysis of each one of these alerts"
-        - **CORRECT APPROACH:** 
-          - Recognize "each one of these alerts" refers to the 17 alerts from the previous response
-          - Extract the alert details from conversation history
-          - For EACH alert, call `weather_risk_analysis_agent` with that specific alert's information
-          - Compile all risk analyses into a comprehensive response
-        - **WRONG APPROACH:** 
-          - DO NOT say "there are no active alerts" - the alerts were just shown in the previous message!
-          - DO NOT ignore the conversation context
-
-        **IMPORTANT:**
-        - If a query is simple, delegate to a single agent.
-        - If a query is complex, orchestrate a sequence of agent calls.
-        - **ALWAYS check conversation history for context before responding.**
-        - For follow-up queries referencing previous data, extract that data from history and process it.
-        - Always synthesize the final results into a user-friendly format.
-
-        **OUTPUT FORMATTING:**
-        - **Always** use Markdown for formatting.
-        - Use **bold text** for headings and key terms (e.g., **Location:**, **Current Temperature:**).
-        - Use bullet points (`-`) for lists (e.g., forecast details, alert summaries).
-        - Present the final output from the delegated agent in a clean, well-structured, and conversational format.
-        """,
-        tools=[
-            AgentTool(alerts_agent_remote),
-            AgentTool(forecast_agent_remote),
-            AgentTool(risk_analysis_agent_remote),
-            AgentTool(emergency_resources_agent_remote),
-            AgentTool(hurricane_agent_remote),
-            AgentTool(GoogleSearchAgent),
-            AgentTool(weather_map_agent),
-        ],
-        before_model_callback=log_agent_entry,
-        after_model_callback=log_agent_exit,
-        output_key="final_response",
-    )
+    # Import remote A2A agent wrappers (deployed agents), keyed by routing category
+    from .remote_weather_agents import REMOTE_AGENTS
+    
+    WORKFLOW_AGENTS = dict(REMOTE_AGENTS)
+    INSTRUCTION_PLACEHOLDERS = {
+        "protocol": " using A2A protocol",
+        "unit_description": "remote weather agent",
+        "unit": "agent",
+    }
 else:
     logger.info("🏠 Using LOCAL sub-agents for weather queries")
-    # Chat Orchestrator - Routes to local workflow agents
-    chat_orchestrator = LlmAgent(
-        model="gemini-2.5-flash-lite",
-        name="chat_orchestrator",
-        instruction="""
-        You are an intelligent weather assistant orchestrator.
-        
-        **YOUR ROLE:**
-        Route user queries to the appropriate workflow agent based on the topic.
-        
-        **CONTEXT AWARENESS:**
-        - **CRITICAL:** You MUST maintain context from previous messages in the conversation.
-        - When the user refers to "these alerts", "this event", "each one", or similar references, they are referring to data from previous responses.
-        - Store and reference information from previous agent calls in the conversation history.
-        - For follow-up queries, use the context from earlier in the conversation rather than making redundant API calls.
-        
-        **ROUTING LOGIC:**
-        Analyze the user's query and use the appropriate tool:
-        
-        - **Alerts/Warnings/Watches** → alerts_snapshot_pipeline
-          Keywords: alert, warning, watch, severe, emergency alert, active alerts
-          Example: "What alerts are active in California?"
-        
-        - **Forecasts/Weather/Temperature** → forecast_pipeline
-          Keywords: forecast, weather, temperature, conditions, rain, snow, 7-day
-          Example: "What's the weather forecast for San Francisco?"
-        
-        - **Risk/Danger/Safety Analysis** → risk_analysis_pipeline
-          Keywords: risk, danger, safety, threat, vulnerable, impact, population at risk
-          Example: "Analyze the risk of the tornado warning in Oklahoma"
-        
-        - **Shelters/Hospitals/Evacuation Routes** → emergency_resources_pipeline
-          Keywords: shelter, hospital, evacuation route, emergency facility, find resources
-          Example: "Find shelters near Miami"
-        
-        - **Hurricane Analysis/Image Processing** → hurricane_simulation_pipeline
-          Keywords: hurricane, image, analyze, satellite, storm, evacuation priority, hurricane category
-          Example: "Analyze this hurricane satellite image" or "What's the evacuation priority for this storm?"
-
-        - **General Knowledge/Web Search** → google_search_agent
-          Keywords: who is, what is, when did, explain, search for
-          Example: "Who is the current CEO of Google?" or "What is the capital of Mongolia?"
-
-        - **Map Generation/Visualization** → weather_map_agent
-          Keywords: map, draw, visualize, plot, show on map
-          Example: "Draw a map of the affected zones" or "Show me these alerts on a map"
-        
-        **MULTI-STEP TASK EXECUTION:**
-        - For complex queries, you must break down the task and call tools in a logical sequence. Synthesize the results into one final answer.
-
-        **Example 1: Alerts + Risk Analysis**
-        - **Query:** "Analyze the risks for active alerts in Florida."
-        - **Step 1:** Call `alerts_snapshot_pipeline` for "Florida" to get active alerts.
-        - **Step 2:** Take the resulting alert information and pass it to `risk_analysis_pipeline`.
-        - **Step 3:** Synthesize the alert details and the risk analysis into a comprehensive summary.
-
-        **Example 2: Alerts + Map**
-        - **Query:** "Show me the alerts in Texas on a map."
-        - **Step 1:** Call `alerts_snapshot_pipeline` for "Texas" to get alert details and affected zones.
-        - **Step 2:** Extract the `affected_zones` from the result and pass them to `weather_map_agent`.
-        - **Step 3:** Combine the text-based alert summary and the generated map into the final response.
-
-        **Example 3: General Knowledge + Alerts**
-        - **Query:** "What is a 'derecho' and are there any active warnings for them?"
-        - **Step 1:** Call `google_search_agent` to get the definition of "derecho".
-        - **Step 2:** Call `alerts_snapshot_pipeline` with a query like "active derecho warnings" to find relevant alerts.
-        - **Step 3:** Present the definition first, followed by any active warnings found.
-
-        **Example 4: Follow-up Risk Analysis (CONTEXT-AWARE)**
-        - **Query 1:** "Show me all active alerts"
-        - **Response:** [List of 17 alerts with details]
-        - **Query 2:** "Provide a comprehensive risk analysis of each one of these alerts"
-        - **CORRECT APPROACH:** 
-          - Recognize "each one of these alerts" refers to the 17 alerts from the previous response
-          - Extract the alert details from conversation history
-          - For EACH alert, call `risk_analysis_pipeline` with that specific alert's information
-          - Compile all risk analyses into a comprehensive response
-        - **WRONG APPROACH:** 
-          - DO NOT say "there are no active alerts" - the alerts were just shown in the previous message!
-          - DO NOT ignore the conversation context
-
-        **IMPORTANT:**
-        - If a query is simple, delegate to a single workflow.
-        - If a query is complex, orchestrate a sequence of workflow calls.
-        - **ALWAYS check conversation history for context before responding.**
-        - For follow-up queries referencing previous data, extract that data from history and process it.
-        - Always synthesize the final results into a user-friendly format.
-
-        **OUTPUT FORMATTING:**
-        - **Always** use Markdown for formatting.
-        - Use **bold text** for headings and key terms (e.g., **Location:**, **Current Temperature:**).
-        - Use bullet points (`-`) for lists (e.g., forecast details, alert summaries).
-        - Present the final output from the delegated agent in a clean, well-structured, and conversational format.
-        """,
-        tools=[
-            AgentTool(alerts_snapshot_workflow),
-            AgentTool(forecast_workflow),
-            AgentTool(risk_analysis_workflow),
-            AgentTool(emergency_resources_workflow),
-            AgentTool(hurricane_analysis_workflow),
-            AgentTool(GoogleSearchAgent),
-            AgentTool(weather_map_agent),
-        ],
-        before_model_callback=log_agent_entry,
-        after_model_callback=log_agent_exit,
-        output_key="final_response",
-    )
+    # Import the local workflow agents (fallback/development)
+    from .sub_agents.alerts_snapshot_agent.agent import alerts_snapshot_workflow
+    from .sub_agents.forecast_agent.agent import forecast_workflow
+    from .sub_agents.risk_analysis_agent.agent import risk_analysis_workflow
+    from .sub_agents.emergency_resources_agent.agent import emergency_resources_workflow
+    from .sub_agents.hurricane_simulation_agent.agent import hurricane_analysis_workflow
+    
+    WORKFLOW_AGENTS = {
+        "alerts": alerts_snapshot_workflow,
+        "forecast": forecast_workflow,
+        "risk": risk_analysis_workflow,
+        "emergency_resources": emergency_resources_workflow,
+        "hurricane": hurricane_analysis_workflow,
+    }
+    INSTRUCTION_PLACEHOLDERS = {
+        "protocol": "",
+        "unit_description": "workflow agent",
+        "unit": "workflow",
+    }
+
+KEYWORD_ROUTES.update({category: agent.name for category, agent in WORKFLOW_AGENTS.items()})
+KEYWORD_ROUTES["map"] = weather_map_agent.name
+
+# Chat Orchestrator - Routes to the selected workflow agents
+chat_orchestrator = LlmAgent(
+    model=GEMINI_FLASH_LITE,
+    name="chat_orchestrator",
+    static_instruction=types.Content(role="user", parts=[types.Part(text=load_orchestrator_instruction(
+        **INSTRUCTION_PLACEHOLDERS,
+        **KEYWORD_ROUTES,
+    ))]),
+    # AgentTool has no asynchronous/background mode; slow legs overlap because all
+    # function calls returned in one model response are executed concurrently
+    tools=[AgentTool(agent) for agent in [*WORKFLOW_AGENTS.values(), GoogleSearchAgent, weather_map_agent]],
+    before_model_callback=[log_agent_entry, route_by_keywords],
+    after_model_callback=log_agent_exit,
+    output_key="final_response",
+)
 
 # ADK export pattern
 root_agent = chat_orchestrator
+
+# App wrapper enables Gemini context caching for the static orchestrator instructions.
+# The instruction plus tool declarations measure ~1.8k tokens, so every orchestrator
+# request clears Gemini's 1024-token minimum for an explicit cache.
+app = App(
+    name="chat",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        cache_intervals=10,
+        ttl_seconds=3600,
+        min_tokens=1024,
+    ),
+)
@@ -2,45 +2,125 @@
 Remote Weather Agent Wrappers using A2A Protocol
 
 Simple wrappers for deployed weather agents using RemoteA2aAgent.
-Agent cards are hosted on GitHub for easy access and version control.
+Agent cards are hosted on GitHub for easy access and version control, and cached
+on disk so restarts do not re-download them.
 """
 
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import requests
+from a2a.types import AgentCard
 from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
 
-# Base URL for agent cards on GitHub
-AGENT_CARDS_BASE_URL = "https://github.com/cvsubs74/weather_insights_and_forecast_advisor/tree/main/agent-cards"
+logger = logging.getLogger(__name__)
 
-# Weather Alerts Snapshot Agent
-alerts_agent_remote = RemoteA2aAgent(
-    name="weather_alerts_snapshot_agent",
-    description="Retrieves and analyzes the top 5 most severe active weather alerts across the United States",
-    agent_card=f"{AGENT_CARDS_BASE_URL}/weather-alerts-snapshot-agent-card.json",
-)
+# Base URL for agent cards on GitHub (raw file content, not the HTML tree view)
+AGENT_CARDS_BASE_URL = "https://raw.githubusercontent.com/cvsubs74/weather_insights_and_forecast_advisor/main/agent-cards"
 
-# Weather Forecast Agent
-forecast_agent_remote = RemoteA2aAgent(
-    name="weather_forecast_agent",
-    description="Provides detailed 7-day weather forecasts and 48-hour hourly predictions for any location",
-    agent_card=f"{AGENT_CARDS_BASE_URL}/weather-forecast-agent-card.json",
+# Local agent card cache; cards younger than the TTL are used without any network I/O
+AGENT_CARDS_CACHE_DIR = os.getenv(
+    "AGENT_CARDS_CACHE_DIR", os.path.join(os.path.dirname(__file__), "agent-cards-cache")
 )
+AGENT_CARDS_CACHE_TTL = int(os.getenv("AGENT_CARDS_CACHE_TTL", "86400"))
 
-# Weather Risk Analysis Agent
-risk_analysis_agent_remote = RemoteA2aAgent(
-    name="weather_risk_analysis_agent",
-    description="Analyzes weather alerts to identify vulnerable populations and high-risk areas using census demographics and historical flood data",
-    agent_card=f"{AGENT_CARDS_BASE_URL}/weather-risk-analysis-agent-card.json",
-)
 
-# Weather Emergency Resources Agent
-emergency_resources_agent_remote = RemoteA2aAgent(
-    name="weather_emergency_resources_agent",
-    description="Helps users find nearby emergency resources including shelters, hospitals, and pharmacies with route planning",
-    agent_card=f"{AGENT_CARDS_BASE_URL}/weather-emergency-resources-agent-card.json",
-)
+def _agent_card(card_file: str) -> AgentCard | str:
+    """Returns the parsed agent card from the local cache, falling back to its URL.
+    
+    Stale cache entries are revalidated with a conditional GET (If-None-Match), so an
+    unchanged card costs a 304 instead of a full download. Cached cards are parsed
+    here with orjson, so RemoteA2aAgent does not re-read and re-parse the file.
+    """
+    url = f"{AGENT_CARDS_BASE_URL}/{card_file}"
+    cache_path = os.path.join(AGENT_CARDS_CACHE_DIR, card_file)
+    etag_path = f"{cache_path}.etag"
+    
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < AGENT_CARDS_CACHE_TTL:
+        return _load_cached_card(cache_path) or url
+    
+    headers = {}
+    if os.path.exists(cache_path) and os.path.exists(etag_path):
+        with open(etag_path) as f:
+            headers["If-None-Match"] = f.read().strip()
+    
+    try:
+        response = requests.get(url, headers=headers, timeout=5)
+        if response.status_code == 304:
+            os.utime(cache_path)
+        else:
+            response.raise_for_status()
+            AgentCard.model_validate(orjson.loads(response.content))  # Only cache valid cards
+            os.makedirs(AGENT_CARDS_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(response.content)
+            if response.headers.get("ETag"):
+                with open(etag_path, "w") as f:
+                    f.write(response.headers["ETag"])
+    except (requests.RequestException, ValueError, OSError) as e:
+        logger.warning(f"Could not cache agent card {card_file}: {str(e)}")
+    
+    return _load_cached_card(cache_path) or url
 
-# Weather Hurricane Simulation Agent
-hurricane_agent_remote = RemoteA2aAgent(
-    name="weather_hurricane_simulation_agent",
-    description="Analyzes hurricane satellite images and generates evacuation priorities for high-risk locations",
-    agent_card=f"{AGENT_CARDS_BASE_URL}/weather-hurricane-simulation-agent-card.json",
-)
+
+def _load_cached_card(cache_path: str) -> AgentCard | None:
+    """Parses a cached agent card, or returns None if it is missing or invalid."""
+    try:
+        with open(cache_path, "rb") as f:
+            return AgentCard.model_validate(orjson.loads(f.read()))
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError) as e:
+        logger.warning(f"Ignoring invalid cached agent card {cache_path}: {str(e)}")
+        return None
+
+# Remote agents by routing category: (agent name, description, agent card file)
+REMOTE_AGENT_SPECS = {
+    "alerts": (
+        "weather_alerts_snapshot_agent",
+        "Retrieves and analyzes the top 5 most severe active weather alerts across the United States",
+        "weather-alerts-snapshot-agent-card.json",
+    ),
+    "forecast": (
+        "weather_forecast_agent",
+        "Provides detailed 7-day weather forecasts and 48-hour hourly predictions for any location",
+        "weather-forecast-agent-card.json",
+    ),
+    "risk": (
+        "weather_risk_analysis_agent",
+        "Analyzes weather alerts to identify vulnerable populations and high-risk areas using census demographics and historical flood data",
+        "weather-risk-analysis-agent-card.json",
+    ),
+    "emergency_resources": (
+        "weather_emergency_resources_agent",
+        "Helps users find nearby emergency resources including shelters, hospitals, and pharmacies with route planning",
+        "weather-emergency-resources-agent-card.json",
+    ),
+    "hurricane": (
+        "weather_hurricane_simulation_agent",
+        "Analyzes hurricane satellite images and generates evacuation priorities for high-risk locations",
+        "weather-hurricane-simulation-agent-card.json",
+    ),
+}
+
+# Refresh all stale cards at once so import pays at most one round trip, not one per agent.
+# Threads rather than asyncio.run, which would fail if this is imported inside a running loop.
+with ThreadPoolExecutor(max_workers=len(REMOTE_AGENT_SPECS)) as _pool:
+    _agent_cards = dict(zip(
+        REMOTE_AGENT_SPECS,
+        _pool.map(_agent_card, [card_file for _, _, card_file in REMOTE_AGENT_SPECS.values()]),
+    ))
+
+REMOTE_AGENTS = {
+    category: RemoteA2aAgent(name=name, description=description, agent_card=_agent_cards[category])
+    for category, (name, description, _) in REMOTE_AGENT_SPECS.items()
+}
+
+alerts_agent_remote = REMOTE_AGENTS["alerts"]
+forecast_agent_remote = REMOTE_AGENTS["forecast"]
+risk_analysis_agent_remote = REMOTE_AGENTS["risk"]
+emergency_resources_agent_remote = REMOTE_AGENTS["emergency_resources"]
+hurricane_agent_remote = REMOTE_AGENTS["hurricane"]
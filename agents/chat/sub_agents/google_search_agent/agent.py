@@ -1,10 +1,11 @@
 from google.adk.agents import LlmAgent
 from google.adk.tools import google_search
+from ...tools.models import GEMINI_FLASH_LITE
 
 # Define the Google Search Agent
 GoogleSearchAgent = LlmAgent(
     name="google_search_agent",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Provides answers to general knowledge questions by searching the web. Use this for topics not covered by other specialized agents, such as current events, facts, or general information.",
     instruction="""You are a helpful research assistant. Your role is to answer the user's query by performing a Google search and summarizing the results. 
 
@@ -1,21 +1,59 @@
-import os
-
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
+import hashlib
 import json
-import logging
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from google.adk.agents import LlmAgent, SequentialAgent
-from ...tools.logging_utils import log_agent_entry, log_agent_exit
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from ...tools.logging_utils import get_logger, log_agent_entry, log_agent_exit
+from ...tools.models import GEMINI_FLASH_LITE
 from google.adk.tools import google_search
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Alerts from the same storm trigger identical searches; reuse recent research
+RESEARCH_CACHE_TTL = 10 * 60
+RESEARCH_CACHE_MAXSIZE = 256
+_research_cache: Dict[str, tuple] = {}
+
+
+def _research_cache_key(callback_context: CallbackContext) -> Optional[str]:
+    """Hash the alert text in the user's message, or None if there is none."""
+    content = callback_context.user_content
+    if not content or not content.parts:
+        return None
+    text = "".join(part.text or "" for part in content.parts).strip()
+    if not text:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def use_cached_research(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Skip the search phase when the same alert was researched recently."""
+    key = _research_cache_key(callback_context)
+    entry = _research_cache.get(key) if key else None
+    if not entry:
+        return None
+    findings, timestamp = entry
+    if time.time() - timestamp > RESEARCH_CACHE_TTL:
+        _research_cache.pop(key, None)
+        return None
+    logger.info("Research cache hit for alert %s", key[:12])
+    callback_context.state["research_findings"] = findings
+    return types.Content(role="model", parts=[types.Part(text=findings)])
+
+
+def cache_research(callback_context: CallbackContext) -> None:
+    """Store the search findings for reuse by identical alerts."""
+    key = _research_cache_key(callback_context)
+    findings = callback_context.state.get("research_findings")
+    if not key or not findings:
+        return None
+    if len(_research_cache) >= RESEARCH_CACHE_MAXSIZE:
+        _research_cache.pop(next(iter(_research_cache)))
+    _research_cache[key] = (findings, time.time())
+    return None
 
 class RiskAnalysisSummary(BaseModel):
     """Provides a comprehensive, real-time search-grounded risk analysis for a weather alert."""
@@ -31,41 +69,21 @@ class RiskAnalysisSummary(BaseModel):
 
 # --- Agent Definitions ---
 
-# Phase 1: Alert Parser
-# This agent ensures the input is clean and structured for the next phases.
-# Phase 1: Alert Parser
-alert_parser = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="alert_parser",
-    description="Parses a single weather alert to extract key information for risk analysis",
-    instruction="""
-    You are a data extraction specialist.
-    Your input is a single weather alert object.
-
-    **Your Task:**
-    1.  **Parse the Input**: The user's input is a JSON object or text representing a single weather alert.
-    2.  **Extract Key Fields**: From the input, extract the following critical pieces of information:
-        *   The type of alert (e.g., "Tornado Warning").
-        *   The severity level (e.g., "Severe").
-        *   Affected Zones and areas.
-        *   The full alert text for context.
-    3.  **Store for Next Agent**: Store these extracted fields in a structured way for the `census_data_retriever`.
-    """,
-    output_key="parsed_alert",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-)
-
-# Phase 2: Risk Researcher 
-# This agent uses the google_search tool to gather comprehensive real-time information.
+# Phase 1: Risk Researcher
+# This agent reads the alert directly (no separate parsing turn) and uses the google_search
+# tool to gather comprehensive real-time information. google_search runs as Gemini search
+# grounding, so all queries issued in one response are executed server-side in that call.
 risk_researcher = LlmAgent(
     name="risk_researcher",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Conducts comprehensive real-time research on weather alert impacts, hazards, and emergency response.",
     tools=[google_search],
     instruction="""
     You are a comprehensive risk intelligence analyst. Your goal is to conduct thorough real-time research on a weather alert to understand its full impact and risks.
     
+    **Your Input:**
+    A single weather alert, as a JSON object or text. Identify the alert type (e.g., "Tornado Warning"), severity, affected zones and areas, and use the full alert text for context.
+
     **Your Mission:**
     Based on the alert information provided, perform MULTIPLE targeted Google searches to gather comprehensive, real-time information across these critical categories:
 
@@ -114,7 +132,7 @@ risk_researcher = LlmAgent(
         - Most severely affected locations
 
     **SEARCH STRATEGY:**
-    - Perform AT LEAST 5-7 targeted searches covering the categories above
+    - Perform AT LEAST 5-7 targeted searches covering the categories above, issuing all of them together in your FIRST response rather than one at a time
     - Focus on RECENT results (today, last 24 hours) for real-time information
     - Prioritize official sources (NWS, FEMA, local government, news outlets)
     - Look for specific numbers, locations, and concrete details
@@ -124,21 +142,23 @@ risk_researcher = LlmAgent(
     Document all findings with specific details, numbers, locations, and source URLs. Be thorough and comprehensive - this research will form the basis of the final risk analysis.
     """,
     output_key="research_findings",
+    before_agent_callback=use_cached_research,
+    after_agent_callback=cache_research,
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
-# Phase 3: Risk Synthesizer
+# Phase 2: Risk Synthesizer
 # This agent synthesizes the alert data and search findings into a comprehensive final summary.
 risk_synthesizer = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="risk_synthesizer",
     description="Synthesizes alert data and comprehensive search results into a detailed risk analysis summary.",
     instruction="""
     You are an expert risk analyst. Your task is to synthesize all the research findings into a comprehensive, structured risk analysis.
     
     **Your Task:**
-    Based on the parsed alert information and the comprehensive research findings, create a detailed RiskAnalysisSummary that includes:
+    Based on the original alert in the user's message and the comprehensive research findings, create a detailed RiskAnalysisSummary that includes:
     
     1. **alert_summary**: A clear one-sentence summary of the weather alert
     2. **real_time_impacts**: List all current impacts happening NOW (road closures, power outages, disruptions)
@@ -171,7 +191,6 @@ risk_analysis_workflow = SequentialAgent(
     name="search_based_risk_analysis_workflow",
     description="Analyzes weather alert risks using real-time Google Search results.",
     sub_agents=[
-        alert_parser,
         risk_researcher,
         risk_synthesizer,
     ],
@@ -1,15 +1,20 @@
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-from typing import List, Optional, Dict
-from google.adk.agents import LlmAgent, SequentialAgent
+import asyncio
+import orjson
+import math
+import re
+import textwrap
+from types import SimpleNamespace
+from typing import AsyncGenerator, List, Optional, Dict, Tuple
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.events import Event, EventActions
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
 from pydantic import BaseModel, Field
-from .tools.tools import geocode_address, search_nearby_places, get_directions
-from google.adk.tools import google_search
+from .tools.tools import geocode_address, search_nearby_places, fetch_place_phone_numbers, get_directions_batch, run_in_tool_executor
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE
 
 class Coordinates(BaseModel):
     """Geographic coordinates"""
@@ -39,10 +44,43 @@ class EmergencyResourcesSummary(BaseModel):
     evacuation_routes: List[EvacuationRoute] = Field(description="Recommended evacuation routes")
     insights: str = Field(description="Summary and safety recommendations")
 
+def _distance_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in miles."""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 3958.8 * 2 * math.asin(math.sqrt(a))
+
+def _origin_coordinates(state) -> Optional[Tuple[float, float]]:
+    """Coordinates of the nearby-places search center, or None if unknown.
+    
+    search_nearby_places is normally called with "lat,lng", but the model may pass
+    an address instead; the geocoded request location is used in that case.
+    """
+    origin = (state.get("nearby_places") or {}).get("location") or ""
+    try:
+        lat, lng = map(float, origin.split(","))
+        return lat, lng
+    except ValueError:
+        pass
+    geocoded = state.get("geocode_result") or {}
+    if geocoded.get("latitude") is None or geocoded.get("longitude") is None:
+        return None
+    return geocoded["latitude"], geocoded["longitude"]
+
 # Phase 1: Location Parser
-location_parser = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="location_parser",
+# Requests from the app follow "Find <type> near <location> within <n> miles" and
+# "Find evacuation routes from <origin> to <destination>"; anything else goes to the LLM
+LOCATION_PATTERN = re.compile(
+    r"\b(?:near|in|around|from|at)\s+(?P<location>.+?)(?:\s+(?:within|to|and|with|for)\b.*)?[\s.?!]*$",
+    re.IGNORECASE,
+)
+# A location that itself contains one of these words means the pattern matched a
+# non-place phrase first ("in case of flooding near Miami")
+LOCATION_PREPOSITION = re.compile(r"\b(?:near|in|around|from|at)\b", re.IGNORECASE)
+
+location_extractor = LlmAgent(
+    model=GEMINI_FLASH_LITE,
+    name="location_extractor",
     description="Parses location from user query and geocodes it",
     instruction="""
     You are a location specialist.
@@ -54,14 +92,64 @@ location_parser = LlmAgent(
     
     Pass the location data to the resource finder.
     """,
-    tools=[geocode_address],
+    tools=[run_in_tool_executor(geocode_address)],
     output_key="location_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
+
+async def _geocode_matched_location(text: str) -> Optional[dict]:
+    """Geocode the location LOCATION_PATTERN finds in text, if it is clearly a place.
+    
+    Returns None when nothing matches, the match contains another location
+    preposition, or Google can only partially geocode it (the phrase was not
+    just a place name).
+    """
+    match = LOCATION_PATTERN.search(text)
+    if not match or LOCATION_PREPOSITION.search(match.group("location")):
+        return None
+    # Geocode against a scratch state so a rejected match leaves no geocode_result behind
+    geocode = await run_in_tool_executor(geocode_address)(SimpleNamespace(state={}), match.group("location"))
+    if geocode["status"] != "success" or geocode["result"].get("partial_match"):
+        return None
+    return geocode["result"]
+
+class LocationParser(BaseAgent):
+    """Geocodes the location in the user request.
+    
+    When LOCATION_PATTERN finds a location that geocodes cleanly it is used
+    directly, with no LLM call; otherwise the request is handed to
+    location_extractor.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        parts = ctx.user_content.parts if ctx.user_content and ctx.user_content.parts else []
+        location = await _geocode_matched_location(" ".join(part.text for part in parts if part.text).strip())
+        if location:
+            tool_context = ToolContext(ctx)
+            tool_context.state["geocode_result"] = location
+            tool_context.state["location_data"] = location
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=types.Content(role="model", parts=[types.Part(text=orjson.dumps(location).decode())]),
+                actions=tool_context.actions,
+            )
+            return
+        
+        async for event in location_extractor.run_async(ctx):
+            yield event
+
+location_parser = LocationParser(
+    name="location_parser",
+    description="Parses location from user query and geocodes it",
+    sub_agents=[location_extractor],
+)
+
 # Phase 2: Resource Finder
 resource_finder = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="resource_finder",
     description="Finds emergency resources (shelters, hospitals, pharmacies) near a location based on user-specified type and radius.",
     instruction="""
@@ -80,109 +168,212 @@ resource_finder = LlmAgent(
     3.  Call the `search_nearby_places` tool using the coordinates from `state['location_data']`, the user's `radius`, and the correct `place_type`.
     4.  Store the results for the next agent.
     """,
-    tools=[search_nearby_places],
+    tools=[run_in_tool_executor(search_nearby_places)],
     output_key="facilities",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
-# Phase 2.5: Phone Number Finder
-phone_number_finder = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="phone_number_finder",
-    description="Finds phone numbers for a list of facilities using Google Search.",
-    instruction="""
-    You are a phone number lookup specialist. Your job is to enrich a list of facilities with their phone numbers.
+# Phase 3: Facility Enrichment
+# Evacuation routes are calculated to this many of the nearest facilities
+ROUTE_DESTINATIONS = 3
 
-    **CONTEXT:**
-    The `state['facilities']` key contains a list of facilities (hospitals, shelters, etc.) found by the previous agent. Each facility is a dictionary with 'name' and 'address'. The 'phone' field is currently empty.
+class FacilityEnricher(BaseAgent):
+    """Adds phone numbers and evacuation routes to the facilities found by resource_finder.
+    
+    Deterministic step, no LLM call: both lookups only need the last
+    search_nearby_places results, so the Places Details phone lookups and the
+    directions to the nearest facilities run concurrently.
+    """
 
-    **YOUR TASK:**
-    1.  Iterate through each facility in the `state['facilities']` list.
-    2.  For each facility, create a precise search query: `f"phone number for {facility['name']}, {facility['address']}"`.
-    3.  Call the `google_search` tool with that query.
-    4.  Extract the phone number from the search result. If a phone number is found, update the 'phone' field for that facility in the list.
-    5.  If no phone number is found, leave the 'phone' field as `None`.
-    6.  After iterating through all facilities, store the updated list of facilities for the next agent.
-
-    **CRITICAL:** Do not change any other data. Only add the phone number if you find it.
-    """,
-    tools=[google_search],
-    output_key="facilities",  # Overwrite the facilities list with the enriched one
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        tool_context = ToolContext(ctx)
+        nearby_places = tool_context.state.get("nearby_places") or {}
+        places = nearby_places.get("places", [])
+        origin = nearby_places.get("location")
+        
+        lookups = [fetch_place_phone_numbers([place["place_id"] for place in places if place.get("place_id")])]
+        if origin and places:
+            origin_coordinates = _origin_coordinates(tool_context.state)
+            if origin_coordinates:
+                origin_lat, origin_lng = origin_coordinates
+                nearest = sorted(
+                    places,
+                    key=lambda place: _distance_miles(origin_lat, origin_lng, place["location"]["lat"], place["location"]["lng"]),
+                )[:ROUTE_DESTINATIONS]
+            else:
+                # No coordinates to measure from; Directions still accepts the origin as given
+                nearest = places[:ROUTE_DESTINATIONS]
+            destinations = [
+                place.get("address") or f"{place['location']['lat']},{place['location']['lng']}"
+                for place in nearest
+            ]
+            lookups.append(get_directions_batch(tool_context, origin, destinations))
+        phone_numbers, *_ = await asyncio.gather(*lookups)
+        
+        facilities = [
+            {**place, "phone": phone_numbers.get(place.get("place_id"))}
+            for place in places
+        ]
+        tool_context.state["facilities_with_phones"] = facilities
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=orjson.dumps({
+                "facilities": facilities,
+                "routes": tool_context.state.get("directions_batch"),
+            }).decode())]),
+            actions=tool_context.actions,
+        )
+
+facility_enrichment = FacilityEnricher(
+    name="facility_enrichment",
+    description="Looks up facility phone numbers and evacuation routes concurrently",
 )
 
-# Phase 3: Route Calculator
-route_calculator = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="route_calculator",
-    description="Calculates evacuation routes from the location",
-    instruction="""
-    You are an evacuation route specialist.
+# Phase 4: Final Synthesizer
+# Facility lists by the place_type resource_finder searched for
+FACILITY_LISTS = {"shelter": "shelters", "hospital": "hospitals", "pharmacy": "pharmacies"}
+
+def build_emergency_resources_summary(state) -> EmergencyResourcesSummary:
+    """Assembles the final summary from the facilities, phone numbers and routes in state."""
+    nearby_places = state.get("nearby_places") or {}
+    places = state.get("facilities_with_phones") or nearby_places.get("places", [])
+    origin = _origin_coordinates(state)
     
-    **Your Task:**
-    Calculate evacuation routes from the user's location to the nearest safe facilities.
+    # Without a known origin distances are reported as 0 and the search order is kept
+    facilities = sorted(
+        (
+            Facility(
+                name=place.get("name") or "Unknown",
+                address=place.get("address") or "",
+                distance=round(_distance_miles(*origin, place["location"]["lat"], place["location"]["lng"]), 1) if origin else 0.0,
+                phone=place.get("phone"),
+                coordinates=Coordinates(lat=place["location"]["lat"], lng=place["location"]["lng"]),
+            )
+            for place in places
+        ),
+        key=lambda facility: facility.distance,
+    )
     
-    **Process:**
-    1. Extract origin location from state["location_data"]["formatted_address"]
-    2. Identify safe destinations (use nearest shelters from state["facilities"])
-    3. For top 3 nearest shelters, use get_directions tool:
-       - origin: from state["location_data"]["formatted_address"]
-       - destination: shelter address
-       - alternatives: true (to get multiple route options)
-    4. Extract route details from each direction:
-       - Distance (miles)
-       - estimated travel time
-       - Route description
-       - Key waypoints
-    5. Prioritize routes by distance and time
-    6. Store route data for formatter
+    evacuation_routes = [
+        EvacuationRoute(
+            destination=directions["destination"],
+            distance=directions["routes"][0]["distance"],
+            duration=directions["routes"][0]["duration"],
+            summary=directions["routes"][0]["summary"],
+        )
+        for directions in (state.get("directions_batch") or {}).get("directions", [])
+        if directions.get("status") == "success" and directions.get("routes")
+    ]
     
-    Pass the route data to the resource formatter.
-    """,
-    tools=[get_directions],
-    output_key="routes",
-    before_model_callback=log_agent_entry,
-    after_model_callback=log_agent_exit,
-)
+    place_type = (nearby_places.get("place_type") or "").lower()
+    facility_list = next((name for key, name in FACILITY_LISTS.items() if key in place_type), "shelters")
+    location = (state.get("geocode_result") or {}).get("formatted_address") or "the requested location"
+    if facilities:
+        insights = (
+            f"Found {len(facilities)} {facility_list} near {location}. The nearest is "
+            f"{facilities[0].name} ({facilities[0].distance} miles away)."
+        )
+    else:
+        insights = f"No {facility_list} were found near {location}. Try a larger search radius."
+    if evacuation_routes:
+        fastest = evacuation_routes[0]
+        insights += f" Evacuation route to {fastest.destination}: {fastest.summary}, {fastest.distance} ({fastest.duration})."
+    
+    return EmergencyResourcesSummary(
+        hospitals=facilities if facility_list == "hospitals" else [],
+        shelters=facilities if facility_list == "shelters" else [],
+        pharmacies=facilities if facility_list == "pharmacies" else [],
+        evacuation_routes=evacuation_routes,
+        insights=insights,
+    )
 
-# Phase 4: Final Synthesizer
-final_synthesizer = LlmAgent(
-    model="gemini-2.5-flash-lite",
-    name="final_synthesizer",
-    description="Synthesizes all collected data into the final structured output.",
-    instruction="""
-    You are the final assembly agent. Your only job is to take the data collected by the previous agents and structure it into the final `EmergencyResourcesSummary` JSON object.
+# Facilities listed to insights_writer; the summary itself keeps all of them
+INSIGHTS_FACILITIES = 5
 
-    **CONTEXT:**
-    - The `state['facilities']` key contains a list of found facilities (shelters, hospitals, or pharmacies).
-    - The `state['routes']` key contains a list of calculated evacuation routes.
-    - The `state['input']['resourceType']` contains the type of resource the user searched for.
+INSIGHTS_INSTRUCTION = """
+    You are an emergency preparedness advisor.
 
-    **YOUR TASK:**
-    1.  Create the `EmergencyResourcesSummary` object.
-    2.  Populate the correct facility list (`shelters`, `hospitals`, or `pharmacies`) using the data from `state['facilities']`.
-    3.  Populate the `evacuation_routes` list using the data from `state['routes']`.
-    4.  Generate a brief, helpful summary for the `insights` field based on what was found.
+    The resources found for the user's request are listed below as JSON. Write the
+    insights for the user in 3-5 sentences:
+    - Summarize what was found, naming the nearest facilities and their distances
+    - Mention the fastest evacuation route if one was calculated
+    - Give safety recommendations specific to this location and resource type
+      (e.g., call ahead to confirm shelter space, what to bring, routes to avoid)
 
-    **CRITICAL:** Output ONLY the final, valid `EmergencyResourcesSummary` JSON object.
-    """,
-    output_schema=EmergencyResourcesSummary,
-    output_key="final_summary",
+    Use only the facts below; do not invent facilities, phone numbers or routes.
+    Respond with the insights text only.
+
+    Resources:
+    """
+
+def insights_instruction(context: ReadonlyContext) -> str:
+    """Builds insights_writer's instruction from the assembled summary, not the conversation."""
+    summary = build_emergency_resources_summary(context.state)
+    facilities = summary.hospitals or summary.shelters or summary.pharmacies
+    overview = {
+        "location": (context.state.get("geocode_result") or {}).get("formatted_address"),
+        "resource_type": (context.state.get("nearby_places") or {}).get("place_type"),
+        "facilities": [
+            facility.model_dump(include={"name", "address", "distance", "phone"})
+            for facility in facilities[:INSIGHTS_FACILITIES]
+        ],
+        "facilities_found": len(facilities),
+        "evacuation_routes": [route.model_dump() for route in summary.evacuation_routes],
+    }
+    return textwrap.dedent(INSIGHTS_INSTRUCTION) + orjson.dumps(overview).decode()
+
+insights_writer = LlmAgent(
+    model=GEMINI_FLASH_LITE,
+    name="insights_writer",
+    description="Writes the summary and safety recommendations for the emergency resources found",
+    instruction=insights_instruction,
+    include_contents="none",
+    output_key="resource_insights",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
-# Sequential Pipeline: Location -> Resources -> Routes -> Format
+class FinalSynthesizer(BaseAgent):
+    """Builds the EmergencyResourcesSummary from state.
+    
+    Facility lists and routes are assembled in Python; only the insights text
+    comes from insights_writer, which works from a compact overview of those
+    results. The templated insights are kept if it returns nothing.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        async for event in insights_writer.run_async(ctx):
+            yield event
+        
+        summary = build_emergency_resources_summary(ctx.session.state)
+        insights = (ctx.session.state.get("resource_insights") or "").strip()
+        if insights:
+            summary.insights = insights
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=summary.model_dump_json())]),
+            actions=EventActions(state_delta={"final_summary": summary.model_dump()}),
+        )
+
+final_synthesizer = FinalSynthesizer(
+    name="final_synthesizer",
+    description="Synthesizes all collected data into the final structured output.",
+    sub_agents=[insights_writer],
+)
+
+# Sequential Pipeline: Location -> Resources -> Phones + Routes -> Summary
 emergency_resources_workflow = SequentialAgent(
     name="emergency_resources_pipeline",
     description="Finds emergency shelters, hospitals, and evacuation routes near a location with distance-sorted recommendations",
     sub_agents=[
         location_parser,
         resource_finder,
-        phone_number_finder,
-        route_calculator,
+        facility_enrichment,
         final_synthesizer,
     ],
 )
@@ -1,14 +1,9 @@
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
 from typing import List, Dict
 from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
-from .tools.tools import geocode_address, get_nws_forecast
+from .tools.tools import geocode_address, get_nws_forecast, run_in_tool_executor
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE
 
 class DailyForecast(BaseModel):
     """Individual day forecast"""
@@ -30,7 +25,7 @@ class ForecastSummary(BaseModel):
 # Phase 1: Geocoding Agent
 geocoder = LlmAgent(
     name="geocoder",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Geocodes a location name into latitude and longitude coordinates",
     instruction="""
     You are a geocoding specialist. Your task is to convert a location name (e.g., "San Francisco, CA") into geographic coordinates.
@@ -39,7 +34,7 @@ geocoder = LlmAgent(
     
     Store the result in your response. The next agent needs it.
     """,
-    tools=[geocode_address],
+    tools=[run_in_tool_executor(geocode_address)],
     output_key="geocode_result",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
@@ -48,7 +43,7 @@ geocoder = LlmAgent(
 # Phase 2: Forecast Retrieval Agent
 retriever = LlmAgent(
     name="forecast_retriever",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Retrieves 7-day weather forecast using coordinates from the previous step",
     instruction="""
     You are a weather data retrieval specialist. Your task is to get the 7-day forecast for the coordinates provided in the state.
@@ -57,7 +52,7 @@ retriever = LlmAgent(
     
     Store the forecast data in your response for the next agent.
     """,
-    tools=[get_nws_forecast],
+    tools=[run_in_tool_executor(get_nws_forecast)],
     output_key="forecast_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
@@ -65,7 +60,7 @@ retriever = LlmAgent(
 
 formatter = LlmAgent(
     name="forecast_formatter",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Formats raw forecast data into a structured summary",
     instruction="""
     You are a weather forecaster. Your task is to synthesize the geocode and forecast data into a human-readable summary.
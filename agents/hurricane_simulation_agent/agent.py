@@ -1,26 +1,16 @@
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-import logging
 from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any
 from google.genai import types
 from .tools.tools import (
     get_flood_risk_data,
-    calculate_evacuation_priority
+    calculate_evacuation_priority,
+    run_in_tool_executor
 )
-from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.logging_utils import get_logger, log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE, GEMINI_FLASH
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 class HurricaneData(BaseModel):
     """Structured data extracted from a hurricane image."""
@@ -51,7 +41,7 @@ class EvacuationPlan(BaseModel):
 # Hurricane Image Analysis Agent
 hurricane_image_analysis_agent = LlmAgent(
     name="hurricane_image_analysis_agent",
-    model="gemini-2.5-flash",
+    model=GEMINI_FLASH,
     description="Analyzes hurricane images to extract key data.",
     instruction="""
     Analyze the provided hurricane image to extract its category, affected states, and geographic bounding box.
@@ -71,7 +61,7 @@ hurricane_image_analysis_agent = LlmAgent(
 # Evacuation Coordinator Agent (Simplified for this workflow)
 evacuation_coordinator_agent = LlmAgent(
     name="evacuation_coordinator_agent",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Orchestrates hurricane evacuation priority analysis.",
     instruction="""Coordinate evacuation priority analysis using hurricane and flood risk data.
 
@@ -94,8 +84,8 @@ Do NOT return raw tool responses. Transform the tool data into the final schema.
 
 The insights should include geographic_distribution, risk_patterns, evacuation_recommendations, and resource_allocation as string fields.""",
     tools=[
-        get_flood_risk_data,
-        calculate_evacuation_priority
+        run_in_tool_executor(get_flood_risk_data),
+        run_in_tool_executor(calculate_evacuation_priority)
     ],
     output_key="evacuation_plan",
     before_model_callback=log_agent_entry,
@@ -105,7 +95,7 @@ The insights should include geographic_distribution, risk_patterns, evacuation_r
 # Evacuation Plan Formatter Agent
 evacuation_plan_formatter = LlmAgent(
     name="evacuation_plan_formatter",
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     description="Formats the evacuation data into the final EvacuationPlan schema.",
     instruction="""
     You are a data formatting specialist. Your task is to convert the state data into the final EvacuationPlan schema.
@@ -30,6 +30,7 @@ for agent in "${AGENTS_TO_SYNC[@]}"; do
         echo "  -> Syncing to ${AGENT_TOOLS_DEST}"
         cp "${SHARED_TOOLS_SOURCE}/__init__.py" "${AGENT_TOOLS_DEST}/"
         cp "${SHARED_TOOLS_SOURCE}/logging_utils.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}/models.py" "${AGENT_TOOLS_DEST}/"
         cp "${SHARED_TOOLS_SOURCE}/tools.py" "${AGENT_TOOLS_DEST}/"
     else
         echo "  -> Warning: ${AGENT_TOOLS_DEST} not found. Skipping sync."
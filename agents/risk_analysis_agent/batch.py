@@ -0,0 +1,199 @@
+"""Concurrent risk analysis for batches of weather alerts."""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.models import LlmRequest
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .agent import RiskAnalysisSummary, root_agent
+from .tools.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+APP_NAME = "risk_analysis_agent"
+BATCH_USER_ID = "batch"
+
+_decoder = json.JSONDecoder()
+
+
+class _RateLimiter:
+    """Sliding-window limiter allowing at most `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._starts: deque = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self.period:
+                    self._starts.popleft()
+                if len(self._starts) < self.rate:
+                    self._starts.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._starts[0]))
+
+
+class _FlexTierPlugin(BasePlugin):
+    """Sends every model call on the Flex service tier.
+
+    Batch runs have no user waiting on them, so they take the discounted,
+    best-effort tier; the interactive paths keep the default tier.
+    """
+
+    def __init__(self):
+        super().__init__(name="flex_service_tier")
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> None:
+        llm_request.config.service_tier = types.ServiceTier.FLEX
+
+
+def _new_runner(plugins: Optional[List[BasePlugin]] = None) -> InMemoryRunner:
+    return InMemoryRunner(agent=root_agent, app_name=APP_NAME, plugins=plugins)
+
+
+def _alert_text(alert: Union[str, Dict[str, Any]]) -> str:
+    return alert if isinstance(alert, str) else json.dumps(alert)
+
+
+def parse_completed_fields(text: str, start: int = 0) -> Tuple[List[Tuple[str, Any]], int]:
+    """Decode the top-level fields of a partial JSON object that are complete.
+
+    Args:
+        text: The JSON object text received so far.
+        start: Offset returned by the previous call; fields before it are
+            not decoded again.
+
+    Returns:
+        The newly completed (field, value) pairs and the offset to resume from.
+    """
+    fields = []
+    pos = start or text.find("{") + 1
+    if pos <= 0:
+        return fields, start
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            key, end = _decoder.raw_decode(text, pos)
+            end = text.index(":", end) + 1
+            while end < len(text) and text[end] in " \t\r\n":
+                end += 1
+            value, end = _decoder.raw_decode(text, end)
+        except ValueError:
+            # Field not fully streamed yet
+            return fields, pos
+        fields.append((key, value))
+        pos = end
+
+
+async def stream_risk_analysis(
+    alert: Union[str, Dict[str, Any]],
+) -> AsyncGenerator[Tuple[str, Any], None]:
+    """Analyze one alert, yielding each RiskAnalysisSummary field as it completes.
+
+    The synthesizer's JSON is streamed, so alert_summary (the first field)
+    is available long before the full summary finishes generating.
+
+    Args:
+        alert: Alert text or alert dict (serialized to JSON for the model).
+
+    Yields:
+        (field, value) pairs in the order the model emits them.
+    """
+    runner = _new_runner()
+    session = await runner.session_service.create_session(
+        app_name=APP_NAME, user_id=BATCH_USER_ID
+    )
+    text = ""
+    offset = 0
+    async for event in runner.run_async(
+        user_id=BATCH_USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[types.Part(text=_alert_text(alert))]),
+        run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+    ):
+        if event.author != "risk_synthesizer" or not event.partial:
+            continue
+        if event.content and event.content.parts:
+            text += "".join(part.text or "" for part in event.content.parts)
+            fields, offset = parse_completed_fields(text, offset)
+            for field in fields:
+                yield field
+
+
+async def _run_one(
+    runner: InMemoryRunner,
+    alert: Union[str, Dict[str, Any]],
+    semaphore: asyncio.Semaphore,
+    limiter: _RateLimiter,
+) -> Optional[RiskAnalysisSummary]:
+    """Run the full workflow for one alert in its own session."""
+    text = _alert_text(alert)
+    async with semaphore:
+        # Each run starts a burst of google_search grounding calls
+        await limiter.acquire()
+        session = await runner.session_service.create_session(
+            app_name=APP_NAME, user_id=BATCH_USER_ID, session_id=str(uuid.uuid4())
+        )
+        try:
+            async for _ in runner.run_async(
+                user_id=BATCH_USER_ID,
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text=text)]),
+            ):
+                pass
+            session = await runner.session_service.get_session(
+                app_name=APP_NAME, user_id=BATCH_USER_ID, session_id=session.id
+            )
+            summary = session.state.get("risk_analysis_summary")
+            if summary is None:
+                logger.error(f"Risk analysis produced no summary for session {session.id}")
+                return None
+            return RiskAnalysisSummary.model_validate(summary)
+        except Exception as e:
+            logger.error(f"Risk analysis failed for session {session.id}: {e}")
+            return None
+        finally:
+            await runner.session_service.delete_session(
+                app_name=APP_NAME, user_id=BATCH_USER_ID, session_id=session.id
+            )
+
+
+async def run_batch_async(
+    alerts: List[Union[str, Dict[str, Any]]],
+    max_concurrency: int = 10,
+    rpm: int = 100,
+) -> List[Optional[RiskAnalysisSummary]]:
+    """Analyze many alerts concurrently.
+
+    Args:
+        alerts: Alert texts or alert dicts (serialized to JSON for the model).
+        max_concurrency: Maximum number of workflows running at once.
+        rpm: Maximum number of workflows started per minute, to stay within
+            search grounding quota.
+
+    Returns:
+        One RiskAnalysisSummary per alert, in input order; None where the
+        analysis failed.
+    """
+    runner = _new_runner(plugins=[_FlexTierPlugin()])
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = _RateLimiter(rpm)
+    return await asyncio.gather(
+        *[_run_one(runner, alert, semaphore, limiter) for alert in alerts]
+    )
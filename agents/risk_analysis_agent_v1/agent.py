@@ -1,8 +1,9 @@
 from typing import List
 from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
-from .tools.tools import get_census_tracts_in_area, get_flood_risk_data, get_nws_alerts, get_census_demographics, geocode_address
+from .tools.tools import get_census_tracts_in_area, get_flood_risk_data, get_nws_alerts, get_census_demographics, geocode_address, run_in_tool_executor
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.models import GEMINI_FLASH_LITE
 
 class RiskAnalysisSummary(BaseModel):
     """Structured output for risk analysis"""
@@ -16,7 +17,7 @@ class RiskAnalysisSummary(BaseModel):
 
 # Phase 1: Alert Parser
 alert_parser = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="alert_parser",
     description="Parses a single weather alert to extract key information for risk analysis",
     instruction="""
@@ -40,7 +41,7 @@ alert_parser = LlmAgent(
 
 # Phase 2: Census Data Retriever
 census_data_retriever = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="census_data_retriever",
     description="Retrieves population and flood zone data for affected areas",
     instruction="""
@@ -58,7 +59,7 @@ census_data_retriever = LlmAgent(
 
     Pass the aggregated census and risk data to the risk calculator.
     """,
-    tools=[get_census_demographics, get_census_tracts_in_area, get_flood_risk_data, geocode_address],
+    tools=[run_in_tool_executor(tool) for tool in [get_census_demographics, get_census_tracts_in_area, get_flood_risk_data, geocode_address]],
     output_key="census_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
@@ -66,7 +67,7 @@ census_data_retriever = LlmAgent(
 
 # Phase 3: Risk Calculator
 risk_calculator = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="risk_calculator",
     description="Calculates risk scores based on alert severity and population data",
     instruction="""
@@ -97,7 +98,7 @@ risk_calculator = LlmAgent(
 
 # Phase 4: Risk Recommendations Generator
 recommendations_generator = LlmAgent(
-    model="gemini-2.5-flash-lite",
+    model=GEMINI_FLASH_LITE,
     name="recommendations_generator",
     description="Generates risk analysis summary with recommendations",
     instruction="""
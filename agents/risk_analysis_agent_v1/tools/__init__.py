@@ -3,12 +3,20 @@ from .tools import (
     get_weather_statistics,
     get_nws_forecast,
     get_nws_alerts,
+    get_nws_alerts_multi,
     get_current_conditions,
+    get_weather_bundle,
     get_hourly_forecast,
+    get_coordinates_from_urls,
+    get_zone_coordinates,
+    geocode_and_map,
     get_hurricane_track,
     geocode_address,
+    geocode_addresses,
     get_directions,
+    get_directions_batch,
     search_nearby_places,
+    get_place_phone_numbers,
     generate_map
 )
 
@@ -17,11 +25,19 @@ __all__ = [
     "get_weather_statistics",
     "get_nws_forecast",
     "get_nws_alerts",
+    "get_nws_alerts_multi",
     "get_current_conditions",
+    "get_weather_bundle",
     "get_hourly_forecast",
+    "get_coordinates_from_urls",
+    "get_zone_coordinates",
+    "geocode_and_map",
     "get_hurricane_track",
     "geocode_address",
+    "geocode_addresses",
     "get_directions",
+    "get_directions_batch",
     "search_nearby_places",
+    "get_place_phone_numbers",
     "generate_map"
 ]
@@ -7,20 +7,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 80
+
+def get_logger(name):
+    """Returns a logger using the shared agent log configuration above."""
+    return logging.getLogger(name)
+
 # Callback functions for agent lifecycle logging
 def log_agent_entry(callback_context, llm_request):
     """Logs when an agent is about to be executed."""
-    logger.info("="*80)
-    logger.info(f"🔄 AGENT ENTRY / TRANSFER: {callback_context.agent_name}")
-    logger.info("="*80)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("%s\n🔄 AGENT ENTRY / TRANSFER: %s\n%s", _SEP, callback_context.agent_name, _SEP)
 
 def log_agent_exit(callback_context, llm_response):
     """Logs when an agent has finished execution."""
-    logger.info("="*80)
-    logger.info(f"✅ AGENT EXIT: {callback_context.agent_name}")
+    if llm_response.finish_reason == "MAX_TOKENS":
+        logger.warning("✂️ AGENT OUTPUT TRUNCATED (max_output_tokens reached): %s", callback_context.agent_name)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    lines = [_SEP, f"✅ AGENT EXIT: {callback_context.agent_name}"]
     # Optionally log the type of response (e.g., function call)
     if llm_response.content and llm_response.content.parts:
         for part in llm_response.content.parts:
             if part.function_call:
-                logger.info(f"   ↪️ Suggested Action: Call tool '{part.function_call.name}'")
-    logger.info("="*80)
+                lines.append(f"   ↪️ Suggested Action: Call tool '{part.function_call.name}'")
+    lines.append(_SEP)
+    # One record per callback instead of one per banner line
+    logger.info("\n".join(lines))
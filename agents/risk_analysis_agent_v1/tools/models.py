@@ -0,0 +1,7 @@
+from google.adk.models import Gemini
+
+# Shared model instances. A string model name makes ADK build a new Gemini wrapper,
+# and with it a new genai Client and connection pool, on every LLM call. Passing these
+# instances instead lets every agent in the process reuse one client and its connections.
+GEMINI_FLASH_LITE = Gemini(model="gemini-2.5-flash-lite")
+GEMINI_FLASH = Gemini(model="gemini-2.5-flash")
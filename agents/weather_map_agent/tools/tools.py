@@ -1,10 +1,28 @@
 import os
-import json
+import math
+import atexit
+import asyncio
+import contextvars
+import inspect
 import logging
+import re
+import reprlib
+import threading
+import time
+import weakref
+import httpx
+import orjson
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timezone
 from typing import Dict, Any, Optional
-from functools import wraps
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial, wraps
+from types import SimpleNamespace
+from operator import itemgetter
 from google.adk.tools.tool_context import ToolContext
 from google.cloud import bigquery
 import google.auth
@@ -17,53 +35,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Size-bounded repr for logged tool parameters, so large lists or dicts are
+# abbreviated while formatting instead of being stringified in full and truncated
+_param_repr = reprlib.Repr()
+_param_repr.maxstring = 80
+_param_repr.maxother = 80
+
 # Tool call tracking decorator
 def track_tool_call(tool_name):
-    """Decorator to track tool calls with detailed logging"""
+    """Decorator to track tool calls with detailed logging (sync and async tools)"""
+    extra = {"tool_name": tool_name}
+    
+    def log_call(func, signature, args, kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔧 TOOL CALL: %s (%s)", tool_name, func.__name__, extra=extra)
+        
+        # Parameters only at DEBUG: formatting them on every call is not worth it in production
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+        except TypeError:
+            return  # The call itself raises the clearer error
+        params = {
+            name: _param_repr.repr(value)
+            for name, value in arguments.items()
+            if name != "tool_context"
+        }
+        if params:
+            logger.debug("   Parameters: %s", params, extra=extra)
+    
+    def log_success(result):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        # Log result summary
+        summary = ""
+        if isinstance(result, dict):
+            if 'status' in result:
+                summary += f" status={result.get('status')}"
+            if 'count' in result:
+                summary += f" count={result.get('count')}"
+            if 'alerts' in result:
+                summary += f" alerts_returned={len(result.get('alerts', []))}"
+        logger.info("✅ TOOL SUCCESS: %s%s", tool_name, summary, extra=extra)
+    
+    def log_error(e):
+        logger.error(f"❌ TOOL ERROR: {tool_name}: {str(e)}", extra=extra)
+    
     def decorator(func):
+        # Resolved once per tool rather than on every call
+        signature = inspect.signature(func)
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                log_call(func, signature, args, kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                    log_success(result)
+                    return result
+                except Exception as e:
+                    log_error(e)
+                    raise
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"{'='*80}")
-            logger.info(f"🔧 TOOL CALL: {tool_name}")
-            logger.info(f"   Function: {func.__name__}")
-            
-            # Log parameters (skip tool_context)
-            params = {}
-            if len(args) > 1:
-                params['args'] = str(args[1:])[:200]  # Truncate long args
-            if kwargs:
-                params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
-            
-            if params:
-                logger.info(f"   Parameters: {params}")
-            
-            logger.info(f"{'='*80}")
-            
+            log_call(func, signature, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                
-                # Log result summary
-                logger.info(f"{'='*80}")
-                logger.info(f"✅ TOOL SUCCESS: {tool_name}")
-                if isinstance(result, dict):
-                    if 'status' in result:
-                        logger.info(f"   Status: {result.get('status')}")
-                    if 'count' in result:
-                        logger.info(f"   Count: {result.get('count')}")
-                    if 'alerts' in result:
-                        logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
-                logger.info(f"{'='*80}")
-                
+                log_success(result)
                 return result
             except Exception as e:
-                logger.error(f"{'='*80}")
-                logger.error(f"❌ TOOL ERROR: {tool_name}")
-                logger.error(f"   Error: {str(e)}")
-                logger.error(f"{'='*80}")
+                log_error(e)
                 raise
         return wrapper
     return decorator
 
+# ADK calls synchronous tools directly on the event loop, so a blocking HTTP or BigQuery
+# call stalls every other agent and parallel tool call. Agents wrap such tools with
+# run_in_tool_executor to run them on this bounded, reused pool instead.
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="adk-tool"
+)
+atexit.register(TOOL_EXECUTOR.shutdown, wait=False)
+
+
+def run_in_tool_executor(func):
+    """Expose a synchronous tool to ADK as an async tool that runs on TOOL_EXECUTOR.
+    
+    The wrapper keeps the tool's name, docstring and signature, so the function
+    declaration sent to the model is unchanged.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            TOOL_EXECUTOR, partial(context.run, func, *args, **kwargs)
+        )
+    return wrapper
+
 # Load environment variables
 load_dotenv()
 
@@ -72,10 +144,12 @@ application_default_credentials, project_id = google.auth.default()
 if not project_id:
     project_id = os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_CLOUD_PROJECT")
 
-# Create BigQuery client
+# Create BigQuery client. The tool queries are short, so let BigQuery skip job
+# creation and return results inline (short query optimized mode).
 bq_client = bigquery.Client(
     credentials=application_default_credentials,
-    project=project_id
+    project=project_id,
+    default_job_creation_mode="JOB_CREATION_OPTIONAL"
 )
 
 # NWS API Configuration
@@ -85,6 +159,290 @@ NWS_HEADERS = {
     "User-Agent": NWS_USER_AGENT,
     "Accept": "application/geo+json"
 }
+# Upper bound on simultaneous NWS requests issued by the batched tools
+NWS_MAX_CONCURRENCY = 8
+
+# State/territory names accepted by the alert tools, mapped to NWS area codes
+US_STATE_CODES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "district of columbia": "DC",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", "illinois": "IL",
+    "indiana": "IN", "iowa": "IA", "kansas": "KS", "kentucky": "KY", "louisiana": "LA",
+    "maine": "ME", "maryland": "MD", "massachusetts": "MA", "michigan": "MI", "minnesota": "MN",
+    "mississippi": "MS", "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", "oregon": "OR",
+    "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC", "south dakota": "SD",
+    "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA",
+    "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+    "puerto rico": "PR", "guam": "GU", "american samoa": "AS", "u.s. virgin islands": "VI",
+    "virgin islands": "VI", "northern mariana islands": "MP",
+}
+
+# State FIPS codes used to select census tracts, keyed by state code
+STATE_FIPS_CODES = {
+    'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
+    'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
+    'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
+    'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
+    'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
+    'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
+    'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
+    'WI': '55', 'WY': '56'
+}
+
+# Transient NWS/NHC failures (rate limiting, gateway errors) are retried with backoff
+NOAA_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"]
+)
+
+# Shared NWS and NHC connection pools so repeated tool calls reuse TCP/TLS connections
+# instead of opening a new one per request
+nws_session = requests.Session()
+nws_session.headers.update(NWS_HEADERS)
+nws_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=NOAA_RETRY))
+atexit.register(nws_session.close)
+
+nhc_session = requests.Session()
+nhc_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=NOAA_RETRY))
+atexit.register(nhc_session.close)
+
+# Guards every module-level cache below and the in-flight fetch table. Tools run on
+# TOOL_EXECUTOR threads, so a lookup, insert or eviction must not interleave with
+# another thread's. Re-entrant so _single_flight can run a cache lookup while holding it.
+_cache_lock = threading.RLock()
+
+# Short-lived cache of raw NWS alert features keyed by request URL. The alerts feed
+# refreshes about once a minute, so bursts of identical queries share one fetch.
+NWS_ALERTS_CACHE_TTL = 60
+NWS_ALERTS_CACHE_MAXSIZE = 256
+_nws_alerts_cache: Dict[str, tuple] = {}
+_CACHE_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# Short-lived cache of other NWS/NHC JSON responses keyed by URL. Forecasts and
+# observations update every few minutes; a point's grid assignment effectively never changes.
+NWS_POINTS_CACHE_TTL = 15 * 60
+NWS_FORECAST_CACHE_TTL = 5 * 60
+NWS_JSON_CACHE_MAXSIZE = 1024
+_nws_json_cache: Dict[str, tuple] = {}
+
+# NWS/NHC fetches currently in flight. Concurrent cache misses for the same URL wait
+# for the first caller's request instead of each hitting the API (and its rate limit).
+_inflight: Dict[Any, Future] = {}
+
+# Forecast URLs resolved from /points, keyed by rounded coordinates. Grid assignments
+# only change when NWS realigns offices, so repeat locations skip /points for a day.
+NWS_GRID_CACHE_TTL = 24 * 60 * 60
+NWS_GRID_CACHE_MAXSIZE = 4096
+_nws_grid_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# NWS zones endpoint segment by the type letter in a zone ID (third character);
+# anything else is treated as a forecast zone
+NWS_ZONE_TYPES = {"Z": "forecast", "C": "county", "F": "fire"}
+
+# Zone geometry is effectively static, so zone coordinate lookups are kept for a day
+# in an LRU keyed by zone ID (get_zone_coordinates) or zone URL (get_coordinates_from_urls)
+ZONE_COORDINATES_CACHE_TTL = 24 * 60 * 60
+ZONE_COORDINATES_CACHE_MAXSIZE = 4096
+_zone_coordinates_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Async HTTP clients shared by the batched tools, one set per event loop since httpx
+# connection pools cannot be shared across loops. Entries go away with their loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(name: str, factory) -> httpx.AsyncClient:
+    """Return the shared client called `name` for the running event loop, creating it if needed."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = clients[name] = factory()
+    return client
+
+
+def get_nws_async_client() -> httpx.AsyncClient:
+    """Return the shared HTTP/2 NWS client for the running event loop."""
+    return _get_async_client("nws", lambda: httpx.AsyncClient(
+        http2=True,
+        headers=NWS_HEADERS,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    ))
+
+
+# BigQuery SQL for the tools below. The text is constant and every value is bound as
+# a query parameter, so identical statements are reused across calls.
+_CENSUS_SQL = """
+SELECT 
+    COUNT(*) as census_tracts,
+    SUM(total_pop) as total_population,
+    SUM(households) as total_households,
+    AVG(median_age) as avg_median_age,
+    AVG(median_income) as avg_median_income,
+    SUM(housing_units) as housing_units,
+    AVG(median_rent) as avg_median_rent
+FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
+WHERE SUBSTR(geo_id, 1, 2) = @state_code
+"""
+
+# Top 3 nearest stations by great-circle distance in miles
+_NEAREST_STATION_SQL = """
+SELECT
+    usaf,
+    wban,
+    name,
+    state,
+    lat,
+    lon,
+    ST_DISTANCE(ST_GEOGPOINT(lon, lat), ST_GEOGPOINT(@longitude, @latitude)) / 1609.344 as distance
+FROM
+    `bigquery-public-data.noaa_gsod.stations`
+WHERE
+    state = @state
+    AND lat IS NOT NULL
+    AND lon IS NOT NULL
+    AND lat BETWEEN -90 AND 90
+    AND lon BETWEEN -180 AND 180
+ORDER BY
+    distance
+LIMIT 3
+"""
+
+# The table suffix range limits the scan to the years covered by the date range,
+# and filtering on the DATE column avoids building a date string for every row
+_HISTORICAL_SQL = """
+SELECT 
+    stn,
+    date,
+    temp,
+    max,
+    min,
+    prcp,
+    sndp,
+    wdsp,
+    mxpsd
+FROM `bigquery-public-data.noaa_gsod.gsod*`
+WHERE stn IN UNNEST(@usaf_ids)
+    AND _TABLE_SUFFIX BETWEEN @start_year AND @end_year
+    AND date BETWEEN @start_date AND @end_date
+QUALIFY ROW_NUMBER() OVER (PARTITION BY stn ORDER BY date DESC) <= 100
+ORDER BY stn, date DESC
+"""
+
+_STATS_SQL = """
+SELECT 
+    AVG(temp) as avg_temp,
+    MAX(max) as highest_temp,
+    MIN(min) as lowest_temp,
+    AVG(prcp) as avg_precipitation,
+    SUM(prcp) as total_precipitation,
+    AVG(SAFE_CAST(wdsp AS FLOAT64)) as avg_wind_speed,
+    MAX(SAFE_CAST(mxpsd AS FLOAT64)) as max_wind_speed,
+    COUNT(*) as days_recorded
+FROM `bigquery-public-data.noaa_gsod.gsod*`
+WHERE _TABLE_SUFFIX = @year
+    AND stn = @station_id
+    AND (@month = 0 OR EXTRACT(MONTH FROM date) = @month)
+"""
+
+# Census tracts with demographic data, most elderly first. The table has no
+# lat/lon columns, only geo_id (state + county + tract FIPS), which is split here
+# along with the percentage rounding so rows come back in their final shape.
+_CENSUS_TRACTS_SQL = """
+SELECT 
+    geo_id,
+    SUBSTR(geo_id, 1, 2) as state_code,
+    NULLIF(SUBSTR(geo_id, 3, 3), '') as county_code,
+    NULLIF(SUBSTR(geo_id, 6), '') as tract_code,
+    total_pop as total_population,
+    (male_65_to_66 + female_65_to_66) as elderly_population,
+    IFNULL(ROUND(SAFE_DIVIDE((male_65_to_66 + female_65_to_66), total_pop) * 100, 2), 0) as elderly_percentage,
+    median_income,
+    households,
+    housing_units,
+    poverty as population_below_poverty,
+    IFNULL(ROUND(SAFE_DIVIDE(poverty, pop_determined_poverty_status) * 100, 2), 0) as poverty_rate
+FROM `bigquery-public-data.census_bureau_acs.censustract_2020_5yr`
+WHERE SUBSTR(geo_id, 1, 2) = @state
+    AND (@county = '' OR SUBSTR(geo_id, 3, 3) = @county)
+    AND total_pop > 0
+ORDER BY elderly_percentage DESC
+LIMIT 100
+"""
+
+# Historical heavy-precipitation days (> 5 inches, indicating potential flooding) at
+# a state's stations, shaped and classified in SQL: > 10 inches is a Major event.
+# Stations are filtered to the state before the join, and only the yearly tables
+# in the requested range are scanned.
+FLOOD_HISTORY_YEARS = 10
+_FLOOD_EVENTS_SQL = """
+WITH stations_in_state AS (
+    SELECT usaf, wban, name, lat, lon
+    FROM `bigquery-public-data.noaa_gsod.stations`
+    WHERE state = @state
+)
+SELECT 
+    FORMAT_DATE('%F', w.date) AS date,
+    w.stn AS station_id,
+    s.name AS station_name,
+    s.lat AS latitude,
+    s.lon AS longitude,
+    ROUND(w.prcp, 2) AS precipitation_inches,
+    NULLIF(ROUND(w.temp, 1), 0) AS temperature_f,
+    IF(w.prcp > 10, 'Major', 'Moderate') AS severity,
+    @state AS state
+FROM `bigquery-public-data.noaa_gsod.gsod*` w
+JOIN stations_in_state s
+ON w.stn = s.usaf AND w.wban = s.wban
+WHERE _TABLE_SUFFIX BETWEEN @start_year AND @end_year
+    AND w.prcp IS NOT NULL
+    AND w.prcp > 5.0
+ORDER BY w.date DESC, w.prcp DESC
+LIMIT 100
+"""
+
+# BigQuery parameter types by Python type (bool before int, since bool subclasses int)
+_BQ_PARAM_TYPES = ((bool, "BOOL"), (int, "INT64"), (float, "FLOAT64"), (str, "STRING"), (date, "DATE"))
+
+
+def _bq_param_type(value) -> str:
+    for python_type, bq_type in _BQ_PARAM_TYPES:
+        if isinstance(value, python_type):
+            return bq_type
+    raise TypeError(f"Unsupported BigQuery parameter type: {type(value).__name__}")
+
+
+def _query_job_config(params: Dict[str, Any]) -> bigquery.QueryJobConfig:
+    """Build a job config binding each parameter to the matching @name.
+    
+    Lists become array parameters typed by their first element (STRING when empty).
+    """
+    query_params = []
+    for name, value in params.items():
+        if isinstance(value, (list, tuple)):
+            element_type = _bq_param_type(value[0]) if value else "STRING"
+            query_params.append(bigquery.ArrayQueryParameter(name, element_type, list(value)))
+        else:
+            query_params.append(bigquery.ScalarQueryParameter(name, _bq_param_type(value), value))
+    return bigquery.QueryJobConfig(query_parameters=query_params)
+
+
+def _run_query(sql: str, **params):
+    """Run a parameterized query, binding each keyword argument to the matching @name."""
+    return bq_client.query_and_wait(sql, job_config=_query_job_config(params))
+
+
+def _query_one(sql: str, **params):
+    """Run a parameterized single-row query (e.g. an aggregate) and return its row, or None.
+    
+    Only the first row is requested, so the result comes back with the query
+    response instead of a separate page fetch.
+    """
+    rows = list(bq_client.query_and_wait(sql, job_config=_query_job_config(params), max_results=1))
+    return rows[0] if rows else None
 
 
 # BigQuery Helper Functions for Historical Weather Data and Census Demographics
@@ -101,102 +459,33 @@ def get_census_demographics(
         state (str): State abbreviation (e.g., "CA")
         
     Returns:
-        dict: Census demographics including population, age, income, housing
+        dict: Census demographics (population, households, age, income, housing)
+            aggregated over the state's census tracts
     """
     try:
         # Query BigQuery census_bureau_acs dataset for city demographics
-        # Map state abbreviations to FIPS codes
-        state_fips = {
-            'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
-            'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
-            'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
-            'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
-            'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
-            'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
-            'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
-            'WI': '55', 'WY': '56'
-        }
-        
-        state_code = state_fips.get(state.upper())
+        state_code = STATE_FIPS_CODES.get(normalize_state_code(state))
         if not state_code:
             return {
                 "status": "error",
                 "message": f"Invalid state abbreviation: {state}. Please use 2-letter state code (e.g., CA, TX, NY)"
             }
         
-        query = f"""
-        SELECT 
-            geo_id,
-            total_pop,
-            median_age,
-            median_income,
-            housing_units,
-            households,
-            male_pop,
-            female_pop,
-            white_pop,
-            black_pop,
-            asian_pop,
-            hispanic_pop,
-            bachelors_degree,
-            median_rent,
-            owner_occupied_housing_units,
-            housing_units_renter_occupied
-        FROM `bigquery-public-data.census_bureau_acs.censustract_2018_5yr` 
-        WHERE SUBSTR(geo_id, 1, 2) = '{state_code}'
-        LIMIT 100
-        """
-        
-        logger.info(f"Querying census demographics for {city}, {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
-        
-        demographics = []
-        total_population = 0
-        total_households = 0
-        
-        for row in results:
-            demographics.append({
-                "geo_id": row.geo_id,
-                "population": row.total_pop,
-                "median_age": row.median_age,
-                "median_income": row.median_income,
-                "housing_units": row.housing_units,
-                "households": row.households,
-                "demographics": {
-                    "male": row.male_pop,
-                    "female": row.female_pop,
-                    "white": row.white_pop,
-                    "black": row.black_pop,
-                    "asian": row.asian_pop,
-                    "hispanic": row.hispanic_pop
-                },
-                "education": {
-                    "bachelors_degree": row.bachelors_degree
-                },
-                "housing": {
-                    "median_rent": row.median_rent,
-                    "owner_occupied": row.owner_occupied_housing_units,
-                    "renter_occupied": row.housing_units_renter_occupied
-                }
-            })
-            total_population += row.total_pop or 0
-            total_households += row.households or 0
+        logger.info("Querying census demographics for %s, %s", city, state)
+        row = _query_one(_CENSUS_SQL, state_code=state_code)
         
-        # Calculate aggregates
-        if demographics:
-            avg_median_age = sum(d["median_age"] or 0 for d in demographics) / len(demographics)
-            avg_median_income = sum(d["median_income"] or 0 for d in demographics) / len(demographics)
-            
+        if row and row.census_tracts:
             summary = {
                 "city": city,
                 "state": state,
-                "total_population": total_population,
-                "total_households": total_households,
-                "avg_median_age": round(avg_median_age, 1),
-                "avg_median_income": round(avg_median_income, 2),
-                "census_tracts": len(demographics),
-                "tracts": demographics
+                "scope": f"All census tracts in {state}",
+                "total_population": row.total_population or 0,
+                "total_households": row.total_households or 0,
+                "housing_units": row.housing_units or 0,
+                "avg_median_age": round(row.avg_median_age or 0, 1),
+                "avg_median_income": round(row.avg_median_income or 0, 2),
+                "avg_median_rent": round(row.avg_median_rent or 0, 2),
+                "census_tracts": row.census_tracts
             }
         else:
             summary = {
@@ -208,7 +497,7 @@ def get_census_demographics(
         # Save to state
         tool_context.state["census_demographics"] = summary
         
-        logger.info(f"Retrieved demographics for {len(demographics)} census tracts")
+        logger.info("Retrieved demographics for %s census tracts", row.census_tracts)
         
         return {
             "status": "success",
@@ -238,33 +527,11 @@ def find_nearest_weather_station(
         state (str): State abbreviation (e.g., "CA") to filter stations
         
     Returns:
-        dict: Top 3 nearest weather stations with IDs, names, and distances
+        dict: Top 3 nearest weather stations with IDs, names, and distances in miles
     """
     try:
-        # Query to find top 3 nearest stations using Euclidean distance
-        query = f"""
-        SELECT
-            usaf,
-            wban,
-            name,
-            state,
-            lat,
-            lon,
-            SQRT(POW((lat - {latitude}), 2) + POW((lon - ({longitude})), 2)) as distance
-        FROM
-            `bigquery-public-data.noaa_gsod.stations`
-        WHERE
-            state = '{state}'
-            AND lat IS NOT NULL
-            AND lon IS NOT NULL
-        ORDER BY
-            distance
-        LIMIT 3
-        """
-        
-        logger.info(f"Finding top 3 nearest weather stations for coordinates ({latitude}, {longitude}) in {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        logger.info("Finding top 3 nearest weather stations for coordinates (%s, %s) in %s", latitude, longitude, state)
+        results = _run_query(_NEAREST_STATION_SQL, latitude=float(latitude), longitude=float(longitude), state=state)
         
         stations = []
         for row in results:
@@ -279,7 +546,7 @@ def find_nearest_weather_station(
                 "distance": row.distance
             }
             stations.append(station)
-            logger.info(f"Found station #{len(stations)}: {row.usaf} - {row.name} (distance: {row.distance:.4f})")
+            logger.info("Found station #%s: %s - %s (distance: %.1f mi)", len(stations), row.usaf, row.name, row.distance)
         
         if stations:
             tool_context.state["weather_stations"] = stations
@@ -320,74 +587,61 @@ def query_historical_weather(
     Returns:
         dict: Historical weather observations from the first station with data
     """
-    # Extract year from start_date for table suffix
-    start_year = start_date.split('-')[0]
-    end_year = end_date.split('-')[0]
-    table_suffix = "*"  # Use wildcard to cover multiple years
+    try:
+        # Every candidate station is queried in one job
+        logger.info("Querying %s candidate stations in one job: %s", len(usaf_ids), usaf_ids)
+        results = _run_query(
+            _HISTORICAL_SQL,
+            usaf_ids=[str(usaf_id) for usaf_id in usaf_ids],
+            start_year=start_date.split('-')[0],
+            end_year=end_date.split('-')[0],
+            start_date=datetime.strptime(start_date, "%Y-%m-%d").date(),
+            end_date=datetime.strptime(end_date, "%Y-%m-%d").date()
+        )
+        
+        records_by_station = {}
+        for row in results:
+            records_by_station.setdefault(row.stn, []).append({
+                "date": row.date.isoformat(),
+                "temperature": row.temp,
+                "max_temp": row.max,
+                "min_temp": row.min,
+                "precipitation": row.prcp,
+                "snow_depth": row.sndp,
+                "wind_speed": row.wdsp,
+                "max_wind_speed": row.mxpsd
+            })
+    except Exception as e:
+        logger.error(f"Error querying historical weather for stations {usaf_ids}: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to query historical weather data: {str(e)}",
+            "stations_tried": usaf_ids
+        }
     
-    # Try each station in order until we get data
+    # Use the first station, in the caller's order, that has data
     for idx, usaf_id in enumerate(usaf_ids):
-        try:
-            logger.info(f"Attempting to query station #{idx+1}: {usaf_id}")
-            
-            # Build query using USAF as stn field
-            query = f"""
-            SELECT 
-                CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
-                temp,
-                max,
-                min,
-                prcp,
-                sndp,
-                wdsp,
-                mxpsd
-            FROM `bigquery-public-data.noaa_gsod.gsod{table_suffix}`
-            WHERE stn = '{usaf_id}'
-                AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
-                    BETWEEN '{start_date}' AND '{end_date}'
-            ORDER BY year DESC, mo DESC, da DESC
-            LIMIT 100
-            """
-            
-            query_job = bq_client.query(query)
-            results = query_job.result()
-            
-            records = []
-            for row in results:
-                records.append({
-                    "date": str(row.date),
-                    "temperature": row.temp,
-                    "max_temp": row.max,
-                    "min_temp": row.min,
-                    "precipitation": row.prcp,
-                    "snow_depth": row.sndp,
-                    "wind_speed": row.wdsp,
-                    "max_wind_speed": row.mxpsd
-                })
-            
-            if records:
-                tool_context.state["historical_weather"] = {
-                    "usaf_id": usaf_id,
-                    "records": records,
-                    "count": len(records)
-                }
-                
-                logger.info(f"Successfully retrieved {len(records)} records from station {usaf_id}")
-                
-                return {
-                    "status": "success",
-                    "usaf_id": usaf_id,
-                    "records": records,
-                    "count": len(records),
-                    "station_tried": idx + 1,
-                    "total_stations": len(usaf_ids)
-                }
-            else:
-                logger.warning(f"No data found for station {usaf_id}, trying next station...")
-                
-        except Exception as e:
-            logger.error(f"Error querying station {usaf_id}: {str(e)}, trying next station...")
+        records = records_by_station.get(str(usaf_id))
+        if not records:
+            logger.warning("No data found for station %s, trying next station...", usaf_id)
             continue
+        
+        tool_context.state["historical_weather"] = {
+            "usaf_id": usaf_id,
+            "records": records,
+            "count": len(records)
+        }
+        
+        logger.info("Successfully retrieved %s records from station %s", len(records), usaf_id)
+        
+        return {
+            "status": "success",
+            "usaf_id": usaf_id,
+            "records": records,
+            "count": len(records),
+            "station_tried": idx + 1,
+            "total_stations": len(usaf_ids)
+        }
     
     # If we get here, none of the stations had data
     logger.error(f"No data found for any of the {len(usaf_ids)} stations")
@@ -416,32 +670,10 @@ def get_weather_statistics(
         dict: Weather statistics including averages and extremes
     """
     try:
-        if month:
-            date_filter = f"AND EXTRACT(MONTH FROM date) = {month}"
-            period = f"{year}-{month:02d}"
-        else:
-            date_filter = ""
-            period = str(year)
-        
-        query = f"""
-        SELECT 
-            AVG(temp) as avg_temp,
-            MAX(max) as highest_temp,
-            MIN(min) as lowest_temp,
-            AVG(prcp) as avg_precipitation,
-            SUM(prcp) as total_precipitation,
-            AVG(wdsp) as avg_wind_speed,
-            MAX(mxspd) as max_wind_speed,
-            COUNT(*) as days_recorded
-        FROM `bigquery-public-data.noaa_gsod.gsod{year}`
-        WHERE stn = '{station_id}'
-            {date_filter}
-        """
-        
-        query_job = bq_client.query(query)
-        results = query_job.result()
-        
-        row = next(results)
+        period = f"{year}-{month:02d}" if month else str(year)
+        
+        # month=0 selects the whole year
+        row = _query_one(_STATS_SQL, station_id=station_id, year=str(int(year)), month=int(month or 0))
         stats = {
             "station_id": station_id,
             "period": period,
@@ -457,7 +689,7 @@ def get_weather_statistics(
         
         tool_context.state["weather_statistics"] = stats
         
-        logger.info(f"Retrieved weather statistics for {period}")
+        logger.info("Retrieved weather statistics for %s", period)
         
         return {
             "status": "success",
@@ -472,6 +704,37 @@ def get_weather_statistics(
         }
 
 
+def _get_forecast_urls(latitude: float, longitude: float) -> Dict[str, str]:
+    """Return the NWS grid forecast URLs for a location, calling /points only on a cache miss.
+    
+    NWS resolves points to 4 decimals, so rounding lets nearby calls share an entry.
+    
+    Raises:
+        requests.RequestException: If the /points request fails
+    """
+    key = (round(latitude, 4), round(longitude, 4))
+    with _cache_lock:
+        cached = _nws_grid_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            _nws_grid_cache.move_to_end(key)
+            return cached[1]
+    
+    points_data = _get_json_cached(f"{NWS_API_BASE}/points/{key[0]},{key[1]}", NWS_POINTS_CACHE_TTL)
+    properties = points_data["properties"]
+    urls = {
+        "forecast": properties["forecast"],
+        "forecastHourly": properties["forecastHourly"],
+        "observationStations": properties.get("observationStations")
+    }
+    
+    with _cache_lock:
+        _nws_grid_cache[key] = (time.monotonic() + NWS_GRID_CACHE_TTL, urls)
+        _nws_grid_cache.move_to_end(key)
+        while len(_nws_grid_cache) > NWS_GRID_CACHE_MAXSIZE:
+            _nws_grid_cache.popitem(last=False)
+    return urls
+
+
 @track_tool_call("get_nws_forecast")
 def get_nws_forecast(
     tool_context: ToolContext,
@@ -490,22 +753,12 @@ def get_nws_forecast(
         dict: Forecast data with periods, temperatures, and conditions
     """
     try:
-        # Step 1: Get grid points for the location
-        points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-        points_response = requests.get(points_url, headers=NWS_HEADERS, timeout=10)
-        points_response.raise_for_status()
-        points_data = points_response.json()
-        
-        # Extract forecast URL
-        if period == "hourly":
-            forecast_url = points_data["properties"]["forecastHourly"]
-        else:
-            forecast_url = points_data["properties"]["forecast"]
+        # Step 1: Resolve the grid forecast URLs for the location
+        forecast_urls = _get_forecast_urls(latitude, longitude)
+        forecast_url = forecast_urls["forecastHourly" if period == "hourly" else "forecast"]
         
         # Step 2: Get forecast data
-        forecast_response = requests.get(forecast_url, headers=NWS_HEADERS, timeout=10)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
+        forecast_data = _get_json_cached(forecast_url, NWS_FORECAST_CACHE_TTL)
         
         # Extract and format forecast periods
         periods = []
@@ -518,24 +771,26 @@ def get_nws_forecast(
                 "wind_direction": period_data.get("windDirection"),
                 "short_forecast": period_data.get("shortForecast"),
                 "detailed_forecast": period_data.get("detailedForecast"),
-                "precipitation_probability": period_data.get("probabilityOfPrecipitation", {}).get("value")
+                "precipitation_probability": _quantity_value(period_data, "probabilityOfPrecipitation")
             })
         
         update_time = forecast_data["properties"].get("updated") or forecast_data["properties"].get("updateTime")
         
+        location = f"{latitude},{longitude}"
+        
         # Save to state
         tool_context.state["forecast_data"] = {
-            "location": f"{latitude},{longitude}",
+            "location": location,
             "periods": periods,
             "updated": update_time,
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"Retrieved {len(periods)} forecast periods for {latitude},{longitude}")
+        logger.info("Retrieved %s forecast periods for %s,%s", len(periods), latitude, longitude)
         
         return {
             "status": "success",
-            "location": f"{latitude},{longitude}",
+            "location": location,
             "periods": periods,
             "updated": update_time
         }
@@ -565,13 +820,50 @@ def get_hourly_forecast(
     """
     return get_nws_forecast(tool_context, latitude, longitude, period="hourly")
 
+
+def _get_cached_zone_coordinates(key: str) -> Optional[dict]:
+    """Return cached coordinates for a zone ID or URL, or None if missing or expired."""
+    with _cache_lock:
+        cached = _zone_coordinates_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            # Expired entries with an ETag are kept so the next fetch can revalidate them
+            if not cached[2]:
+                _zone_coordinates_cache.pop(key, None)
+            return None
+        _zone_coordinates_cache.move_to_end(key)
+        return cached[1]
+
+
+def _get_stale_zone_coordinates(key: str) -> tuple:
+    """Return (coordinates, etag) of an expired zone entry that can be revalidated, or (None, None)."""
+    with _cache_lock:
+        cached = _zone_coordinates_cache.get(key)
+    if cached is None or not cached[2]:
+        return None, None
+    return cached[1], cached[2]
+
+
+def _cache_zone_coordinates(key: str, coordinates: dict, etag: Optional[str] = None) -> None:
+    """Cache coordinates for a zone ID or URL, evicting the least recently used entry when full."""
+    with _cache_lock:
+        _zone_coordinates_cache[key] = (time.monotonic() + ZONE_COORDINATES_CACHE_TTL, coordinates, etag)
+        _zone_coordinates_cache.move_to_end(key)
+        while len(_zone_coordinates_cache) > ZONE_COORDINATES_CACHE_MAXSIZE:
+            _zone_coordinates_cache.popitem(last=False)
+
+
 @track_tool_call("get_coordinates_from_urls")
-def get_coordinates_from_urls(
+async def get_coordinates_from_urls(
     tool_context: ToolContext,
     zone_urls: list[str]
 ) -> Dict[str, Any]:
     """Get geographic coordinates for a list of NWS zone URLs.
     
+    All zone URLs are fetched concurrently, so the call takes roughly one NWS round
+    trip instead of one per zone.
+    
     Args:
         zone_urls (list[str]): List of full NWS zone URLs.
         
@@ -579,14 +871,18 @@ def get_coordinates_from_urls(
         dict: Coordinates for each zone with status.
     """
     try:
-        zone_coords = []
+        semaphore = asyncio.Semaphore(NWS_MAX_CONCURRENCY)
         
-        for url in zone_urls:
+        async def fetch_zone_coordinates(client, url):
+            cached = _get_cached_zone_coordinates(url)
+            if cached:
+                return cached
             try:
-                logger.info(f"Fetching coordinates for zone URL: {url}")
-                response = requests.get(url, headers=NWS_HEADERS, timeout=10)
+                logger.info("Fetching coordinates for zone URL: %s", url)
+                async with semaphore:
+                    response = await client.get(url)
                 response.raise_for_status()
-                zone_data = response.json()
+                zone_data = orjson.loads(response.content)
                 
                 # Extract coordinates from GeoJSON
                 if zone_data.get("geometry") and zone_data["geometry"].get("type") == "Polygon":
@@ -594,23 +890,30 @@ def get_coordinates_from_urls(
                     coords = zone_data["geometry"]["coordinates"][0][0]
                     lat, lon = coords[1], coords[0]
                     
-                    zone_coords.append({
+                    logger.info("Successfully found coordinates (%s, %s) for %s", lat, lon, url)
+                    coordinates = {
                         "zone_url": url,
                         "latitude": lat,
                         "longitude": lon,
                         "status": "success"
-                    })
-                    logger.info(f"Successfully found coordinates ({lat}, {lon}) for {url}")
-                else:
-                    logger.warning(f"No valid polygon geometry found for zone URL: {url}")
-                    zone_coords.append({"zone_url": url, "status": "failed", "reason": "No polygon geometry"})
+                    }
+                    _cache_zone_coordinates(url, coordinates)
+                    return coordinates
+                
+                logger.warning("No valid polygon geometry found for zone URL: %s", url)
+                return {"zone_url": url, "status": "failed", "reason": "No polygon geometry"}
             
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"API request failed for zone URL {url}: {str(e)}")
-                zone_coords.append({"zone_url": url, "status": "failed", "reason": str(e)})
-            except (ValueError, KeyError) as e:
+                return {"zone_url": url, "status": "failed", "reason": str(e)}
+            except (ValueError, KeyError, IndexError) as e:
                 logger.error(f"Failed to parse response for zone URL {url}: {str(e)}")
-                zone_coords.append({"zone_url": url, "status": "failed", "reason": f"JSON parsing error: {str(e)}"})
+                return {"zone_url": url, "status": "failed", "reason": f"JSON parsing error: {str(e)}"}
+        
+        client = get_nws_async_client()
+        zone_coords = list(await asyncio.gather(
+            *(fetch_zone_coordinates(client, url) for url in zone_urls)
+        ))
 
         tool_context.state["zone_coordinates"] = zone_coords
         
@@ -627,6 +930,214 @@ def get_coordinates_from_urls(
             "message": f"An unexpected error occurred: {str(e)}"
         }
 
+
+def _deduplicate_alerts(alerts: list) -> list:
+    """Collapse duplicate alerts, keeping the most informative copy of each.
+    
+    Alerts are duplicates when they share event, severity and headline and start
+    within the same 5-minute window. The copy with the longer description (then
+    more affected zones) wins; first-seen order is preserved.
+    
+    Args:
+        alerts (list): Formatted alert dicts
+        
+    Returns:
+        list: Alerts with duplicates removed
+    """
+    def onset_bucket(onset):
+        if not onset:
+            return None
+        try:
+            return int(datetime.fromisoformat(onset.replace('Z', '+00:00')).timestamp() // 300)
+        except (ValueError, AttributeError):
+            return onset
+    
+    def informativeness(alert):
+        return (len(alert.get("description") or ""), len(alert.get("affected_zones") or []))
+    
+    unique_alerts = {}
+    for alert in alerts:
+        key = (alert.get("event"), alert.get("severity"), alert.get("headline"), onset_bucket(alert.get("onset")))
+        kept = unique_alerts.get(key)
+        if kept is None or informativeness(alert) > informativeness(kept):
+            unique_alerts[key] = alert
+    
+    if len(unique_alerts) < len(alerts):
+        logger.info("Removed %s duplicate alerts", len(alerts) - len(unique_alerts))
+    
+    return list(unique_alerts.values())
+
+
+def _process_alert_features(features: list, severity: Optional[str] = None) -> tuple:
+    """Format raw NWS alert features, keeping only active Extreme/Severe alerts.
+    
+    Args:
+        features (list): GeoJSON features from an NWS alerts response
+        severity (str): Optional severity filter applied before formatting
+        
+    Returns:
+        tuple: (alerts sorted by severity, severity_counts for all matched features)
+    """
+    # Single pass: count every matched feature, but only format active Extreme/Severe
+    # alerts, bucketed by severity so no sort is needed afterwards
+    severity_counts = Counter({"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0})
+    buckets = {"Extreme": [], "Severe": []}
+    current_time = datetime.now(timezone.utc)
+    
+    for feature in features:
+        props = feature.get("properties", {})
+        
+        # Filter by severity if specified
+        if severity and props.get("severity") != severity:
+            continue
+        
+        alert_severity = props.get("severity", "Unknown")
+        severity_counts[alert_severity] += 1
+        
+        # Only Extreme and Severe alerts are returned
+        bucket = buckets.get(alert_severity)
+        if bucket is None:
+            continue
+        
+        # Skip expired alerts; keep alerts without a parseable expiration to be safe
+        expires = props.get("expires")
+        if expires:
+            try:
+                if datetime.fromisoformat(expires.replace('Z', '+00:00')) <= current_time:
+                    continue
+            except (ValueError, AttributeError, TypeError):
+                # TypeError: a timestamp without a UTC offset cannot be compared
+                pass
+        
+        bucket.append({
+            "event": props.get("event"),
+            "severity": alert_severity,
+            "urgency": props.get("urgency"),
+            "certainty": props.get("certainty"),
+            "headline": props.get("headline"),
+            "description": props.get("description"),
+            "instruction": props.get("instruction"),
+            "onset": props.get("onset"),
+            "expires": expires,
+            "affected_zones": props.get("affectedZones", []),
+            "sender_name": props.get("senderName")
+        })
+    
+    # Extreme before Severe; duplicates never span severities, so dedup keeps that order
+    alerts = _deduplicate_alerts(buckets["Extreme"] + buckets["Severe"])
+    
+    return alerts, dict(severity_counts)
+
+
+def _quantity_value(props: Dict[str, Any], key: str):
+    """Return the value of an NWS quantity property ({"unitCode": ..., "value": ...}), or None."""
+    quantity = props.get(key)
+    return quantity.get("value") if isinstance(quantity, dict) else None
+
+
+def normalize_state_code(state: str) -> str:
+    """Convert a state name (e.g., "California") or code (e.g., "ca") to its NWS area code."""
+    cleaned = state.strip()
+    return US_STATE_CODES.get(cleaned.lower(), cleaned.upper())
+
+
+def _get_cached_alert_features(url: str) -> Optional[list]:
+    """Return cached alert features for an NWS URL, or None if missing or expired."""
+    with _cache_lock:
+        cached = _nws_alerts_cache.get(url)
+    if cached and cached[0] > time.monotonic():
+        logger.info("💾 NWS alerts cache hit: %s", url)
+        return cached[1]
+    return None
+
+
+def _cache_alert_features(url: str, headers, features: list) -> None:
+    """Cache alert features, honouring a shorter Cache-Control max-age from NWS."""
+    ttl = NWS_ALERTS_CACHE_TTL
+    match = _CACHE_MAX_AGE_PATTERN.search(str(headers.get("Cache-Control", "")))
+    if match:
+        ttl = min(ttl, int(match.group(1)))
+    if ttl <= 0:
+        return
+    
+    now = time.monotonic()
+    with _cache_lock:
+        if len(_nws_alerts_cache) >= NWS_ALERTS_CACHE_MAXSIZE:
+            for key in [k for k, (expires_at, _) in _nws_alerts_cache.items() if expires_at <= now]:
+                _nws_alerts_cache.pop(key, None)
+            if len(_nws_alerts_cache) >= NWS_ALERTS_CACHE_MAXSIZE:
+                _nws_alerts_cache.pop(min(_nws_alerts_cache, key=lambda k: _nws_alerts_cache[k][0]), None)
+        _nws_alerts_cache[url] = (now + ttl, features)
+
+
+def _single_flight(key, fetch, lookup=None):
+    """Call fetch() once for all concurrent callers with the same key.
+    
+    The first caller runs fetch(); callers arriving before it finishes wait and
+    receive the same result, or the same exception. lookup(), if given, checks the
+    cache under the same lock that registers the fetch, so a caller cannot miss the
+    cache just as the previous fetch finishes and start a second one.
+    """
+    with _cache_lock:
+        if lookup is not None:
+            cached = lookup()
+            if cached is not None:
+                return cached
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if leader:
+        try:
+            future.set_result(fetch())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _cache_lock:
+                _inflight.pop(key, None)
+    return future.result()
+
+
+def _get_json_cached(url: str, ttl: int, session=None, timeout: int = 10) -> dict:
+    """GET a JSON document, reusing a cached copy for up to `ttl` seconds.
+    
+    A shorter Cache-Control max-age from the server takes precedence. Uses the
+    shared NWS session unless another session is given.
+    
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    def lookup():
+        with _cache_lock:
+            cached = _nws_json_cache.get(url)
+        if cached and cached[0] > time.monotonic():
+            logger.info("💾 NWS cache hit: %s", url)
+            return cached[1]
+        return None
+    
+    def fetch():
+        response = (session or nws_session).get(url, timeout=timeout)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        cache_ttl = ttl
+        match = _CACHE_MAX_AGE_PATTERN.search(str(response.headers.get("Cache-Control", "")))
+        if match:
+            cache_ttl = min(cache_ttl, int(match.group(1)))
+        if cache_ttl > 0:
+            now = time.monotonic()
+            with _cache_lock:
+                if len(_nws_json_cache) >= NWS_JSON_CACHE_MAXSIZE:
+                    for key in [k for k, (expires_at, _) in _nws_json_cache.items() if expires_at <= now]:
+                        _nws_json_cache.pop(key, None)
+                    if len(_nws_json_cache) >= NWS_JSON_CACHE_MAXSIZE:
+                        _nws_json_cache.pop(min(_nws_json_cache, key=lambda k: _nws_json_cache[k][0]), None)
+                _nws_json_cache[url] = (now + cache_ttl, data)
+        return data
+    
+    return _single_flight(url, fetch, lookup)
+
+
 @track_tool_call("get_nws_alerts")
 def get_nws_alerts(
     tool_context: ToolContext,
@@ -638,7 +1149,7 @@ def get_nws_alerts(
     """Get active weather alerts from NWS API (real-time).
     
     Args:
-        state (str): Two-letter state code (e.g., "FL")
+        state (str): Two-letter state code or state name (e.g., "FL" or "Florida")
         latitude (float): Latitude for point-based alerts
         longitude (float): Longitude for point-based alerts
         severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
@@ -651,59 +1162,38 @@ def get_nws_alerts(
         if latitude and longitude:
             alerts_url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
         elif state:
-            alerts_url = f"{NWS_API_BASE}/alerts/active?area={state}"
+            alerts_url = f"{NWS_API_BASE}/alerts/active?area={normalize_state_code(state)}"
         else:
             alerts_url = f"{NWS_API_BASE}/alerts/active"
         
-        # Get alerts
-        alerts_response = requests.get(alerts_url, headers=NWS_HEADERS, timeout=10)
-        alerts_response.raise_for_status()
-        alerts_data = alerts_response.json()
+        # Get alerts (reusing a recent fetch of the same URL when available)
+        def fetch_alerts():
+            alerts_response = nws_session.get(alerts_url, timeout=10)
+            alerts_response.raise_for_status()
+            # Nationwide payloads run to several MB; orjson parses the raw body faster than .json()
+            fetched = orjson.loads(alerts_response.content).get("features", [])
+            _cache_alert_features(alerts_url, alerts_response.headers, fetched)
+            return fetched
         
-        # Extract and format alerts
-        alerts = []
-        severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+        features = _single_flight(
+            ("alerts", alerts_url), fetch_alerts, lambda: _get_cached_alert_features(alerts_url)
+        )
         
-        for feature in alerts_data.get("features", []):
-            props = feature.get("properties", {})
-            
-            # Filter by severity if specified
-            if severity and props.get("severity") != severity:
-                continue
-            
-            alert_severity = props.get("severity", "Unknown")
-            severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
-            
-            alerts.append({
-                "event": props.get("event"),
-                "severity": alert_severity,
-                "urgency": props.get("urgency"),
-                "certainty": props.get("certainty"),
-                "headline": props.get("headline"),
-                "description": props.get("description"),
-                "instruction": props.get("instruction"),
-                "onset": props.get("onset"),
-                "expires": props.get("expires"),
-                "affected_zones": props.get("affectedZones", []),
-                "sender_name": props.get("senderName")
-            })
-        
-        # For large alert sets, only return top critical alerts to prevent timeout
+        alerts, severity_counts = _process_alert_features(features, severity)
         total_count = len(alerts)
-        # Sort by severity priority: Extreme > Severe > Moderate > Minor
-        severity_priority = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
-        alerts.sort(key=lambda x: severity_priority.get(x["severity"], 4))
+        
+        timestamp = datetime.now().isoformat()
         
         # Save to state
         tool_context.state["alerts"] = {
             "alerts": alerts,
             "count": total_count,
             "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
-            "limited": total_count > 20
+            "timestamp": timestamp,
+            "limited": False
         }
         
-        logger.info(f"Retrieved {total_count} active alerts, returning {len(alerts)}")
+        logger.info("Retrieved %s active alerts, returning %s", total_count, len(alerts))
         
         return {
             "status": "success",
@@ -711,7 +1201,7 @@ def get_nws_alerts(
             "total_count": total_count,
             "returned_count": len(alerts),
             "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "limited": total_count > 10,
             "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > 10 else None
         }
@@ -724,6 +1214,104 @@ def get_nws_alerts(
         }
 
 
+@track_tool_call("get_nws_alerts_multi")
+async def get_nws_alerts_multi(
+    tool_context: ToolContext,
+    states: list[str],
+    severity: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get active weather alerts for several states at once from NWS API (real-time).
+    
+    All per-state requests are issued concurrently, so the call takes roughly as long
+    as the slowest state rather than the sum of all states.
+    
+    Args:
+        states (list[str]): Two-letter state codes or state names (e.g., ["CA", "Texas", "FL"])
+        severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
+        
+    Returns:
+        dict: Active weather alerts combined across all requested states
+    """
+    try:
+        semaphore = asyncio.Semaphore(NWS_MAX_CONCURRENCY)
+        
+        async def fetch_state_features(client, state_code):
+            url = f"{NWS_API_BASE}/alerts/active?area={state_code}"
+            cached = _get_cached_alert_features(url)
+            if cached is not None:
+                return cached
+            async with semaphore:
+                response = await client.get(url)
+                response.raise_for_status()
+                features = orjson.loads(response.content).get("features", [])
+                _cache_alert_features(url, response.headers, features)
+                return features
+        
+        state_codes = list(dict.fromkeys(normalize_state_code(s) for s in states if s and s.strip()))
+        client = get_nws_async_client()
+        results = await asyncio.gather(
+            *(fetch_state_features(client, code) for code in state_codes),
+            return_exceptions=True
+        )
+        
+        # Combine features, skipping alerts that cover more than one requested state
+        features = []
+        seen_ids = set()
+        failed_states = []
+        for state_code, result in zip(state_codes, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting NWS alerts for {state_code}: {str(result)}")
+                failed_states.append(state_code)
+                continue
+            for feature in result:
+                feature_id = feature.get("id")
+                if feature_id and feature_id in seen_ids:
+                    continue
+                seen_ids.add(feature_id)
+                features.append(feature)
+        
+        if state_codes and len(failed_states) == len(state_codes):
+            return {
+                "status": "error",
+                "message": f"Failed to get alerts for all requested states: {', '.join(failed_states)}"
+            }
+        
+        alerts, severity_counts = _process_alert_features(features, severity)
+        total_count = len(alerts)
+        
+        timestamp = datetime.now().isoformat()
+        
+        # Save to state
+        tool_context.state["alerts"] = {
+            "alerts": alerts,
+            "count": total_count,
+            "severity_breakdown": severity_counts,
+            "states": state_codes,
+            "timestamp": timestamp,
+            "limited": False
+        }
+        
+        logger.info("Retrieved %s active alerts across %s state(s)", total_count, len(state_codes))
+        
+        return {
+            "status": "success",
+            "alerts": alerts,
+            "total_count": total_count,
+            "returned_count": len(alerts),
+            "severity_breakdown": severity_counts,
+            "states": state_codes,
+            "failed_states": failed_states,
+            "timestamp": timestamp
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting NWS alerts for multiple states: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {str(e)}"
+        }
+
+
 @track_tool_call("get_current_conditions")
 def get_current_conditions(
     tool_context: ToolContext,
@@ -740,9 +1328,7 @@ def get_current_conditions(
     try:
         # Get latest observation
         obs_url = f"{NWS_API_BASE}/stations/{station_id}/observations/latest"
-        obs_response = requests.get(obs_url, headers=NWS_HEADERS, timeout=10)
-        obs_response.raise_for_status()
-        obs_data = obs_response.json()
+        obs_data = _get_json_cached(obs_url, NWS_FORECAST_CACHE_TTL)
         
         props = obs_data.get("properties", {})
         
@@ -750,14 +1336,14 @@ def get_current_conditions(
         conditions = {
             "station_id": station_id,
             "timestamp": props.get("timestamp"),
-            "temperature": props.get("temperature", {}).get("value"),
+            "temperature": _quantity_value(props, "temperature"),
             "temperature_unit": "C",  # NWS returns Celsius
-            "dewpoint": props.get("dewpoint", {}).get("value"),
-            "humidity": props.get("relativeHumidity", {}).get("value"),
-            "wind_speed": props.get("windSpeed", {}).get("value"),
-            "wind_direction": props.get("windDirection", {}).get("value"),
-            "barometric_pressure": props.get("barometricPressure", {}).get("value"),
-            "visibility": props.get("visibility", {}).get("value"),
+            "dewpoint": _quantity_value(props, "dewpoint"),
+            "humidity": _quantity_value(props, "relativeHumidity"),
+            "wind_speed": _quantity_value(props, "windSpeed"),
+            "wind_direction": _quantity_value(props, "windDirection"),
+            "barometric_pressure": _quantity_value(props, "barometricPressure"),
+            "visibility": _quantity_value(props, "visibility"),
             "text_description": props.get("textDescription"),
             "raw_message": props.get("rawMessage")
         }
@@ -765,7 +1351,7 @@ def get_current_conditions(
         # Save to state
         tool_context.state["current_conditions"] = conditions
         
-        logger.info(f"Retrieved current conditions for station {station_id}")
+        logger.info("Retrieved current conditions for station %s", station_id)
         
         return {
             "status": "success",
@@ -780,6 +1366,95 @@ def get_current_conditions(
         }
 
 
+def _get_nearest_station_id(latitude: float, longitude: float) -> str:
+    """Return the ID of the NWS observation station nearest to a location.
+    
+    Raises:
+        requests.RequestException: If a lookup request fails
+        ValueError: If NWS lists no observation stations for the location
+    """
+    stations_url = _get_forecast_urls(latitude, longitude).get("observationStations")
+    if not stations_url:
+        raise ValueError(f"No observation stations for {latitude},{longitude}")
+    # The station list is ordered by distance and changes about as rarely as the grid
+    stations = _get_json_cached(stations_url, NWS_POINTS_CACHE_TTL).get("features", [])
+    if not stations:
+        raise ValueError(f"No observation stations for {latitude},{longitude}")
+    return stations[0]["properties"]["stationIdentifier"]
+
+
+@track_tool_call("get_weather_bundle")
+async def get_weather_bundle(
+    tool_context: ToolContext,
+    latitude: float,
+    longitude: float
+) -> Dict[str, Any]:
+    """Get the forecast, active alerts and current conditions for a location in one call.
+    
+    The three lookups run concurrently, so the call takes about as long as the
+    slowest of them instead of their sum.
+    
+    Args:
+        latitude (float): Latitude of location
+        longitude (float): Longitude of location
+        
+    Returns:
+        dict: "forecast", "alerts" and "current_conditions" results, each as returned
+            by get_nws_forecast, get_nws_alerts and get_current_conditions
+    """
+    loop = asyncio.get_running_loop()
+    # ADK's state delta is not thread-safe, so each part records its state writes in
+    # a private dict, copied into the session state once all three have finished
+    part_states = []
+    
+    def run(func, *args):
+        part_context = SimpleNamespace(state={})
+        part_states.append(part_context.state)
+        return loop.run_in_executor(
+            TOOL_EXECUTOR, partial(contextvars.copy_context().run, func, part_context, *args)
+        )
+    
+    def current_conditions(part_context):
+        try:
+            station_id = _get_nearest_station_id(latitude, longitude)
+        except Exception as e:
+            logger.error(f"Error finding observation station: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to find observation station: {str(e)}"
+            }
+        return get_current_conditions(part_context, station_id)
+    
+    forecast, alerts, conditions = await asyncio.gather(
+        run(get_nws_forecast, latitude, longitude),
+        run(get_nws_alerts, None, latitude, longitude),
+        run(current_conditions)
+    )
+    for part_state in part_states:
+        tool_context.state.update(part_state)
+    
+    # Each part reports its own status; the bundle only fails if every part did
+    failed = all(result.get("status") != "success" for result in (forecast, alerts, conditions))
+    return {
+        "status": "error" if failed else "success",
+        "location": f"{latitude},{longitude}",
+        "forecast": forecast,
+        "alerts": alerts,
+        "current_conditions": conditions
+    }
+
+
+# NHC KMZ visualization files, named by uppercase storm ID and advisory number
+NHC_KMZ_BASE = "https://www.nhc.noaa.gov/storm_graphics/api"
+NHC_KMZ_TEMPLATES = (
+    ("cone", "{base}/{storm_id}_{adv}adv_CONE.kmz"),
+    ("track", "{base}/{storm_id}_{adv}adv_TRACK.kmz"),
+    ("warnings", "{base}/{storm_id}_{adv}adv_WW.kmz"),
+    ("initial_radii", "{base}/{storm_id}_initialradii_{adv}adv.kmz"),
+    ("forecast_radii", "{base}/{storm_id}_forecastradii_{adv}adv.kmz"),
+)
+
+
 @track_tool_call("get_hurricane_track")
 def get_hurricane_track(
     tool_context: ToolContext,
@@ -798,9 +1473,7 @@ def get_hurricane_track(
         # Get active tropical cyclones
         active_storms_url = "https://www.nhc.noaa.gov/CurrentStorms.json"
         
-        response = requests.get(active_storms_url, timeout=15)
-        response.raise_for_status()
-        storms_data = response.json()
+        storms_data = _get_json_cached(active_storms_url, NWS_FORECAST_CACHE_TTL, session=nhc_session, timeout=15)
         
         active_storms = []
         
@@ -813,13 +1486,17 @@ def get_hurricane_track(
                 if storm_id and storm_id_val.lower() != storm_id.lower():
                     continue
                 
-                # KMZ URLs need uppercase storm ID
-                storm_id_upper = storm_id_val.upper()
+                public_advisory = storm.get("publicAdvisory")
+                if not isinstance(public_advisory, dict):
+                    public_advisory = {}
+                forecast_advisory = storm.get("forecastAdvisory")
+                if not isinstance(forecast_advisory, dict):
+                    forecast_advisory = {}
                 
-                # Get advisory number for accurate KMZ URLs
-                adv_num = "latest"
-                if "publicAdvisory" in storm and isinstance(storm["publicAdvisory"], dict):
-                    adv_num = storm["publicAdvisory"].get("advNum", "latest")
+                # KMZ URLs need uppercase storm ID and the advisory number
+                adv_num = public_advisory.get("advNum", "latest")
+                storm_id_upper = storm_id_val.upper()
+                shapefile_prefix = f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}"
                 
                 storm_info = {
                     "id": storm_id_val,
@@ -834,18 +1511,15 @@ def get_hurricane_track(
                         "longitude": storm.get("longitudeNumeric")
                     },
                     "last_update": storm.get("lastUpdate"),
-                    "public_advisory_url": storm.get("publicAdvisory", {}).get("url") if isinstance(storm.get("publicAdvisory"), dict) else None,
-                    "forecast_advisory_url": storm.get("forecastAdvisory", {}).get("url") if isinstance(storm.get("forecastAdvisory"), dict) else None,
+                    "public_advisory_url": public_advisory.get("url"),
+                    "forecast_advisory_url": forecast_advisory.get("url"),
                     "wind_graphic_url": storm.get("windFieldGraphic"),
                     "cone_graphic_url": storm.get("trackConeGraphic"),
                     
                     # NHC KMZ files for visualization (use uppercase ID and advisory number)
                     "kmz_files": {
-                        "cone": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_CONE.kmz",
-                        "track": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_TRACK.kmz",
-                        "warnings": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_WW.kmz",
-                        "initial_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_initialradii_{adv_num}adv.kmz",
-                        "forecast_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_forecastradii_{adv_num}adv.kmz"
+                        name: template.format(base=NHC_KMZ_BASE, storm_id=storm_id_upper, adv=adv_num)
+                        for name, template in NHC_KMZ_TEMPLATES
                     },
                     
                     # NHC Graphics page - shows all visualizations
@@ -857,8 +1531,8 @@ def get_hurricane_track(
                     
                     # Shapefile downloads
                     "shapefiles": {
-                        "5day_forecast": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_5day_latest.zip",
-                        "forecast_radii": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_fcst_latest.zip"
+                        "5day_forecast": f"{shapefile_prefix}_5day_latest.zip",
+                        "forecast_radii": f"{shapefile_prefix}_fcst_latest.zip"
                     }
                 }
                 
@@ -869,9 +1543,10 @@ def get_hurricane_track(
                 active_storms.append(storm_info)
         
         # Save to state
+        timestamp = datetime.now().isoformat()
         tool_context.state["hurricane_data"] = {
             "active_storms": active_storms,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         if not active_storms:
@@ -884,44 +1559,184 @@ def get_hurricane_track(
                 }
             }
         
-        logger.info(f"Retrieved {len(active_storms)} active tropical cyclone(s) with KMZ visualization links")
+        logger.info("Retrieved %s active tropical cyclone(s) with KMZ visualization links", len(active_storms))
+        
+        return {
+            "status": "success",
+            "data": {
+                "active_storms": active_storms,
+                "count": len(active_storms),
+                "nhc_url": "https://www.nhc.noaa.gov/",
+                "visualization_note": "KMZ files can be opened in Google Earth or converted to GeoJSON for web mapping",
+                "timestamp": timestamp
+            }
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting hurricane track: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get hurricane data: {str(e)}. Check https://www.nhc.noaa.gov/ for manual updates."
+        }
+
+
+# Google Maps API Configuration
+GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
+GOOGLE_MAPS_BASE = "https://maps.googleapis.com/maps/api"
+# Upper bound on simultaneous Google Maps requests issued by the batched tools
+GOOGLE_MAPS_MAX_CONCURRENCY = 8
+
+# Transient Google Maps gateway errors are retried briefly; API-level failures come
+# back as 200 responses with an error status and are not retried
+GOOGLE_MAPS_RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=["GET"]
+)
+
+# Shared Google Maps connection pool for the synchronous tools
+maps_session = requests.Session()
+maps_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=GOOGLE_MAPS_RETRY))
+atexit.register(maps_session.close)
+
+# Google Maps lookups repeated within a conversation are served from an LRU instead of
+# billing another request. Geocodes are stable for a day; nearby search results carry
+# open_now, so they are kept only briefly.
+GEOCODE_CACHE_TTL = 24 * 60 * 60
+PLACES_CACHE_TTL = 10 * 60
+MAPS_CACHE_MAXSIZE = 1024
+_maps_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def _get_cached_maps_result(key: tuple):
+    """Return a cached Google Maps lookup result, or None if missing or expired."""
+    with _cache_lock:
+        cached = _maps_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            _maps_cache.pop(key, None)
+            return None
+        _maps_cache.move_to_end(key)
+        return cached[1]
+
+
+def _cache_maps_result(key: tuple, result, ttl: int) -> None:
+    """Cache a Google Maps lookup result, evicting the least recently used entry when full."""
+    with _cache_lock:
+        _maps_cache[key] = (time.monotonic() + ttl, result)
+        _maps_cache.move_to_end(key)
+        while len(_maps_cache) > MAPS_CACHE_MAXSIZE:
+            _maps_cache.popitem(last=False)
+
+
+def get_maps_async_client() -> httpx.AsyncClient:
+    """Return the shared HTTP/2 Google Maps client for the running event loop."""
+    return _get_async_client("maps", lambda: httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    ))
+
+
+def _geocode_cache_key(address: str) -> tuple:
+    """Return the geocode cache key for an address, ignoring case and extra whitespace."""
+    return ("geocode", " ".join(address.lower().split()))
+
+
+def _extract_geocode(data: dict) -> Dict[str, Any]:
+    """Extract the first result of a successful Google Maps Geocoding API response."""
+    result = data["results"][0]
+    location = result["geometry"]["location"]
+    return {
+        "formatted_address": result["formatted_address"],
+        "latitude": location["lat"],
+        "longitude": location["lng"],
+        "place_id": result["place_id"],
+        "types": result.get("types", []),
+        "partial_match": result.get("partial_match", False)
+    }
+
+
+@track_tool_call("geocode_address")
+def geocode_address(
+    tool_context: ToolContext,
+    address: str
+) -> Dict[str, Any]:
+    """Geocode an address to latitude/longitude coordinates using Google Maps Geocoding API.
+    
+    Args:
+        address (str): Address to geocode (e.g., "1600 Amphitheatre Parkway, Mountain View, CA")
+        
+    Returns:
+        dict: Geocoding results with coordinates and formatted address
+    """
+    try:
+        if not GOOGLE_MAPS_API_KEY:
+            return {
+                "status": "error",
+                "message": "GOOGLE_MAPS_API_KEY not configured"
+            }
+        
+        cache_key = _geocode_cache_key(address)
+        geocoded = _get_cached_maps_result(cache_key)
+        if geocoded is None:
+            # Call Google Maps Geocoding API
+            geocode_url = f"{GOOGLE_MAPS_BASE}/geocode/json"
+            params = {
+                "address": address,
+                "key": GOOGLE_MAPS_API_KEY
+            }
+            
+            response = maps_session.get(geocode_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            if data["status"] != "OK":
+                return {
+                    "status": "error",
+                    "message": f"Geocoding failed: {data.get('status')}"
+                }
+            
+            geocoded = _extract_geocode(data)
+            _cache_maps_result(cache_key, geocoded, GEOCODE_CACHE_TTL)
+        
+        geocode_result = {"address": address, **geocoded}
+        
+        # Save to state
+        tool_context.state["geocode_result"] = geocode_result
+        
+        logger.info("Geocoded address: %s -> %s,%s", address, geocoded['latitude'], geocoded['longitude'])
         
         return {
             "status": "success",
-            "data": {
-                "active_storms": active_storms,
-                "count": len(active_storms),
-                "nhc_url": "https://www.nhc.noaa.gov/",
-                "visualization_note": "KMZ files can be opened in Google Earth or converted to GeoJSON for web mapping",
-                "timestamp": datetime.now().isoformat()
-            }
+            "result": geocode_result
         }
     
     except Exception as e:
-        logger.error(f"Error getting hurricane track: {str(e)}")
+        logger.error(f"Error geocoding address: {str(e)}")
         return {
             "status": "error",
-            "message": f"Failed to get hurricane data: {str(e)}. Check https://www.nhc.noaa.gov/ for manual updates."
+            "message": f"Failed to geocode address: {str(e)}"
         }
 
 
-# Google Maps API Configuration
-GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
-GOOGLE_MAPS_BASE = "https://maps.googleapis.com/maps/api"
-
-
-@track_tool_call("geocode_address")
-def geocode_address(
+@track_tool_call("geocode_addresses")
+async def geocode_addresses(
     tool_context: ToolContext,
-    address: str
+    addresses: list[str]
 ) -> Dict[str, Any]:
-    """Geocode an address to latitude/longitude coordinates using Google Maps Geocoding API.
+    """Geocode several addresses at once using Google Maps Geocoding API.
+    
+    All addresses are requested concurrently, so the call takes roughly as long as
+    a single geocode_address call.
     
     Args:
-        address (str): Address to geocode (e.g., "1600 Amphitheatre Parkway, Mountain View, CA")
+        addresses (list[str]): Addresses to geocode
         
     Returns:
-        dict: Geocoding results with coordinates and formatted address
+        dict: Geocoding results for each address, in the order given
     """
     try:
         if not GOOGLE_MAPS_API_KEY:
@@ -930,54 +1745,84 @@ def geocode_address(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Geocoding API
         geocode_url = f"{GOOGLE_MAPS_BASE}/geocode/json"
-        params = {
-            "address": address,
-            "key": GOOGLE_MAPS_API_KEY
-        }
-        
-        response = requests.get(geocode_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] != "OK":
-            return {
-                "status": "error",
-                "message": f"Geocoding failed: {data.get('status')}"
-            }
-        
-        # Extract first result
-        result = data["results"][0]
-        location = result["geometry"]["location"]
-        
-        geocode_result = {
-            "address": address,
-            "formatted_address": result["formatted_address"],
-            "latitude": location["lat"],
-            "longitude": location["lng"],
-            "place_id": result["place_id"],
-            "types": result.get("types", [])
-        }
+        semaphore = asyncio.Semaphore(GOOGLE_MAPS_MAX_CONCURRENCY)
+        
+        async def fetch_geocode(client, address):
+            cache_key = _geocode_cache_key(address)
+            cached = _get_cached_maps_result(cache_key)
+            if cached is not None:
+                return cached
+            async with semaphore:
+                response = await client.get(geocode_url, params={
+                    "address": address,
+                    "key": GOOGLE_MAPS_API_KEY
+                })
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if data["status"] != "OK":
+                raise ValueError(f"Geocoding failed: {data.get('status')}")
+            geocoded = _extract_geocode(data)
+            _cache_maps_result(cache_key, geocoded, GEOCODE_CACHE_TTL)
+            return geocoded
+        
+        client = get_maps_async_client()
+        results = await asyncio.gather(
+            *(fetch_geocode(client, address) for address in addresses),
+            return_exceptions=True
+        )
+        
+        geocode_results = []
+        for address, result in zip(addresses, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error geocoding address {address}: {str(result)}")
+                geocode_results.append({"address": address, "status": "error", "message": str(result)})
+            else:
+                geocode_results.append({"address": address, "status": "success", **result})
         
         # Save to state
-        tool_context.state["geocode_result"] = geocode_result
+        tool_context.state["geocode_results"] = geocode_results
         
-        logger.info(f"Geocoded address: {address} -> {location['lat']},{location['lng']}")
+        logger.info("Geocoded %s addresses", len(addresses))
         
         return {
             "status": "success",
-            "result": geocode_result
+            "results": geocode_results
         }
     
     except Exception as e:
-        logger.error(f"Error geocoding address: {str(e)}")
+        logger.error(f"Error geocoding addresses: {str(e)}")
         return {
             "status": "error",
-            "message": f"Failed to geocode address: {str(e)}"
+            "message": f"Failed to geocode addresses: {str(e)}"
         }
 
 
+def _extract_routes(data: dict) -> list:
+    """Extract route summaries from a Google Maps Directions API response."""
+    routes = []
+    for route in data["routes"]:
+        leg = route["legs"][0]  # First leg
+        routes.append({
+            "summary": route.get("summary", "Route"),
+            "distance": leg["distance"]["text"],
+            "distance_meters": leg["distance"]["value"],
+            "duration": leg["duration"]["text"],
+            "duration_seconds": leg["duration"]["value"],
+            "start_address": leg["start_address"],
+            "end_address": leg["end_address"],
+            "steps": [
+                {
+                    "instruction": step["html_instructions"],
+                    "distance": step["distance"]["text"],
+                    "duration": step["duration"]["text"]
+                }
+                for step in leg["steps"][:5]  # First 5 steps only
+            ]
+        })
+    return routes
+
+
 @track_tool_call("get_directions")
 def get_directions(
     tool_context: ToolContext,
@@ -1014,9 +1859,9 @@ def get_directions(
             "key": GOOGLE_MAPS_API_KEY
         }
         
-        response = requests.get(directions_url, params=params, timeout=10)
+        response = maps_session.get(directions_url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if data["status"] != "OK":
             return {
@@ -1025,26 +1870,7 @@ def get_directions(
             }
         
         # Extract routes
-        routes = []
-        for route in data["routes"]:
-            leg = route["legs"][0]  # First leg
-            routes.append({
-                "summary": route.get("summary", "Route"),
-                "distance": leg["distance"]["text"],
-                "distance_meters": leg["distance"]["value"],
-                "duration": leg["duration"]["text"],
-                "duration_seconds": leg["duration"]["value"],
-                "start_address": leg["start_address"],
-                "end_address": leg["end_address"],
-                "steps": [
-                    {
-                        "instruction": step["html_instructions"],
-                        "distance": step["distance"]["text"],
-                        "duration": step["duration"]["text"]
-                    }
-                    for step in leg["steps"][:5]  # First 5 steps only
-                ]
-            })
+        routes = _extract_routes(data)
         
         directions_result = {
             "origin": origin,
@@ -1056,7 +1882,7 @@ def get_directions(
         # Save to state
         tool_context.state["directions"] = directions_result
         
-        logger.info(f"Got directions: {origin} -> {destination}, {len(routes)} routes")
+        logger.info("Got directions: %s -> %s, %s routes", origin, destination, len(routes))
         
         return {
             "status": "success",
@@ -1071,6 +1897,91 @@ def get_directions(
         }
 
 
+@track_tool_call("get_directions_batch")
+async def get_directions_batch(
+    tool_context: ToolContext,
+    origin: str,
+    destinations: list[str],
+    mode: str = "driving",
+    alternatives: bool = True
+) -> Dict[str, Any]:
+    """Get directions from one origin to several destinations at once using Google Maps Directions API.
+    
+    All destinations are requested concurrently, so the call takes roughly as long as
+    a single get_directions call.
+    
+    Args:
+        origin (str): Starting location (address or "lat,lng")
+        destinations (list[str]): Ending locations (addresses or "lat,lng")
+        mode (str): Travel mode - "driving", "walking", "bicycling", "transit"
+        alternatives (bool): Whether to return alternative routes
+        
+    Returns:
+        dict: Directions for each destination with routes, distances, and travel times
+    """
+    try:
+        if not GOOGLE_MAPS_API_KEY:
+            return {
+                "status": "error",
+                "message": "GOOGLE_MAPS_API_KEY not configured"
+            }
+        
+        directions_url = f"{GOOGLE_MAPS_BASE}/directions/json"
+        semaphore = asyncio.Semaphore(GOOGLE_MAPS_MAX_CONCURRENCY)
+        
+        async def fetch_directions(client, destination):
+            async with semaphore:
+                response = await client.get(directions_url, params={
+                    "origin": origin,
+                    "destination": destination,
+                    "mode": mode,
+                    "alternatives": str(alternatives).lower(),
+                    "key": GOOGLE_MAPS_API_KEY
+                })
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if data["status"] != "OK":
+                raise ValueError(f"Directions failed: {data.get('status')}")
+            return _extract_routes(data)
+        
+        client = get_maps_async_client()
+        results = await asyncio.gather(
+            *(fetch_directions(client, destination) for destination in destinations),
+            return_exceptions=True
+        )
+        
+        directions = []
+        for destination, result in zip(destinations, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting directions {origin} -> {destination}: {str(result)}")
+                directions.append({"destination": destination, "status": "error", "message": str(result)})
+            else:
+                directions.append({"destination": destination, "status": "success", "routes": result})
+        
+        directions_result = {
+            "origin": origin,
+            "mode": mode,
+            "directions": directions
+        }
+        
+        # Save to state
+        tool_context.state["directions_batch"] = directions_result
+        
+        logger.info("Got directions from %s to %s destinations", origin, len(destinations))
+        
+        return {
+            "status": "success",
+            "result": directions_result
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting batch directions: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get directions: {str(e)}"
+        }
+
+
 @track_tool_call("search_nearby_places")
 def search_nearby_places(
     tool_context: ToolContext,
@@ -1097,40 +2008,44 @@ def search_nearby_places(
                 "message": "GOOGLE_MAPS_API_KEY not configured"
             }
         
-        # Call Google Maps Places Nearby Search API
-        places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
-        params = {
-            "location": location,
-            "radius": radius,
-            "type": place_type,
-            "key": GOOGLE_MAPS_API_KEY
-        }
-        
-        if keyword:
-            params["keyword"] = keyword
-        
-        response = requests.get(places_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] not in ["OK", "ZERO_RESULTS"]:
-            return {
-                "status": "error",
-                "message": f"Places search failed: {data.get('status')}"
+        cache_key = ("places", location, place_type, radius, keyword)
+        places = _get_cached_maps_result(cache_key)
+        if places is None:
+            # Call Google Maps Places Nearby Search API
+            places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
+            params = {
+                "location": location,
+                "radius": radius,
+                "type": place_type,
+                "key": GOOGLE_MAPS_API_KEY
             }
-        
-        # Extract places
-        places = []
-        for place in data.get("results", [])[:10]:  # Limit to 10 results
-            places.append({
-                "name": place.get("name"),
-                "address": place.get("vicinity"),
-                "location": place["geometry"]["location"],
-                "place_id": place.get("place_id"),
-                "types": place.get("types", []),
-                "rating": place.get("rating"),
-                "open_now": place.get("opening_hours", {}).get("open_now")
-            })
+            
+            if keyword:
+                params["keyword"] = keyword
+            
+            response = maps_session.get(places_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            if data["status"] not in ["OK", "ZERO_RESULTS"]:
+                return {
+                    "status": "error",
+                    "message": f"Places search failed: {data.get('status')}"
+                }
+            
+            # Extract places
+            places = []
+            for place in data.get("results", [])[:10]:  # Limit to 10 results
+                places.append({
+                    "name": place.get("name"),
+                    "address": place.get("vicinity"),
+                    "location": place["geometry"]["location"],
+                    "place_id": place.get("place_id"),
+                    "types": place.get("types", []),
+                    "rating": place.get("rating"),
+                    "open_now": place.get("opening_hours", {}).get("open_now")
+                })
+            _cache_maps_result(cache_key, places, PLACES_CACHE_TTL)
         
         search_result = {
             "location": location,
@@ -1144,7 +2059,7 @@ def search_nearby_places(
         # Save to state
         tool_context.state["nearby_places"] = search_result
         
-        logger.info(f"Found {len(places)} places of type '{place_type}' near {location}")
+        logger.info("Found %s places of type '%s' near %s", len(places), place_type, location)
         
         return {
             "status": "success",
@@ -1159,21 +2074,160 @@ def search_nearby_places(
         }
 
 
+async def get_place_phone(place_id: str, client: httpx.AsyncClient) -> Optional[str]:
+    """Get the phone number of a single place from the Places Details API.
+    
+    Only the formatted_phone_number field is requested, so the response is billed
+    and parsed as a minimal Details call.
+    
+    Args:
+        place_id (str): Google place ID.
+        client (httpx.AsyncClient): Client used for the request.
+        
+    Returns:
+        str: Formatted phone number, or None if the place has none listed
+    """
+    response = await client.get(f"{GOOGLE_MAPS_BASE}/place/details/json", params={
+        "place_id": place_id,
+        "fields": "formatted_phone_number",
+        "key": GOOGLE_MAPS_API_KEY
+    })
+    response.raise_for_status()
+    return orjson.loads(response.content).get("result", {}).get("formatted_phone_number")
+
+
+async def fetch_place_phone_numbers(place_ids: list[str]) -> Dict[str, Optional[str]]:
+    """Fetch phone numbers for several places concurrently from the Places Details API.
+    
+    Args:
+        place_ids (list[str]): Google place IDs to look up.
+        
+    Returns:
+        dict: Phone number per place ID (None when not listed or the lookup failed)
+    """
+    if not GOOGLE_MAPS_API_KEY or not place_ids:
+        return {}
+    
+    semaphore = asyncio.Semaphore(GOOGLE_MAPS_MAX_CONCURRENCY)
+    
+    async def fetch_phone(client, place_id):
+        async with semaphore:
+            return await get_place_phone(place_id, client)
+    
+    client = get_maps_async_client()
+    results = await asyncio.gather(
+        *(fetch_phone(client, place_id) for place_id in place_ids),
+        return_exceptions=True
+    )
+    
+    phone_numbers = {}
+    for place_id, result in zip(place_ids, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error getting phone number for place {place_id}: {str(result)}")
+            result = None
+        phone_numbers[place_id] = result
+    
+    logger.info("Found phone numbers for %s of %s places", sum(1 for phone in phone_numbers.values() if phone), len(phone_numbers))
+    return phone_numbers
+
+
+@track_tool_call("get_place_phone_numbers")
+async def get_place_phone_numbers(
+    tool_context: ToolContext,
+    place_ids: Optional[list[str]] = None
+) -> Dict[str, Any]:
+    """Look up phone numbers for several places at once using Google Maps Places Details API.
+    
+    All lookups are issued concurrently, so the call takes roughly one API round trip
+    regardless of how many places are enriched.
+    
+    Args:
+        place_ids (list[str]): Google place IDs to look up. Defaults to the places
+            found by the most recent search_nearby_places call.
+        
+    Returns:
+        dict: Places with their phone numbers (None when no number is listed)
+    """
+    try:
+        if not GOOGLE_MAPS_API_KEY:
+            return {
+                "status": "error",
+                "message": "GOOGLE_MAPS_API_KEY not configured"
+            }
+        
+        saved_search = tool_context.state.get("nearby_places") or {}
+        nearby_places = saved_search.get("places", [])
+        if place_ids is None:
+            place_ids = [place["place_id"] for place in nearby_places if place.get("place_id")]
+        
+        phone_numbers = await fetch_place_phone_numbers(place_ids)
+        
+        # Enrich the saved search results so later steps see the phone numbers
+        if nearby_places:
+            tool_context.state["nearby_places"] = {
+                **saved_search,
+                "places": [
+                    {**place, "phone": phone_numbers.get(place.get("place_id"), place.get("phone"))}
+                    for place in nearby_places
+                ]
+            }
+        
+        places = [
+            {"place_id": place_id, "phone": phone}
+            for place_id, phone in phone_numbers.items()
+        ]
+        
+        return {
+            "status": "success",
+            "places": places,
+            "count": len(places)
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting place phone numbers: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get phone numbers: {str(e)}"
+        }
+
+
+def _fit_map_view(markers: list) -> tuple:
+    """Compute the center and a zoom level that shows all markers.
+    
+    Returns:
+        tuple: (center_lat, center_lng, zoom), or (None, None, None) if no marker has coordinates
+    """
+    points = [
+        (marker["lat"], marker["lng"]) for marker in markers
+        if marker.get("lat") is not None and marker.get("lng") is not None
+    ]
+    if not points:
+        return None, None, None
+    
+    lats = [lat for lat, _ in points]
+    lngs = [lng for _, lng in points]
+    span = max(max(lats) - min(lats), max(lngs) - min(lngs))
+    zoom = min(12, max(3, round(8 - math.log2(span + 1e-3))))
+    return (min(lats) + max(lats)) / 2, (min(lngs) + max(lngs)) / 2, zoom
+
+
 @track_tool_call("generate_map")
 def generate_map(
     tool_context: ToolContext,
-    center_lat: float,
-    center_lng: float,
-    zoom: int = 12,
+    center_lat: Optional[float] = None,
+    center_lng: Optional[float] = None,
+    zoom: Optional[int] = None,
     markers: Optional[list] = None,
     title: str = "Map"
 ) -> Dict[str, Any]:
     """Generate a Google Maps URL with markers for visualization.
     
+    Center and zoom are computed from the markers when not given.
+    
     Args:
-        center_lat (float): Latitude for map center
-        center_lng (float): Longitude for map center
-        zoom (int): Zoom level (1-20, default 12)
+        center_lat (float): Latitude for map center (default: center of the markers)
+        center_lng (float): Longitude for map center (default: center of the markers)
+        zoom (int): Zoom level (1-20, default: fit all markers, or 12 without markers)
         markers (list): Optional list of marker dicts with 'lat', 'lng', 'title', 'color'
         title (str): Title for the map
         
@@ -1181,10 +2235,24 @@ def generate_map(
         dict: Google Maps URL and marker information with structured marker data
     """
     try:
+        if center_lat is None or center_lng is None or zoom is None:
+            fit_lat, fit_lng, fit_zoom = _fit_map_view(markers or [])
+            center_lat = fit_lat if center_lat is None else center_lat
+            center_lng = fit_lng if center_lng is None else center_lng
+            zoom = (fit_zoom or 12) if zoom is None else zoom
+        
+        if center_lat is None or center_lng is None:
+            return {
+                "status": "error",
+                "message": "Provide center_lat and center_lng or at least one marker with coordinates"
+            }
+        
+        markers = markers or []
+        
         # Build Google Maps URL with markers
         # For multiple markers, use the directions API format with waypoints
         
-        if markers and len(markers) > 0:
+        if markers:
             # Build a URL that shows all markers
             # Format: https://www.google.com/maps/dir/?api=1&destination=lat,lng&waypoints=lat1,lng1|lat2,lng2
             
@@ -1193,33 +2261,34 @@ def generate_map(
             dest_lat = first_marker.get('lat', center_lat)
             dest_lng = first_marker.get('lng', center_lng)
             
-            # Build waypoints from remaining markers (up to 9 waypoints max for Google Maps)
-            waypoints = []
-            for marker in markers[1:9]:  # Limit to 8 additional waypoints
-                lat = marker.get('lat')
-                lng = marker.get('lng')
-                if lat and lng:
-                    waypoints.append(f"{lat},{lng}")
+            # Build waypoints from remaining markers (limit to 8 additional waypoints for Google Maps)
+            waypoints = "|".join(
+                f"{marker['lat']},{marker['lng']}"
+                for marker in markers[1:9]
+                if marker.get('lat') and marker.get('lng')
+            )
             
-            # Construct the URL
-            map_url = f"https://www.google.com/maps/dir/?api=1&destination={dest_lat},{dest_lng}"
+            # Construct the URL, percent-encoding everything but the coordinate separators
+            params = {"api": 1, "destination": f"{dest_lat},{dest_lng}"}
             if waypoints:
-                map_url += f"&waypoints={('|').join(waypoints)}"
-            map_url += "&travelmode=driving"
+                params["waypoints"] = waypoints
+            params["travelmode"] = "driving"
+            map_url = "https://www.google.com/maps/dir/?" + urlencode(params, safe="|,")
         else:
             # No markers, just center location
-            map_url = f"https://www.google.com/maps/search/?api=1&query={center_lat},{center_lng}&zoom={zoom}"
+            params = {"api": 1, "query": f"{center_lat},{center_lng}", "zoom": zoom}
+            map_url = "https://www.google.com/maps/search/?" + urlencode(params, safe=",")
         
         # Store map data in state with structured markers for frontend
-        structured_markers = []
-        if markers:
-            for marker in markers:
-                structured_markers.append({
-                    "lat": marker.get('lat'),
-                    "lng": marker.get('lng'),
-                    "title": marker.get('title', 'Location'),
-                    "address": marker.get('address', '')
-                })
+        structured_markers = [
+            {
+                "lat": marker.get('lat'),
+                "lng": marker.get('lng'),
+                "title": marker.get('title', 'Location'),
+                "address": marker.get('address', '')
+            }
+            for marker in markers
+        ]
         
         tool_context.state["map_data"] = {
             "center": {"lat": center_lat, "lng": center_lng},
@@ -1229,20 +2298,17 @@ def generate_map(
         }
         
         # Build marker summary for agent response
-        marker_summary = []
-        if markers:
-            for i, marker in enumerate(markers, 1):
-                title = marker.get('title', f'Location {i}')
-                lat = marker.get('lat')
-                lng = marker.get('lng')
-                marker_summary.append(f"{i}. {title} ({lat}, {lng})")
+        marker_summary = [
+            f"{i}. {marker.get('title', f'Location {i}')} ({structured['lat']}, {structured['lng']})"
+            for i, (marker, structured) in enumerate(zip(markers, structured_markers), 1)
+        ]
         
-        logger.info(f"Generated map URL centered at ({center_lat}, {center_lng}) with {len(markers or [])} markers")
+        logger.info("Generated map URL centered at (%s, %s) with %s markers", center_lat, center_lng, len(markers))
         
         # Return structured data that frontend can parse
         return {
             "status": "success",
-            "message": f"Generated map with {len(markers or [])} marker(s)",
+            "message": f"Generated map with {len(markers)} marker(s)",
             "map_url": map_url,
             "center": {"lat": center_lat, "lng": center_lng},
             "zoom": zoom,
@@ -1280,59 +2346,21 @@ def get_census_tracts_in_area(
         dict: Census tract data with demographics including elderly population percentages
     """
     try:
-        # Build query for census tracts with demographic data
-        # Note: This table doesn't have lat/lon columns, only geo_id
-        query = """
-        SELECT 
-            geo_id,
-            total_pop,
-            (male_65_to_66 + female_65_to_66) as pop_65_over,
-            SAFE_DIVIDE((male_65_to_66 + female_65_to_66), total_pop) * 100 as elderly_percentage,
-            median_income,
-            households,
-            housing_units,
-            poverty as pop_below_poverty,
-            SAFE_DIVIDE(poverty, pop_determined_poverty_status) * 100 as poverty_rate
-        FROM `bigquery-public-data.census_bureau_acs.censustract_2020_5yr`
-        WHERE SUBSTR(geo_id, 1, 2) = @state
-        """
-        
-        query_params = [
-            bigquery.ScalarQueryParameter("state", "STRING", state)
-        ]
-        
-        # Add county filter if provided (match by geo_id prefix: state + county)
-        if county:
-            query += " AND SUBSTR(geo_id, 3, 3) = @county"
-            query_params.append(bigquery.ScalarQueryParameter("county", "STRING", county.zfill(3)))
-        
         # Note: Bounding box filtering not available without lat/lon columns
         # Would need to join with a geography table for coordinate-based filtering
         
-        query += " AND total_pop > 0 ORDER BY elderly_percentage DESC LIMIT 100"
+        # An empty county matches every county in the state
+        results = _run_query(_CENSUS_TRACTS_SQL, state=state, county=county.zfill(3) if county else "")
         
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
-        
-        census_tracts = []
-        for row in results:
-            census_tracts.append({
-                "geo_id": row.geo_id,
-                "state_code": row.geo_id[:2] if row.geo_id else None,
-                "county_code": row.geo_id[2:5] if row.geo_id and len(row.geo_id) >= 5 else None,
-                "tract_code": row.geo_id[5:] if row.geo_id and len(row.geo_id) > 5 else None,
-                "total_population": row.total_pop,
-                "elderly_population": row.pop_65_over,
-                "elderly_percentage": round(row.elderly_percentage, 2) if row.elderly_percentage else 0,
-                "median_income": row.median_income,
-                "households": row.households,
-                "housing_units": row.housing_units,
-                "population_below_poverty": row.pop_below_poverty,
-                "poverty_rate": round(row.poverty_rate, 2) if row.poverty_rate else 0,
+        # Columns are already named, split and rounded by the query
+        census_tracts = [
+            {
+                **dict(row.items()),
                 "latitude": None,  # Not available in this table
                 "longitude": None  # Not available in this table
-            })
+            }
+            for row in results
+        ]
         
         # Save to state
         tool_context.state["census_tracts"] = {
@@ -1351,7 +2379,7 @@ def get_census_tracts_in_area(
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"Retrieved {len(census_tracts)} census tracts for {state}")
+        logger.info("Retrieved %s census tracts for %s", len(census_tracts), state)
         
         return {
             "status": "success",
@@ -1388,56 +2416,25 @@ def get_flood_risk_data(
         dict: Flood risk information and historical flooding events
     """
     try:
-        # Query NOAA historical weather data for flooding events
-        # Join with stations table to filter by state
-        query = """
-        SELECT 
-            w.date,
-            w.stn AS station_id,
-            s.name AS station_name,
-            s.lat AS latitude,
-            s.lon AS longitude,
-            w.prcp AS precipitation,
-            w.temp AS temperature
-        FROM `bigquery-public-data.noaa_gsod.gsod*` w
-        JOIN `bigquery-public-data.noaa_gsod.stations` s
-        ON w.stn = s.usaf AND w.wban = s.wban
-        WHERE s.state = @state
-        AND w.prcp IS NOT NULL
-        AND w.prcp > 5.0  -- Heavy precipitation (> 5 inches) indicating potential flooding
-        AND _TABLE_SUFFIX BETWEEN '2015' AND '2024'
-        ORDER BY w.date DESC, w.prcp DESC
-        LIMIT 100
-        """
-        
-        query_params = [
-            bigquery.ScalarQueryParameter("state", "STRING", state)
+        # The last FLOOD_HISTORY_YEARS yearly tables, through the current year
+        end_year = datetime.now().year
+        start_year = end_year - FLOOD_HISTORY_YEARS + 1
+        
+        # Rows come back already shaped as flood event dicts
+        flood_events = [
+            dict(row.items())
+            for row in _run_query(_FLOOD_EVENTS_SQL, state=state, start_year=str(start_year), end_year=str(end_year))
         ]
         
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
-        
-        flood_events = []
-        for row in results:
-            flood_events.append({
-                "date": str(row.date),
-                "station_id": row.station_id,
-                "station_name": row.station_name,
-                "latitude": row.latitude,
-                "longitude": row.longitude,
-                "precipitation_inches": round(row.precipitation, 2) if row.precipitation else 0,
-                "temperature_f": round(row.temperature, 1) if row.temperature else None,
-                "severity": "Major" if row.precipitation and row.precipitation > 10 else "Moderate",
-                "state": state  # Add state to each event for tracking
-            })
-        
         # ACCUMULATE data across multiple states instead of overwriting
         existing_data = tool_context.state.get("flood_risk_data", {})
         existing_events = existing_data.get("historical_events", [])
         
-        # Combine new events with existing events
-        all_events = existing_events + flood_events
+        # Combine new events with existing events, skipping ones already accumulated
+        # (the same state can be queried more than once in a session)
+        seen = {(e.get("state"), e.get("station_id"), e.get("date")) for e in existing_events}
+        new_events = [e for e in flood_events if (e["state"], e["station_id"], e["date"]) not in seen]
+        all_events = existing_events + new_events
         
         # Track which states have been processed
         processed_states = existing_data.get("processed_states", [])
@@ -1455,14 +2452,14 @@ def get_flood_risk_data(
             "note": "Based on historical precipitation data. For detailed FEMA flood zones, integrate with National Flood Hazard Layer API."
         }
         
-        logger.info(f"Retrieved {len(flood_events)} historical flood events for {state}. Total accumulated: {len(all_events)} events across {len(processed_states)} state(s)")
+        logger.info("Retrieved %s historical flood events for %s. Total accumulated: %s events across %s state(s)", len(flood_events), state, len(all_events), len(processed_states))
         
         return {
             "status": "success",
             "data": {
                 "historical_flood_events": flood_events,
                 "count": len(flood_events),
-                "summary": f"Found {len(flood_events)} historical high-precipitation events in {state} (2015-2024)",
+                "summary": f"Found {len(flood_events)} historical high-precipitation events in {state} ({start_year}-{end_year})",
                 "note": "Events with >5 inches precipitation indicating potential flooding"
             }
         }
@@ -1475,13 +2472,44 @@ def get_flood_risk_data(
         }
 
 
+def _ring_centroid(ring: list) -> Optional[Dict[str, float]]:
+    """Return the area-weighted centroid of a GeoJSON linear ring, or None if it is empty.
+    
+    Uses the shoelace formula in a single pass over the vertices, so unevenly spaced
+    vertices (e.g. a detailed coastline) do not pull the centroid toward them. Rings
+    with no area fall back to the mean of their vertices.
+    """
+    if not ring:
+        return None
+    
+    area2 = cx = cy = 0.0
+    x0, y0 = ring[-1][0], ring[-1][1]
+    for point in ring:
+        x1, y1 = point[0], point[1]
+        cross = x0 * y1 - x1 * y0
+        area2 += cross
+        cx += (x0 + x1) * cross
+        cy += (y0 + y1) * cross
+        x0, y0 = x1, y1
+    
+    if abs(area2) < 1e-12:
+        return {
+            "lon": sum(point[0] for point in ring) / len(ring),
+            "lat": sum(point[1] for point in ring) / len(ring)
+        }
+    return {"lon": cx / (3 * area2), "lat": cy / (3 * area2)}
+
+
 @track_tool_call("get_zone_coordinates")
-def get_zone_coordinates(
+async def get_zone_coordinates(
     tool_context: ToolContext,
     zone_ids: list[str]
 ) -> Dict[str, Any]:
     """Get geographic coordinates for NWS zone IDs.
     
+    All zones are looked up concurrently, so the call takes roughly one NWS round
+    trip instead of one per zone.
+    
     Supports multiple zone types:
     - Forecast zones (e.g., FLZ069, TXZ123)
     - County zones (e.g., FLC073, TXC209)
@@ -1494,23 +2522,10 @@ def get_zone_coordinates(
         dict: Coordinates for each zone with status
     """
     try:
-        zone_coords = []
-        
         # Determine zone type based on the third character
         def get_zone_type(zone_id):
-            """Determine the zone type from the zone ID."""
-            if len(zone_id) < 3:
-                return "forecast"  # Default
-            
-            type_char = zone_id[2].upper()
-            if type_char == 'Z':
-                return "forecast"
-            elif type_char == 'C':
-                return "county"
-            elif type_char == 'F':
-                return "fire"
-            else:
-                return "forecast"  # Default fallback
+            """Determine the NWS zones endpoint segment from the zone ID."""
+            return NWS_ZONE_TYPES.get(zone_id[2:3].upper(), "forecast")
         
         def extract_geometry_centroid(geometry):
             """Extract centroid from geometry object."""
@@ -1520,69 +2535,63 @@ def get_zone_coordinates(
             geom_type = geometry.get("type")
             
             if geom_type == "Polygon":
-                coords = geometry.get("coordinates", [[]])[0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
+                return _ring_centroid(geometry.get("coordinates", [[]])[0])
             elif geom_type == "MultiPolygon":
                 # Use first polygon
-                coords = geometry.get("coordinates", [[[]]])[0][0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
+                return _ring_centroid(geometry.get("coordinates", [[[]]])[0][0])
             
             return None
         
-        for zone_id in zone_ids:
+        semaphore = asyncio.Semaphore(NWS_MAX_CONCURRENCY)
+        
+        async def fetch_zone(client, zone_id):
+            """Fetch one zone from its typed endpoint; None if it cannot be located."""
+            cached = _get_cached_zone_coordinates(zone_id)
+            if cached:
+                return cached
             try:
                 zone_type = get_zone_type(zone_id)
                 
-                # Try different endpoints based on zone type
-                endpoints = [
-                    f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}",
-                    f"{NWS_API_BASE}/zones/forecast/{zone_id}",  # Fallback
-                    f"{NWS_API_BASE}/zones/county/{zone_id}",    # Fallback
-                ]
+                # Zone outlines rarely change: revalidate an expired entry by ETag, so an
+                # unchanged zone comes back as a bodyless 304 with no polygon to parse
+                stale, etag = _get_stale_zone_coordinates(zone_id)
+                headers = {"If-None-Match": etag} if etag else None
                 
-                data = None
-                for url in endpoints:
-                    try:
-                        response = requests.get(url, headers=NWS_HEADERS, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            break
-                    except:
-                        continue
+                # The zone ID's type letter determines its endpoint, so one request suffices
+                async with semaphore:
+                    response = await client.get(f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}", headers=headers)
+                if response.status_code == 304 and stale:
+                    _cache_zone_coordinates(zone_id, stale, etag)
+                    return stale
+                if response.status_code != 200:
+                    logger.warning("Failed to get coordinates for %s zone %s: HTTP %s", zone_type, zone_id, response.status_code)
+                    return None
+                data = orjson.loads(response.content)
                 
-                if data:
-                    geometry = data.get("geometry")
-                    centroid = extract_geometry_centroid(geometry)
-                    
-                    if centroid:
-                        zone_coords.append({
-                            "zone_id": zone_id,
-                            "latitude": round(centroid["lat"], 4),
-                            "longitude": round(centroid["lon"], 4),
-                            "name": data.get("properties", {}).get("name", zone_id),
-                            "type": zone_type
-                        })
-                        logger.info(f"Got coordinates for {zone_type} zone {zone_id}: ({centroid['lat']}, {centroid['lon']})")
-                    else:
-                        logger.warning(f"No geometry found for zone {zone_id}")
-                else:
-                    logger.warning(f"Failed to get coordinates for zone {zone_id} from all endpoints")
+                centroid = extract_geometry_centroid(data.get("geometry"))
+                if not centroid:
+                    logger.warning("No geometry found for zone %s", zone_id)
+                    return None
+                
+                logger.info("Got coordinates for %s zone %s: (%s, %s)", zone_type, zone_id, centroid['lat'], centroid['lon'])
+                coordinates = {
+                    "zone_id": zone_id,
+                    "latitude": round(centroid["lat"], 4),
+                    "longitude": round(centroid["lon"], 4),
+                    "name": data.get("properties", {}).get("name", zone_id),
+                    "type": zone_type
+                }
+                _cache_zone_coordinates(zone_id, coordinates, response.headers.get("ETag"))
+                return coordinates
                     
             except Exception as e:
                 logger.error(f"Error getting coordinates for zone {zone_id}: {str(e)}")
-                continue
+                return None
+        
+        # Fetch all zones concurrently and keep the ones that succeed
+        client = get_nws_async_client()
+        results = await asyncio.gather(*(fetch_zone(client, zone_id) for zone_id in zone_ids))
+        zone_coords = [coords for coords in results if coords]
         
         if not zone_coords:
             return {
@@ -1610,6 +2619,63 @@ def get_zone_coordinates(
         }
 
 
+@track_tool_call("geocode_and_map")
+async def geocode_and_map(
+    tool_context: ToolContext,
+    zones: list[str]
+) -> Dict[str, Any]:
+    """Geocode NWS zones and generate a map of them in a single step.
+    
+    Accepts zone IDs (e.g., FLZ127, FLC069) or full NWS zone URLs. All zones are
+    fetched concurrently and the map is fitted to the zones that were found.
+    
+    Args:
+        zones (list[str]): NWS zone IDs or zone URLs
+        
+    Returns:
+        dict: generate_map result (center, zoom, markers, map_url) with status
+    """
+    try:
+        zone_urls = [zone for zone in zones if zone.startswith("https://")]
+        zone_ids = [zone for zone in zones if not zone.startswith("https://")]
+        
+        lookups = []
+        if zone_urls:
+            lookups.append(get_coordinates_from_urls(tool_context, zone_urls))
+        if zone_ids:
+            lookups.append(get_zone_coordinates(tool_context, zone_ids))
+        results = await asyncio.gather(*lookups)
+        
+        markers = []
+        for result in results:
+            coordinates = result.get("coordinates") or result.get("data", {}).get("coordinates", [])
+            for coords in coordinates:
+                if coords.get("latitude") is None or coords.get("longitude") is None:
+                    continue
+                markers.append({
+                    "lat": coords["latitude"],
+                    "lng": coords["longitude"],
+                    "title": coords.get("name") or coords.get("zone_id") or coords.get("zone_url", "Zone")
+                })
+        
+        if not markers:
+            return {
+                "status": "error",
+                "message": "Could not get coordinates for any zones"
+            }
+        
+        map_result = generate_map(tool_context, markers=markers, title="Alert Zones")
+        map_result["summary"] = f"Mapped {len(markers)} out of {len(zones)} zones"
+        return map_result
+    
+    except Exception as e:
+        logger.error(f"Error in geocode_and_map: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to map zones: {str(e)}"
+        }
+
+
 @track_tool_call("calculate_evacuation_priority")
 def calculate_evacuation_priority(
     tool_context: ToolContext,
@@ -1636,37 +2702,45 @@ def calculate_evacuation_priority(
                 "message": "No flood risk data available. Call get_flood_risk_data first."
             }
 
-        # Use a dictionary to track unique locations by coordinates
-        unique_locations = {}
-        
+        hurricane_score = (hurricane_intensity / 5.0) * 0.4  # 40% weight
+        # Precipitation below which an event cannot score above 5 at this intensity
+        # (the score is checked exactly below; this only skips hopeless events early)
+        min_precipitation = (0.5 - hurricane_score) / 0.06 - 1e-9
+        
+        # Risk rises with precipitation, so each location's score comes from its wettest
+        # event: find that per coordinate first, then score each location once
+        wettest_events = {}
         for event in flood_events:
+            precipitation = event.get("precipitation_inches", 0)
+            if precipitation <= min_precipitation:
+                continue
+            coord_key = (event.get("latitude"), event.get("longitude"))
+            kept = wettest_events.get(coord_key)
+            if kept is None or precipitation > kept.get("precipitation_inches", 0):
+                wettest_events[coord_key] = event
+        
+        prioritized_locations = []
+        for (lat, lng), event in wettest_events.items():
             # Risk score is based on historical precipitation and current hurricane intensity
             flood_score = (event.get("precipitation_inches", 0) / 10.0) * 0.6  # 60% weight
-            hurricane_score = (hurricane_intensity / 5.0) * 0.4  # 40% weight
             total_risk_score = (flood_score + hurricane_score) * 10  # Scale to 0-10
-
+            
             if total_risk_score > 5:
-                lat = event.get("latitude")
-                lng = event.get("longitude")
-                coord_key = f"{lat},{lng}"
-                
-                # Only keep the highest risk score for each unique coordinate
-                if coord_key not in unique_locations or unique_locations[coord_key]["risk_score"] < total_risk_score:
-                    unique_locations[coord_key] = {
-                        "latitude": lat,
-                        "longitude": lng,
-                        "risk_score": round(total_risk_score, 2),
-                        "details": {
-                            "state": event.get("state"),
-                            "station_name": event.get("station_name"),
-                            "historical_precipitation_inches": event.get("precipitation_inches"),
-                            "last_event_date": event.get("date")
-                        }
+                prioritized_locations.append({
+                    "latitude": lat,
+                    "longitude": lng,
+                    "risk_score": round(total_risk_score, 2),
+                    "details": {
+                        "state": event.get("state"),
+                        "station_name": event.get("station_name"),
+                        "historical_precipitation_inches": event.get("precipitation_inches"),
+                        "last_event_date": event.get("date")
                     }
+                })
         
-        # Convert to list and sort by risk score (highest first)
-        prioritized_locations = list(unique_locations.values())
-        prioritized_locations.sort(key=lambda x: x["risk_score"], reverse=True)
+        # Sort by risk score (highest first). The whole ranking is kept in state, so
+        # this is a full sort rather than a top-20 selection
+        prioritized_locations.sort(key=itemgetter("risk_score"), reverse=True)
 
         # Save to state
         tool_context.state["evacuation_priority"] = {
@@ -1675,18 +2749,17 @@ def calculate_evacuation_priority(
             "timestamp": datetime.now().isoformat()
         }
 
+        top_locations = prioritized_locations[:20]
+        
         # Get state distribution for logging
-        state_counts = {}
-        for loc in prioritized_locations[:20]:
-            state = loc.get("details", {}).get("state", "Unknown")
-            state_counts[state] = state_counts.get(state, 0) + 1
+        state_counts = dict(Counter(loc["details"].get("state", "Unknown") for loc in top_locations))
         
-        logger.info(f"Calculated evacuation priority for {len(prioritized_locations)} unique high-risk locations. Top 20 distribution: {state_counts}")
+        logger.info("Calculated evacuation priority for %s unique high-risk locations. Top 20 distribution: %s", len(prioritized_locations), state_counts)
 
         return {
             "status": "success",
             "data": {
-                "prioritized_locations": prioritized_locations[:20],  # Return top 20
+                "prioritized_locations": top_locations,  # Return top 20
                 "total_unique_locations": len(prioritized_locations),
                 "state_distribution": state_counts,
                 "summary": f"Identified {len(prioritized_locations)} unique high-risk locations across multiple states based on flood data."
@@ -7,6 +7,18 @@ import { useDemoMode } from '../contexts/DemoModeContext';
 import { useTour } from '../contexts/TourContext';
 import { mockChatHistory } from '../data/mockData';
 
+const markdownComponents = {
+  h1: ({node, children, ...props}) => <h1 className="text-lg font-bold mb-2" {...props}>{children}</h1>,
+  h2: ({node, children, ...props}) => <h2 className="text-md font-semibold mb-2 mt-3" {...props}>{children}</h2>,
+  h3: ({node, children, ...props}) => <h3 className="text-sm font-semibold mb-1 mt-2" {...props}>{children}</h3>,
+  p: ({node, ...props}) => <p className="mb-2 leading-relaxed" {...props} />,
+  ul: ({node, ...props}) => <ul className="list-disc list-inside space-y-1 mb-2 ml-2" {...props} />,
+  li: ({node, ...props}) => <li {...props} />,
+  strong: ({node, ...props}) => <strong className="font-semibold" {...props} />,
+  hr: ({node, ...props}) => <hr className="my-3 border-gray-300" {...props} />,
+  a: ({node, children, ...props}) => <a className="text-primary hover:underline" target="_blank" rel="noopener noreferrer" {...props}>{children}</a>,
+};
+
 const Chat = () => {
   const { isDemoMode } = useDemoMode();
   const { isTourActive, currentStep, tourSteps } = useTour();
@@ -39,6 +51,7 @@ const Chat = () => {
   });
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [streamingContent, setStreamingContent] = useState('');
   const [selectedImage, setSelectedImage] = useState(null);
   const [imagePreview, setImagePreview] = useState(null);
   const [suggestedActions, setSuggestedActions] = useState([
@@ -220,7 +233,7 @@ const Chat = () => {
       // Use appropriate API method based on whether there's an image
       const response = currentImage 
         ? await api.queryWithImage(currentInput || 'Analyze this hurricane path image and perform risk assessment', currentImage)
-        : await api.query(currentInput);
+        : await api.query(currentInput, setStreamingContent);
       
       // Extract map URL and coordinates from response
       let mapUrl = null;
@@ -300,6 +313,7 @@ const Chat = () => {
       setMessages(prev => [...prev, errorMessage]);
     } finally {
       setLoading(false);
+      setStreamingContent('');
     }
   };
 
@@ -548,19 +562,7 @@ const Chat = () => {
                       <p className="whitespace-pre-wrap">{message.content}</p>
                     </div>
                   ) : (
-                    <ReactMarkdown
-                      components={{
-                        h1: ({node, children, ...props}) => <h1 className="text-lg font-bold mb-2" {...props}>{children}</h1>,
-                        h2: ({node, children, ...props}) => <h2 className="text-md font-semibold mb-2 mt-3" {...props}>{children}</h2>,
-                        h3: ({node, children, ...props}) => <h3 className="text-sm font-semibold mb-1 mt-2" {...props}>{children}</h3>,
-                        p: ({node, ...props}) => <p className="mb-2 leading-relaxed" {...props} />,
-                        ul: ({node, ...props}) => <ul className="list-disc list-inside space-y-1 mb-2 ml-2" {...props} />,
-                        li: ({node, ...props}) => <li {...props} />,
-                        strong: ({node, ...props}) => <strong className="font-semibold" {...props} />,
-                        hr: ({node, ...props}) => <hr className="my-3 border-gray-300" {...props} />,
-                        a: ({node, children, ...props}) => <a className="text-primary hover:underline" target="_blank" rel="noopener noreferrer" {...props}>{children}</a>,
-                      }}
-                    >
+                    <ReactMarkdown components={markdownComponents}>
                       {message.content}
                     </ReactMarkdown>
                   )}
@@ -614,12 +616,16 @@ const Chat = () => {
                   <CloudIcon className="h-5 w-5 text-gray-700" />
                 </div>
               </div>
-              <div className="bg-white rounded-lg px-4 py-3 shadow-sm border border-gray-200">
-                <div className="flex space-x-2">
-                  <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '0ms' }}></div>
-                  <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '150ms' }}></div>
-                  <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '300ms' }}></div>
-                </div>
+              <div className="bg-white rounded-lg px-4 py-3 shadow-sm border border-gray-200 text-gray-800">
+                {streamingContent ? (
+                  <ReactMarkdown components={markdownComponents}>{streamingContent}</ReactMarkdown>
+                ) : (
+                  <div className="flex space-x-2">
+                    <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '0ms' }}></div>
+                    <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '150ms' }}></div>
+                    <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: '300ms' }}></div>
+                  </div>
+                )}
               </div>
             </div>
           </div>
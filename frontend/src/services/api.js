@@ -159,15 +159,73 @@ class WeatherAgentAPI {
     localStorage.setItem(SESSION_TIMESTAMP_KEY, Date.now().toString());
   }
 
-  async query(userQuery) {
+  // Run an agent through the ADK /run_sse endpoint with token streaming enabled.
+  // onPartial receives the text streamed so far; resolves to the final (non-partial)
+  // events, i.e. the same array /run returns.
+  async runSse(clientName, body, onPartial) {
+    const response = await fetch(`${this.clients[clientName].defaults.baseURL}/run_sse`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+      body: JSON.stringify({ ...body, streaming: true }),
+    });
+    if (!response.ok) {
+      const error = new Error(`Request failed with status code ${response.status}`);
+      error.response = { status: response.status, data: await response.json().catch(() => ({})) };
+      throw error;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const events = [];
+    let buffer = '';
+    let finalText = '';
+    let partialText = '';
+
+    const handleEvent = (event) => {
+      const text = (event.content?.parts || []).map(part => part.text || '').join('');
+      if (event.partial) {
+        partialText += text;
+      } else {
+        events.push(event);
+        finalText += text;
+        partialText = '';
+      }
+      if (text) {
+        onPartial(finalText + partialText);
+      }
+    };
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const messages = buffer.split('\n\n');
+      buffer = messages.pop();
+      for (const message of messages) {
+        const data = message
+          .split('\n')
+          .filter(line => line.startsWith('data:'))
+          .map(line => line.slice(5).trim())
+          .join('');
+        if (!data) continue;
+        const event = JSON.parse(data);
+        if (event.error) {
+          throw new Error(event.error);
+        }
+        handleEvent(event);
+      }
+    }
+    return events;
+  }
+
+  async query(userQuery, onPartial = null) {
     try {
       console.log('[API] Sending query to chat orchestrator:', userQuery);
       
       // Get or create session
       const currentSessionId = await this.getOrCreateSession();
       
-      // Use chat orchestrator
-      const response = await this.clients.chat.post('/run', {
+      const request = {
         app_name: 'chat',
         user_id: 'user_001',
         session_id: currentSessionId,
@@ -175,15 +233,22 @@ class WeatherAgentAPI {
           role: 'user',
           parts: [{ text: userQuery }],
         },
-        streaming: false,
-      });
+      };
 
-      console.log('[API] Response status:', response.status);
-      console.log('[API] Response data:', response.data);
+      // Use chat orchestrator, streaming the answer when the caller can render partial text
+      let data;
+      if (onPartial) {
+        data = await this.runSse('chat', request, onPartial);
+        console.log('[API] Streamed', data.length, 'events');
+      } else {
+        const response = await this.clients.chat.post('/run', { ...request, streaming: false });
+        console.log('[API] Response status:', response.status);
+        console.log('[API] Response data:', response.data);
+        data = response.data;
+      }
 
       // ADK returns array of events - extract text from response
       let responseText = '';
-      const data = response.data;
 
       if (Array.isArray(data)) {
         console.log('[API] Processing array of', data.length, 'events');
@@ -5,7 +5,7 @@ Test script for get_nws_alerts function with severity and expiration filtering
 
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 import json
 
@@ -13,11 +13,12 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agents', 'shared_tools'))
 
 # Import the function
-from tools import get_nws_alerts
+from tools import get_nws_alerts, _nws_alerts_cache
 
-def create_mock_alert(event_type, severity, expires_offset_hours=24):
+def create_mock_alert(event_type, severity, expires_offset_hours=24, now=None):
     """Create a mock alert with specified properties"""
-    expires_time = datetime.now() + timedelta(hours=expires_offset_hours)
+    now = now or datetime.now(timezone.utc)
+    expires_time = now + timedelta(hours=expires_offset_hours)
     return {
         "properties": {
             "event": event_type,
@@ -27,13 +28,23 @@ def create_mock_alert(event_type, severity, expires_offset_hours=24):
             "headline": f"{event_type} in effect",
             "description": f"Test {event_type} description",
             "instruction": "Take shelter immediately",
-            "onset": datetime.now().isoformat(),
+            "onset": now.isoformat(),
             "expires": expires_time.isoformat(),
             "affectedZones": ["CAZ001"],
             "senderName": "NWS Test"
         }
     }
 
+def create_mock_alerts(specs):
+    """Create mock alerts from (event_type, severity, expires_offset_hours) tuples"""
+    now = datetime.now(timezone.utc)
+    return [create_mock_alert(*spec, now=now) for spec in specs]
+
+def parse_expires(alert):
+    """Parse an alert's expiration time, or None if it has none"""
+    expires = alert.get('expires')
+    return datetime.fromisoformat(expires.replace('Z', '+00:00')) if expires else None
+
 def test_severity_filtering():
     """Test that only Extreme and Severe alerts are returned"""
     print("\n" + "="*80)
@@ -41,22 +52,23 @@ def test_severity_filtering():
     print("="*80)
     
     mock_response_data = {
-        "features": [
-            create_mock_alert("Hurricane Warning", "Extreme", 48),
-            create_mock_alert("Tornado Warning", "Severe", 24),
-            create_mock_alert("Flood Watch", "Moderate", 36),
-            create_mock_alert("Wind Advisory", "Minor", 12),
-        ]
+        "features": create_mock_alerts([
+            ("Hurricane Warning", "Extreme", 48),
+            ("Tornado Warning", "Severe", 24),
+            ("Flood Watch", "Moderate", 36),
+            ("Wind Advisory", "Minor", 12),
+        ])
     }
     
     mock_response = Mock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status = Mock()
     
-    with patch('tools.requests.get', return_value=mock_response):
+    with patch('tools.nws_session.get', return_value=mock_response):
         mock_context = Mock()
         mock_context.state = {}
         
+        _nws_alerts_cache.clear()
         result = get_nws_alerts(mock_context)
         
         print(f"Total alerts from API: 4")
@@ -67,10 +79,9 @@ def test_severity_filtering():
         print(f"Severities in result: {severities}")
         
         assert len(result['alerts']) == 2, f"Expected 2 alerts, got {len(result['alerts'])}"
-        assert all(s in ['Extreme', 'Severe'] for s in severities), "Found non-critical severity"
+        assert set(severities) <= {'Extreme', 'Severe'}, "Found non-critical severity"
         
         print("✅ PASSED: Only Extreme and Severe alerts returned")
-        return True
 
 def test_expiration_filtering():
     """Test that expired alerts are filtered out"""
@@ -79,39 +90,39 @@ def test_expiration_filtering():
     print("="*80)
     
     mock_response_data = {
-        "features": [
-            create_mock_alert("Hurricane Warning", "Extreme", 48),    # Valid: expires in 48 hours
-            create_mock_alert("Tornado Warning", "Severe", 24),       # Valid: expires in 24 hours
-            create_mock_alert("Severe Thunderstorm", "Severe", -2),   # Expired: 2 hours ago
-            create_mock_alert("Flash Flood Warning", "Extreme", -5),  # Expired: 5 hours ago
-        ]
+        "features": create_mock_alerts([
+            ("Hurricane Warning", "Extreme", 48),    # Valid: expires in 48 hours
+            ("Tornado Warning", "Severe", 24),       # Valid: expires in 24 hours
+            ("Severe Thunderstorm", "Severe", -2),   # Expired: 2 hours ago
+            ("Flash Flood Warning", "Extreme", -5),  # Expired: 5 hours ago
+        ])
     }
     
     mock_response = Mock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status = Mock()
     
-    with patch('tools.requests.get', return_value=mock_response):
+    with patch('tools.nws_session.get', return_value=mock_response):
         mock_context = Mock()
         mock_context.state = {}
         
+        _nws_alerts_cache.clear()
         result = get_nws_alerts(mock_context)
         
         print(f"Total Extreme/Severe alerts: 4")
         print(f"Alerts after expiration filter: {len(result['alerts'])}")
         print(f"Expected: 2 (non-expired only)")
         
+        now = datetime.now(timezone.utc)
         for alert in result['alerts']:
-            expires = alert.get('expires')
-            if expires:
-                expire_time = datetime.fromisoformat(expires.replace('Z', '+00:00'))
-                hours_until_expiry = (expire_time - datetime.now()).total_seconds() / 3600
+            expire_time = parse_expires(alert)
+            if expire_time:
+                hours_until_expiry = (expire_time - now).total_seconds() / 3600
                 print(f"  - {alert['event']}: expires in {hours_until_expiry:.1f} hours")
         
         assert len(result['alerts']) == 2, f"Expected 2 non-expired alerts, got {len(result['alerts'])}"
         
         print("✅ PASSED: Expired alerts filtered out correctly")
-        return True
 
 def test_combined_filtering():
     """Test both severity and expiration filtering together"""
@@ -120,25 +131,26 @@ def test_combined_filtering():
     print("="*80)
     
     mock_response_data = {
-        "features": [
-            create_mock_alert("Hurricane Warning", "Extreme", 48),      # ✓ Valid
-            create_mock_alert("Tornado Warning", "Severe", 24),         # ✓ Valid
-            create_mock_alert("Flood Watch", "Moderate", 36),           # ✗ Wrong severity
-            create_mock_alert("Wind Advisory", "Minor", 12),            # ✗ Wrong severity
-            create_mock_alert("Severe Thunderstorm", "Severe", -2),     # ✗ Expired
-            create_mock_alert("Flash Flood Warning", "Extreme", -5),    # ✗ Expired
-            create_mock_alert("Blizzard Warning", "Extreme", 72),       # ✓ Valid
-        ]
+        "features": create_mock_alerts([
+            ("Hurricane Warning", "Extreme", 48),      # ✓ Valid
+            ("Tornado Warning", "Severe", 24),         # ✓ Valid
+            ("Flood Watch", "Moderate", 36),           # ✗ Wrong severity
+            ("Wind Advisory", "Minor", 12),            # ✗ Wrong severity
+            ("Severe Thunderstorm", "Severe", -2),     # ✗ Expired
+            ("Flash Flood Warning", "Extreme", -5),    # ✗ Expired
+            ("Blizzard Warning", "Extreme", 72),       # ✓ Valid
+        ])
     }
     
     mock_response = Mock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status = Mock()
     
-    with patch('tools.requests.get', return_value=mock_response):
+    with patch('tools.nws_session.get', return_value=mock_response):
         mock_context = Mock()
         mock_context.state = {}
         
+        _nws_alerts_cache.clear()
         result = get_nws_alerts(mock_context)
         
         print(f"Total alerts from API: 7")
@@ -146,27 +158,25 @@ def test_combined_filtering():
         print(f"After expiration filter: {len(result['alerts'])}")
         print(f"Expected: 3 (Extreme/Severe AND non-expired)")
         
+        now = datetime.now(timezone.utc)
+        expire_times = [parse_expires(alert) for alert in result['alerts']]
+        
         print("\nFinal alerts:")
-        for alert in result['alerts']:
-            expires = alert.get('expires')
-            expire_time = datetime.fromisoformat(expires.replace('Z', '+00:00'))
-            hours_until_expiry = (expire_time - datetime.now()).total_seconds() / 3600
+        for alert, expire_time in zip(result['alerts'], expire_times):
+            hours_until_expiry = (expire_time - now).total_seconds() / 3600
             print(f"  - {alert['event']} ({alert['severity']}): expires in {hours_until_expiry:.1f} hours")
         
         assert len(result['alerts']) == 3, f"Expected 3 valid alerts, got {len(result['alerts'])}"
         
         # Verify all are Extreme or Severe
         severities = [alert['severity'] for alert in result['alerts']]
-        assert all(s in ['Extreme', 'Severe'] for s in severities), "Found non-critical severity"
+        assert set(severities) <= {'Extreme', 'Severe'}, "Found non-critical severity"
         
         # Verify none are expired
-        for alert in result['alerts']:
-            expires = alert.get('expires')
-            expire_time = datetime.fromisoformat(expires.replace('Z', '+00:00'))
-            assert expire_time > datetime.now(), f"Found expired alert: {alert['event']}"
+        for alert, expire_time in zip(result['alerts'], expire_times):
+            assert expire_time > now, f"Found expired alert: {alert['event']}"
         
         print("✅ PASSED: Combined filtering works correctly")
-        return True
 
 def test_edge_cases():
     """Test edge cases like missing expiration times"""
@@ -184,7 +194,7 @@ def test_edge_cases():
             "headline": "Special Weather Statement",
             "description": "Test description",
             "instruction": "Monitor conditions",
-            "onset": datetime.now().isoformat(),
+            "onset": datetime.now(timezone.utc).isoformat(),
             "expires": None,  # No expiration
             "affectedZones": ["CAZ001"],
             "senderName": "NWS Test"
@@ -199,13 +209,14 @@ def test_edge_cases():
     }
     
     mock_response = Mock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status = Mock()
     
-    with patch('tools.requests.get', return_value=mock_response):
+    with patch('tools.nws_session.get', return_value=mock_response):
         mock_context = Mock()
         mock_context.state = {}
         
+        _nws_alerts_cache.clear()
         result = get_nws_alerts(mock_context)
         
         print(f"Alerts with missing expiration: {len([a for a in result['alerts'] if not a.get('expires')])}")
@@ -215,7 +226,45 @@ def test_edge_cases():
         assert len(result['alerts']) == 2, f"Expected 2 alerts, got {len(result['alerts'])}"
         
         print("✅ PASSED: Alerts without expiration times are included")
-        return True
+
+def test_deduplication():
+    """Test that duplicate alerts collapse to the most detailed copy"""
+    print("\n" + "="*80)
+    print("TEST 5: Deduplication (same event/severity/headline/onset)")
+    print("="*80)
+    
+    now = datetime.now(timezone.utc)
+    expires = (now + timedelta(hours=24)).isoformat()
+    onset = now.isoformat()
+    
+    short_copy = create_mock_alert("Flood Warning", "Severe")
+    detailed_copy = create_mock_alert("Flood Warning", "Severe")
+    detailed_copy["properties"]["description"] = "Test Flood Warning description with river stage details"
+    other_alert = create_mock_alert("Tornado Warning", "Extreme")
+    for alert in (short_copy, detailed_copy, other_alert):
+        alert["properties"]["expires"] = expires
+        alert["properties"]["onset"] = onset
+    
+    mock_response = Mock()
+    mock_response.content = json.dumps({"features": [short_copy, detailed_copy, other_alert]}).encode()
+    mock_response.raise_for_status = Mock()
+    
+    with patch('tools.nws_session.get', return_value=mock_response):
+        mock_context = Mock()
+        mock_context.state = {}
+        
+        _nws_alerts_cache.clear()
+        result = get_nws_alerts(mock_context)
+        
+        print(f"Total alerts from API: 3")
+        print(f"Alerts after deduplication: {len(result['alerts'])}")
+        print(f"Expected: 2 (the two Flood Warnings collapse to one)")
+        
+        assert len(result['alerts']) == 2, f"Expected 2 alerts, got {len(result['alerts'])}"
+        flood = next(a for a in result['alerts'] if a['event'] == "Flood Warning")
+        assert "river stage" in flood['description'], "Kept the less detailed duplicate"
+        
+        print("✅ PASSED: Duplicates collapsed to the most detailed alert")
 
 def run_all_tests():
     """Run all tests"""
@@ -229,6 +278,7 @@ def run_all_tests():
         ("Expiration Filtering", test_expiration_filtering),
         ("Combined Filtering", test_combined_filtering),
         ("Edge Cases", test_edge_cases),
+        ("Deduplication", test_deduplication),
     ]
     
     passed = 0
@@ -236,8 +286,8 @@ def run_all_tests():
     
     for test_name, test_func in tests:
         try:
-            if test_func():
-                passed += 1
+            test_func()
+            passed += 1
         except AssertionError as e:
             print(f"❌ FAILED: {test_name}")
             print(f"   Error: {str(e)}")
@@ -6,7 +6,11 @@ No mocking - tests actual API integration
 
 import sys
 import os
-from datetime import datetime
+import io
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
 # Add the agents directory to the path
@@ -44,7 +48,7 @@ def test_real_national_alerts():
         print(f"Severities found: {severity_set}")
         
         if severity_set:
-            all_critical = all(s in ['Extreme', 'Severe'] for s in severities)
+            all_critical = set(severities) <= {'Extreme', 'Severe'}
             if all_critical:
                 print("✅ Severity Filter: PASSED - Only Extreme/Severe alerts")
             else:
@@ -58,15 +62,18 @@ def test_real_national_alerts():
         print("EXPIRATION CHECK:")
         print(f"{'='*80}")
         
-        current_time = datetime.now()
+        current_time = datetime.now(timezone.utc)
         expired_count = 0
         valid_count = 0
         
+        # Parse each expiration once; the sample listing below reuses these
+        expire_times = {}
         for i, alert in enumerate(alerts[:10], 1):  # Check first 10
             expires = alert.get('expires')
             if expires:
                 try:
                     expire_time = datetime.fromisoformat(expires.replace('Z', '+00:00'))
+                    expire_times[i] = expire_time
                     hours_until_expiry = (expire_time - current_time).total_seconds() / 3600
                     
                     if expire_time > current_time:
@@ -102,12 +109,10 @@ def test_real_national_alerts():
                 print(f"   Severity: {alert['severity']}")
                 print(f"   Headline: {alert.get('headline', 'N/A')[:80]}")
                 expires = alert.get('expires')
-                if expires:
-                    try:
-                        expire_time = datetime.fromisoformat(expires.replace('Z', '+00:00'))
-                        print(f"   Expires: {expire_time.strftime('%Y-%m-%d %H:%M %Z')}")
-                    except:
-                        print(f"   Expires: {expires}")
+                if i in expire_times:
+                    print(f"   Expires: {expire_times[i].strftime('%Y-%m-%d %H:%M %Z')}")
+                elif expires:
+                    print(f"   Expires: {expires}")
         
         return True
     else:
@@ -176,6 +181,32 @@ def test_real_point_alerts():
         print(f"❌ API call failed: {result.get('message', 'Unknown error')}")
         return False
 
+class ThreadLocalStdout:
+    """Send print output from worker threads to per-thread buffers"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def run_buffered(stdout, test_func):
+    """Run a test with its output buffered; returns (output, passed, error traceback)"""
+    buffer = stdout.capture()
+    try:
+        test_passed, error = test_func(), None
+    except Exception:
+        test_passed, error = False, traceback.format_exc()
+    return buffer.getvalue(), test_passed, error
+
 def run_real_api_tests():
     """Run all real API tests"""
     print("\n" + "="*80)
@@ -192,19 +223,29 @@ def run_real_api_tests():
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-                print(f"\n✅ {test_name}: PASSED")
-            else:
-                failed += 1
-                print(f"\n❌ {test_name}: FAILED")
-        except Exception as e:
-            print(f"\n❌ ERROR in {test_name}: {str(e)}")
-            import traceback
-            traceback.print_exc()
+    # Each test waits on its own NWS request, so run them concurrently and
+    # replay their buffered output in order afterwards
+    real_stdout = sys.stdout
+    stdout = ThreadLocalStdout(real_stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(lambda test: run_buffered(stdout, test[1]), tests))
+    finally:
+        sys.stdout = real_stdout
+    
+    for (test_name, _), (output, test_passed, error) in zip(tests, results):
+        print(output, end="")
+        if error:
+            print(f"\n❌ ERROR in {test_name}: {error.strip().splitlines()[-1]}")
+            print(error, end="")
+            failed += 1
+        elif test_passed:
+            passed += 1
+            print(f"\n✅ {test_name}: PASSED")
+        else:
             failed += 1
+            print(f"\n❌ {test_name}: FAILED")
     
     print("\n" + "="*80)
     print("REAL API TEST SUMMARY")